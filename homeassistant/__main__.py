@@ -101,6 +101,16 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--timer-wheel",
+        action="store_true",
+        help="Schedule the timers of the time helpers on a timer wheel",
+    )
+    parser.add_argument(
+        "--polling-scheduler",
+        action="store_true",
+        help="Spread the polls of polling entities over their scan interval",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -196,6 +206,8 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        timer_wheel=args.timer_wheel,
+        polling_scheduler=args.polling_scheduler,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
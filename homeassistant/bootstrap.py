@@ -36,6 +36,8 @@ from .helpers import (
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.polling import async_setup_polling_scheduler
+from .helpers.timer_wheel import async_setup_timer_wheel
 from .helpers.typing import ConfigType
 from .setup import (
     DATA_SETUP,
@@ -112,6 +114,11 @@ async def async_setup_hass(
     """Set up Home Assistant."""
     hass = core.HomeAssistant(runtime_config.config_dir)
 
+    if runtime_config.timer_wheel:
+        async_setup_timer_wheel(hass)
+    if runtime_config.polling_scheduler:
+        async_setup_polling_scheduler(hass)
+
     async_enable_logging(
         hass,
         runtime_config.verbose,
@@ -20,7 +20,8 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import DOMAIN
+from .cache import async_setup_history_cache
+from .const import CONF_CACHE_WINDOW, DOMAIN
 from .helpers import entities_may_have_state_changes_after
 
 CONF_ORDER = "use_include_order"
@@ -34,7 +35,12 @@ CONFIG_SCHEMA = vol.Schema(
             cv.deprecated(CONF_EXCLUDE),
             cv.deprecated(CONF_ORDER),
             INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
-                {vol.Optional(CONF_ORDER, default=False): cv.boolean}
+                {
+                    vol.Optional(CONF_ORDER, default=False): cv.boolean,
+                    vol.Optional(CONF_CACHE_WINDOW): vol.All(
+                        cv.time_period, cv.positive_timedelta
+                    ),
+                }
             ),
         )
     },
@@ -47,6 +53,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(HistoryPeriodView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
+    if (conf := config.get(DOMAIN)) and (window := conf.get(CONF_CACHE_WINDOW)):
+        async_setup_history_cache(hass, window)
     return True
 
 
@@ -116,7 +124,7 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_executor_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -0,0 +1,406 @@
+"""In-memory cache of recent history for the history integration.
+
+Dashboards keep asking for the same recent window of history. Instead of
+querying the database every time, the cache keeps the states of the last
+``cache_window`` in memory, fed live from state changed events, and answers
+``history/history_during_period`` with the same compressed states the
+database query would return.
+
+States the recorder does not write, because it is disabled or stopped
+recording, are not cached either. The cache is emptied when that happens so
+it never answers with states the database does not have.
+
+The states of each entity are kept in columns: arrays of timestamps and of
+indexes into the distinct state values of the entity, next to references to
+the attributes of each state. Attributes are shared between states as long
+as they do not change, so they cost a pointer per state.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping
+from datetime import datetime as dt, timedelta
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import ALL_DOMAIN_EXCLUDE_ATTRS
+from homeassistant.components.recorder.history import (
+    NEED_ATTRIBUTE_DOMAINS,
+    SIGNIFICANT_DOMAINS,
+)
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import EventStateChangedData, async_track_time_interval
+from homeassistant.helpers.typing import EventType
+import homeassistant.util.dt as dt_util
+
+DATA_HISTORY_CACHE = "history_cache"
+
+TRIM_INTERVAL = timedelta(minutes=5)
+
+_EMPTY_ATTRIBUTES: Mapping[str, Any] = {}
+
+
+class _EntityHistory:
+    """The recent states of an entity, kept in columns."""
+
+    __slots__ = (
+        "domain",
+        "last_updated",
+        "last_changed",
+        "states",
+        "attributes",
+        "exclude_attributes",
+        "_values",
+        "_value_index",
+    )
+
+    def __init__(self, domain: str) -> None:
+        """Initialize the columns."""
+        self.domain = domain
+        self.last_updated = array("d")
+        self.last_changed = array("d")
+        self.states = array("I")
+        self.attributes: list[Mapping[str, Any]] = []
+        self.exclude_attributes: set[str] | frozenset[str] = ALL_DOMAIN_EXCLUDE_ATTRS
+        self._values: list[str | None] = []
+        self._value_index: dict[str | None, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of states kept."""
+        return len(self.last_updated)
+
+    def append(self, state: State) -> None:
+        """Add a new state."""
+        if (state_info := state.state_info) and (
+            unrecorded := state_info["unrecorded_attributes"]
+        ):
+            self.exclude_attributes = ALL_DOMAIN_EXCLUDE_ATTRS | unrecorded
+        self._append(
+            state.state,
+            state.attributes,
+            dt_util.utc_to_timestamp(state.last_updated),
+            dt_util.utc_to_timestamp(state.last_changed),
+        )
+
+    def append_removed(self, time_fired: dt) -> None:
+        """Add the state without a value the recorder writes for removals."""
+        timestamp = dt_util.utc_to_timestamp(time_fired)
+        self._append(None, _EMPTY_ATTRIBUTES, timestamp, timestamp)
+
+    def _append(
+        self,
+        state: str | None,
+        attributes: Mapping[str, Any],
+        last_updated_ts: float,
+        last_changed_ts: float,
+    ) -> None:
+        """Add a state to the columns."""
+        if (index := self._value_index.get(state)) is None:
+            index = self._value_index[state] = len(self._values)
+            self._values.append(state)
+        self.last_updated.append(last_updated_ts)
+        self.last_changed.append(last_changed_ts)
+        self.states.append(index)
+        self.attributes.append(attributes)
+
+    def trim(self, cutoff_ts: float) -> None:
+        """Drop the states that are no longer needed to answer from cutoff_ts.
+
+        The last state before the cutoff is kept as it is the state at the
+        start of a query that starts after the cutoff.
+        """
+        if (drop := bisect_left(self.last_updated, cutoff_ts) - 1) <= 0:
+            return
+        del self.last_updated[:drop]
+        del self.last_changed[:drop]
+        del self.states[:drop]
+        del self.attributes[:drop]
+        if len(self._values) > 2 * len(self.states):
+            values = self._values
+            self._values = []
+            self._value_index = {}
+            for idx, value_idx in enumerate(self.states):
+                state = values[value_idx]
+                if (index := self._value_index.get(state)) is None:
+                    index = self._value_index[state] = len(self._values)
+                    self._values.append(state)
+                self.states[idx] = index
+
+    def significant_states(
+        self,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> list[dict[str, Any]]:
+        """Return the compressed states the recorder would return."""
+        last_updated = self.last_updated
+        last_changed = self.last_changed
+        states = self.states
+        values = self._values
+        start = bisect_right(last_updated, start_time_ts)
+        end = (
+            bisect_left(last_updated, end_time_ts, start)
+            if end_time_ts
+            else len(last_updated)
+        )
+        indexes: Iterable[int] = range(start, end)
+        if significant_changes_only and self.domain not in SIGNIFICANT_DOMAINS:
+            indexes = [idx for idx in indexes if last_changed[idx] == last_updated[idx]]
+        # The recorder only looks at states before the start time, a state
+        # updated exactly at the start time is not part of the result.
+        start_idx: int | None = None
+        if include_start_time_state and (
+            before := bisect_left(last_updated, start_time_ts)
+        ):
+            start_idx = before - 1
+
+        filtered_attributes: dict[int, Mapping[str, Any]] = {}
+
+        def _attributes(idx: int) -> Mapping[str, Any]:
+            """Return the attributes of a state without the unrecorded ones."""
+            attributes = self.attributes[idx]
+            if (filtered := filtered_attributes.get(id(attributes))) is None:
+                exclude = self.exclude_attributes
+                filtered = filtered_attributes[id(attributes)] = (
+                    {k: v for k, v in attributes.items() if k not in exclude}
+                    if not exclude.isdisjoint(attributes)
+                    else attributes
+                )
+            return filtered
+
+        def _full_state(
+            idx: int, is_start: bool, with_attributes: bool
+        ) -> dict[str, Any]:
+            """Return a compressed state with attributes and timestamps."""
+            comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: values[states[idx]]}
+            if with_attributes:
+                comp_state[COMPRESSED_STATE_ATTRIBUTES] = (
+                    _EMPTY_ATTRIBUTES if no_attributes else _attributes(idx)
+                )
+            if is_start:
+                comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time_ts
+                return comp_state
+            comp_state[COMPRESSED_STATE_LAST_UPDATED] = last_updated[idx]
+            if not significant_changes_only and last_changed[idx] != last_updated[idx]:
+                comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed[idx]
+            return comp_state
+
+        result: list[dict[str, Any]] = []
+        if not minimal_response or self.domain in NEED_ATTRIBUTE_DOMAINS:
+            if start_idx is not None:
+                result.append(_full_state(start_idx, True, True))
+            result.extend(_full_state(idx, False, True) for idx in indexes)
+            return result
+
+        # With minimal response only the first state is a full state, the
+        # states after it only carry the state when it changed.
+        iter_indexes = iter(indexes)
+        if start_idx is not None:
+            result.append(_full_state(start_idx, True, not no_attributes))
+        elif (first_idx := next(iter_indexes, None)) is not None:
+            result.append(_full_state(first_idx, False, not no_attributes))
+        else:
+            return result
+        prev_state = result[0][COMPRESSED_STATE_STATE]
+        for idx in iter_indexes:
+            if (state := values[states[idx]]) != prev_state:
+                result.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated[idx],
+                    }
+                )
+                prev_state = state
+        return result
+
+
+class HistoryCache:
+    """Keep the recent history of the recorded entities in memory."""
+
+    def __init__(self, hass: HomeAssistant, window: timedelta) -> None:
+        """Initialize the history cache."""
+        self.hass = hass
+        self.window = window
+        self._instance = get_instance(hass)
+        self._entity_filter = self._instance.entity_filter
+        self._recorded: dict[str, bool] = {}
+        self._entities: dict[str, _EntityHistory] = {}
+        # Entities whose history started after the recorder missed states,
+        # the state before their first cached state is only in the database
+        self._partial: set[str] = set()
+        self._missed_states = False
+        # The cache has every state change since this time
+        self._since_ts = 0.0
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    def __len__(self) -> int:
+        """Return the number of states kept."""
+        return sum(len(history) for history in self._entities.values())
+
+    @callback
+    def async_start(self) -> None:
+        """Start caching the states of the recorded entities."""
+        self._since_ts = dt_util.utc_to_timestamp(dt_util.utcnow())
+        for state in self.hass.states.async_all():
+            if (history := self._async_get_entity_history(state.entity_id)) is not None:
+                history.append(state)
+        self._unsubs.append(
+            self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_changed,  # type: ignore[arg-type]
+                run_immediately=True,
+            )
+        )
+        self._unsubs.append(
+            async_track_time_interval(
+                self.hass,
+                self._async_trim,
+                TRIM_INTERVAL,
+                name="history cache trim",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop caching and drop the cached states."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._entities.clear()
+        self._partial.clear()
+
+    @callback
+    def _async_get_entity_history(self, entity_id: str) -> _EntityHistory | None:
+        """Return the columns of an entity if the recorder records it."""
+        if (history := self._entities.get(entity_id)) is not None:
+            return history
+        if (recorded := self._recorded.get(entity_id)) is None:
+            recorded = self._recorded[entity_id] = self._entity_filter(entity_id)
+        if not recorded:
+            return None
+        history = self._entities[entity_id] = _EntityHistory(
+            entity_id.partition(".")[0]
+        )
+        if self._missed_states:
+            self._partial.add(entity_id)
+        return history
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Add a state change to the cache."""
+        if (history := self._async_get_entity_history(event.data["entity_id"])) is None:
+            return
+        if not self._instance.enabled or not self._instance.recording:
+            self._async_forget(event.time_fired)
+            return
+        if (new_state := event.data["new_state"]) is None:
+            history.append_removed(event.time_fired)
+        else:
+            history.append(new_state)
+
+    @callback
+    def _async_forget(self, time_fired: dt) -> None:
+        """Drop the cached states after the recorder missed a state change."""
+        self._since_ts = max(self._since_ts, dt_util.utc_to_timestamp(time_fired))
+        self._entities.clear()
+        self._partial.clear()
+        self._missed_states = True
+
+    @callback
+    def _async_trim(self, now: dt) -> None:
+        """Drop the states that fell out of the window."""
+        cutoff_ts = dt_util.utc_to_timestamp(now - self.window)
+        self._since_ts = max(self._since_ts, cutoff_ts)
+        for entity_id, history in list(self._entities.items()):
+            history.trim(cutoff_ts)
+            # Entities that were removed before the window are forgotten,
+            # queries for them go to the database again.
+            if (
+                len(history) == 1
+                and history.last_updated[0] < cutoff_ts
+                and self.hass.states.get(entity_id) is None
+            ):
+                del self._entities[entity_id]
+        for entity_id in list(self._partial):
+            if (
+                partial := self._entities.get(entity_id)
+            ) is None or partial.last_updated[0] <= self._since_ts:
+                self._partial.discard(entity_id)
+        # Forget if removed entities are recorded, the filter is asked
+        # again if they come back.
+        self._recorded = {
+            entity_id: recorded
+            for entity_id, recorded in self._recorded.items()
+            if entity_id in self._entities
+            or self.hass.states.get(entity_id) is not None
+        }
+
+    @callback
+    def async_get_significant_states(
+        self,
+        start_time: dt,
+        end_time: dt | None,
+        entity_ids: list[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> dict[str, list[dict[str, Any]]] | None:
+        """Return the significant states in compressed state format.
+
+        Returns None if the cache does not hold the full history of the
+        period for all entities, the database has to be queried instead.
+        """
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        entities = self._entities
+        if start_time_ts < self._since_ts or not all(
+            entity_id in entities
+            and (
+                entity_id not in self._partial
+                or entities[entity_id].last_updated[0] <= start_time_ts
+            )
+            for entity_id in entity_ids
+        ):
+            return None
+        end_time_ts = dt_util.utc_to_timestamp(end_time) if end_time else None
+        result: dict[str, list[dict[str, Any]]] = {}
+        for entity_id in entity_ids:
+            if states := entities[entity_id].significant_states(
+                start_time_ts,
+                end_time_ts,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            ):
+                result[entity_id] = states
+        return result
+
+
+@callback
+def async_get_history_cache(hass: HomeAssistant) -> HistoryCache | None:
+    """Return the history cache if it is enabled."""
+    cache: HistoryCache | None = hass.data.get(DATA_HISTORY_CACHE)
+    return cache
+
+
+@callback
+def async_setup_history_cache(hass: HomeAssistant, window: timedelta) -> HistoryCache:
+    """Start caching the recent history of the recorded entities."""
+    if (cache := async_get_history_cache(hass)) is not None:
+        return cache
+    cache = hass.data[DATA_HISTORY_CACHE] = HistoryCache(hass, window)
+    cache.async_start()
+    return cache
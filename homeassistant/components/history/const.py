@@ -1,7 +1,22 @@
 """History integration constants."""
+from typing import Literal
 
 DOMAIN = "history"
 
+CONF_CACHE_WINDOW = "cache_window"
+
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The fewest states a history stream sends per message
+MIN_CHUNK_SIZE = 100
+
+# The statistics periods that can stand in for raw states, coarsest first
+DOWNSAMPLED_PERIODS: tuple[tuple[Literal["hour", "5minute"], float], ...] = (
+    ("hour", 3600),
+    ("5minute", 300),
+)
+
+COMPRESSED_STATE_MIN = "mn"
+COMPRESSED_STATE_MAX = "mx"
@@ -6,12 +6,12 @@ from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import get_instance, history, statistics
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -38,7 +38,15 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .cache import async_get_history_cache
+from .const import (
+    COMPRESSED_STATE_MAX,
+    COMPRESSED_STATE_MIN,
+    DOWNSAMPLED_PERIODS,
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+    MIN_CHUNK_SIZE,
+)
 from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -93,6 +101,123 @@ def _ws_get_significant_states(
     )
 
 
+def _downsampled_period(resolution: float) -> Literal["hour", "5minute"] | None:
+    """Return the coarsest statistics period that meets the resolution."""
+    for period, seconds in DOWNSAMPLED_PERIODS:
+        if seconds <= resolution:
+            return period
+    return None
+
+
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    period: Literal["hour", "5minute"],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> str:
+    """Fetch downsampled history and convert it to json in the executor.
+
+    Entities with mean statistics get a state for each statistics period,
+    with the mean as state and the min and max of the period, followed by
+    their significant states since the last compiled period. The other
+    entities get their significant states.
+    """
+    statistic_ids = {
+        statistic_id
+        for statistic_id, (_, metadata) in statistics.get_metadata(
+            hass, statistic_ids=set(entity_ids)
+        ).items()
+        if metadata["has_mean"]
+    }
+    downsampled = (
+        statistics.statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            statistic_ids,
+            period,
+            None,
+            {"mean", "min", "max"},
+        )
+        if statistic_ids
+        else {}
+    )
+    significant_states = (
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            raw_entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        if (
+            raw_entity_ids := [
+                entity_id for entity_id in entity_ids if entity_id not in downsampled
+            ]
+        )
+        else {}
+    )
+    # The statistics end with the last compiled period, the states since
+    # then are read from the states table.
+    tails: dict[float, list[str]] = {}
+    for entity_id, entity_rows in downsampled.items():
+        tails.setdefault(entity_rows[-1]["end"], []).append(entity_id)
+    end_time_ts = dt_util.utc_to_timestamp(end_time) if end_time else None
+    tail_states: dict[str, list[Any]] = {}
+    for tail_start_ts, tail_entity_ids in tails.items():
+        if end_time_ts is not None and tail_start_ts >= end_time_ts:
+            continue
+        tail_states.update(
+            history.get_significant_states(
+                hass,
+                dt_util.utc_from_timestamp(tail_start_ts),
+                end_time,
+                tail_entity_ids,
+                None,
+                True,
+                significant_changes_only,
+                True,
+                True,
+                True,
+            )
+        )
+    result: dict[str, list[Any]] = {}
+    for entity_id in entity_ids:
+        if rows := downsampled.get(entity_id):
+            # Periods without a mean had no numeric states
+            states: list[dict[str, Any]] = [
+                {
+                    COMPRESSED_STATE_STATE: str(row["mean"]),
+                    COMPRESSED_STATE_LAST_UPDATED: row["start"],
+                    COMPRESSED_STATE_MIN: row["min"],
+                    COMPRESSED_STATE_MAX: row["max"],
+                }
+                for row in rows
+                if row["mean"] is not None
+            ]
+            states.extend(tail_states.get(entity_id, ()))
+            if not states:
+                continue
+            # Like a minimal response, the first state has the attributes
+            if not no_attributes and (state := hass.states.get(entity_id)):
+                states[0][COMPRESSED_STATE_ATTRIBUTES] = state.attributes
+            result[entity_id] = states
+        elif entity_states := significant_states.get(entity_id):
+            result[entity_id] = entity_states
+    return JSON_DUMP(messages.result_message(msg_id, result))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +228,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("resolution"): vol.All(vol.Coerce(float), vol.Range(min=0)),
     }
 )
 @websocket_api.async_response
@@ -154,8 +280,46 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if (resolution := msg.get("resolution")) and (
+        period := _downsampled_period(resolution)
+    ):
+        connection.send_message(
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_get_downsampled_states,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                period,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        )
+        return
+
+    if (cache := async_get_history_cache(hass)) is not None and (
+        states := cache.async_get_significant_states(
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    ) is not None:
+        connection.send_message(
+            await hass.async_add_executor_job(
+                JSON_DUMP, messages.result_message(msg["id"], states)
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -263,6 +427,75 @@ def _generate_historical_response(
     )
 
 
+def _stream_historical_response(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+    chunk_size: int,
+) -> float:
+    """Send the historical states in chunks as they are read from the database.
+
+    The next chunk is only read once the client has read most of the
+    messages pending on the connection, so a slow client throttles the
+    query instead of the whole period being queued for it. Stops when the
+    client unsubscribes or disconnects.
+    """
+
+    async def _async_send_chunk(payload: str) -> bool:
+        """Send a chunk once the client keeps up, unless it unsubscribed."""
+        await connection.async_wait_for_drain()
+        if msg_id not in connection.subscriptions:
+            return False
+        connection.send_message(payload)
+        return True
+
+    last_time_ts = 0.0
+    for entity_id, states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    ):
+        last_time_ts = max(
+            last_time_ts, cast(float, states[-1][COMPRESSED_STATE_LAST_UPDATED])
+        )
+        payload = _generate_websocket_response(
+            msg_id,
+            start_time,
+            dt_util.utc_from_timestamp(last_time_ts),
+            {entity_id: states},
+        )
+        if not asyncio.run_coroutine_threadsafe(
+            _async_send_chunk(payload), hass.loop
+        ).result():
+            return last_time_ts
+
+    if last_time_ts == 0 and send_empty:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        asyncio.run_coroutine_threadsafe(
+            _async_send_chunk(
+                _generate_websocket_response(msg_id, start_time, end_time, {})
+            ),
+            hass.loop,
+        ).result()
+    return last_time_ts
+
+
 async def _async_send_historical_states(
     hass: HomeAssistant,
     connection: ActiveConnection,
@@ -275,10 +508,32 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    chunk_size: int | None = None,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    With a chunk_size the states are streamed to the client in messages of
+    up to chunk_size states of a single entity instead of a single message.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    if chunk_size and entity_ids:
+        last_time_ts = await instance.async_add_read_executor_job(
+            _stream_historical_response,
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+            chunk_size,
+        )
+        return dt_util.utc_from_timestamp(last_time_ts) if last_time_ts else None
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -404,6 +659,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=MIN_CHUNK_SIZE)),
     }
 )
 @websocket_api.async_response
@@ -443,6 +699,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    chunk_size: int | None = msg.get("chunk_size")
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +726,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            chunk_size,
         )
         return
 
@@ -533,6 +791,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        chunk_size,
     )
 
     if msg_id not in connection.subscriptions:
@@ -574,4 +833,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        chunk_size=chunk_size,
     )
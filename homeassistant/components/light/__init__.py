@@ -601,22 +601,27 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
 
     # Listen for light on and light off service calls.
 
+    # The light profiles are loaded once, so the schemas always return the
+    # same data for the same service data
     component.async_register_entity_service(
         SERVICE_TURN_ON,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA), preprocess_data),
         async_handle_light_on_service,
+        cache_validation=True,
     )
 
     component.async_register_entity_service(
         SERVICE_TURN_OFF,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_OFF_SCHEMA), preprocess_data),
         async_handle_light_off_service,
+        cache_validation=True,
     )
 
     component.async_register_entity_service(
         SERVICE_TOGGLE,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA), preprocess_data),
         async_handle_toggle_service,
+        cache_validation=True,
     )
 
     return True
@@ -32,8 +32,10 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
 from . import rest_api, websocket_api
+from .cache import async_setup_logbook_cache
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
+    CONF_CACHE_WINDOW,
     DOMAIN,
     LOGBOOK_ENTRY_CONTEXT_ID,
     LOGBOOK_ENTRY_DOMAIN,
@@ -46,7 +48,16 @@ from .const import (  # noqa: F401
 from .models import LazyEventPartialState, LogbookConfig
 
 CONFIG_SCHEMA = vol.Schema(
-    {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
+    {
+        DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
+            {
+                vol.Optional(CONF_CACHE_WINDOW): vol.All(
+                    cv.time_period, cv.positive_timedelta
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
 )
 
 
@@ -139,6 +150,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
+    if window := logbook_conf.get(CONF_CACHE_WINDOW):
+        async_setup_logbook_cache(hass, window)
 
     await async_process_integration_platforms(hass, DOMAIN, _process_logbook_platform)
 
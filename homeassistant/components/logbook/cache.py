@@ -0,0 +1,186 @@
+"""In-memory cache of recent logbook entries.
+
+Every time the logbook panel is opened, the database is asked for the states
+and events of the period and their contexts are joined. Instead, the cache
+keeps the entries of the last ``cache_window`` in memory. They are humanified
+live from the event bus by the same EventProcessor and ContextAugmenter the
+live stream uses, so unfiltered logbook queries within the window are
+answered without touching the database.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import datetime as dt, timedelta
+from itertools import islice
+from operator import itemgetter
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
+
+from .const import BUILT_IN_EVENTS, DOMAIN, LOGBOOK_ENTRY_WHEN
+from .helpers import event_forwarder_filtered, is_state_event_filtered
+from .models import LogbookConfig, async_event_to_row
+from .processor import EventProcessor
+
+DATA_LOGBOOK_CACHE = "logbook_cache"
+
+TRIM_INTERVAL = timedelta(minutes=5)
+
+# The most entries kept, the oldest entries are dropped first
+MAX_CACHED_ENTRIES = 10000
+
+_entry_when = itemgetter(LOGBOOK_ENTRY_WHEN)
+
+
+class LogbookCache:
+    """Keep the recent unfiltered logbook entries in memory."""
+
+    def __init__(self, hass: HomeAssistant, window: timedelta) -> None:
+        """Initialize the logbook cache."""
+        self.hass = hass
+        self.window = window
+        self._entries: deque[dict[str, Any]] = deque()
+        # The cache has every entry after this time
+        self._since_ts = 0.0
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._event_processor = EventProcessor(
+            hass, (), timestamp=True, include_entity_name=False
+        )
+        # There are no database rows to link contexts with, the
+        # contexts are taken from the origin events instead.
+        self._event_processor.switch_to_live()
+
+    def __len__(self) -> int:
+        """Return the number of entries kept."""
+        return len(self._entries)
+
+    @callback
+    def async_start(self) -> None:
+        """Start caching the logbook entries."""
+        logbook_config: LogbookConfig = self.hass.data[DOMAIN]
+        external_events = logbook_config.external_events
+        entities_filter = logbook_config.entity_filter
+        instance = get_instance(self.hass)
+        exclude_event_types = instance.exclude_event_types
+        recorder_filter = instance.entity_filter
+        ent_reg = self._event_processor.ent_reg
+        add_event = self._async_add_event
+        forward_event = event_forwarder_filtered(add_event, entities_filter, None, None)
+
+        @callback
+        def _async_event(event: Event) -> None:
+            """Add the events the logbook panel shows."""
+            if (event_type := event.event_type) in exclude_event_types:
+                return
+            # The database only has the events of the recorded entities
+            entity_id = event.data.get(ATTR_ENTITY_ID)
+            if isinstance(entity_id, str):
+                if not recorder_filter(entity_id):
+                    return
+            elif isinstance(entity_id, list) and not any(
+                recorder_filter(eid) for eid in entity_id
+            ):
+                return
+            if event_type == EVENT_STATE_CHANGED:
+                if not is_state_event_filtered(
+                    ent_reg, entities_filter, event  # type: ignore[arg-type]
+                ):
+                    add_event(event)
+            elif event_type in BUILT_IN_EVENTS or event_type in external_events:
+                forward_event(event)
+
+        self._since_ts = dt_util.utc_to_timestamp(dt_util.utcnow())
+        self._unsubs.append(
+            self.hass.bus.async_listen(MATCH_ALL, _async_event, run_immediately=True)
+        )
+        self._unsubs.append(
+            async_track_time_interval(
+                self.hass,
+                self._async_trim,
+                TRIM_INTERVAL,
+                name="logbook cache trim",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop caching and drop the cached entries."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._entries.clear()
+
+    @callback
+    def _async_add_event(self, event: Event) -> None:
+        """Humanify an event and add its entry to the cache."""
+        entries = self._entries
+        entries.extend(self._event_processor.humanify((async_event_to_row(event),)))
+        while len(entries) > MAX_CACHED_ENTRIES:
+            self._since_ts = max(self._since_ts, _entry_when(entries.popleft()))
+
+    @callback
+    def _async_trim(self, now: dt) -> None:
+        """Drop the entries that fell out of the window."""
+        self._since_ts = max(
+            self._since_ts, dt_util.utc_to_timestamp(now - self.window)
+        )
+        entries = self._entries
+        while entries and _entry_when(entries[0]) <= self._since_ts:
+            entries.popleft()
+
+    @callback
+    def async_get_events(
+        self, start_time: dt, end_time: dt
+    ) -> list[dict[str, Any]] | None:
+        """Return the entries after start_time and before end_time.
+
+        Returns None if the cache does not hold every entry of the period,
+        the database has to be queried instead.
+        """
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        if start_time_ts < self._since_ts:
+            return None
+        end_time_ts = dt_util.utc_to_timestamp(end_time)
+        entries = self._entries
+        start = bisect_right(entries, start_time_ts, key=_entry_when)
+        end = bisect_left(entries, end_time_ts, start, key=_entry_when)
+        return list(islice(entries, start, end))
+
+
+@callback
+def async_get_logbook_cache(hass: HomeAssistant) -> LogbookCache | None:
+    """Return the logbook cache if it is enabled."""
+    cache: LogbookCache | None = hass.data.get(DATA_LOGBOOK_CACHE)
+    return cache
+
+
+@callback
+def async_get_cached_events(
+    hass: HomeAssistant,
+    event_processor: EventProcessor,
+    start_time: dt,
+    end_time: dt,
+) -> list[dict[str, Any]] | None:
+    """Return the entries of an unfiltered request from the cache if possible."""
+    if (
+        event_processor.limited_select
+        or (cache := async_get_logbook_cache(hass)) is None
+    ):
+        return None
+    return cache.async_get_events(start_time, end_time)
+
+
+@callback
+def async_setup_logbook_cache(hass: HomeAssistant, window: timedelta) -> LogbookCache:
+    """Start caching the recent logbook entries."""
+    if (cache := async_get_logbook_cache(hass)) is not None:
+        return cache
+    cache = hass.data[DATA_LOGBOOK_CACHE] = LogbookCache(hass, window)
+    cache.async_start()
+    return cache
@@ -18,6 +18,8 @@ ATTR_MESSAGE = "message"
 
 DOMAIN = "logbook"
 
+CONF_CACHE_WINDOW = "cache_window"
+
 CONTEXT_USER_ID = "context_user_id"
 CONTEXT_ENTITY_ID = "context_entity_id"
 CONTEXT_ENTITY_ID_NAME = "context_entity_id_name"
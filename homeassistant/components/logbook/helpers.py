@@ -189,15 +189,8 @@ def async_subscribe_events(
 
     @callback
     def _forward_state_events_filtered(event: EventType[EventStateChangedData]) -> None:
-        if (old_state := event.data["old_state"]) is None or (
-            new_state := event.data["new_state"]
-        ) is None:
-            return
-        if _is_state_filtered(ent_reg, new_state, old_state) or (
-            entities_filter and not entities_filter(new_state.entity_id)
-        ):
-            return
-        target(event)
+        if not is_state_event_filtered(ent_reg, entities_filter, event):
+            target(event)
 
     if entity_ids:
         subscriptions.append(
@@ -217,6 +210,22 @@ def async_subscribe_events(
     )
 
 
+@callback
+def is_state_event_filtered(
+    ent_reg: er.EntityRegistry,
+    entities_filter: Callable[[str], bool] | None,
+    event: EventType[EventStateChangedData],
+) -> bool:
+    """Check if the logbook should filter a state changed event."""
+    if (old_state := event.data["old_state"]) is None or (
+        new_state := event.data["new_state"]
+    ) is None:
+        return True
+    return _is_state_filtered(ent_reg, new_state, old_state) or bool(
+        entities_filter and not entities_filter(new_state.entity_id)
+    )
+
+
 def is_sensor_continuous(ent_reg: er.EntityRegistry, entity_id: str) -> bool:
     """Determine if a sensor is continuous by checking its state class.
 
@@ -170,7 +170,8 @@ class EventProcessor:
             )
 
     def humanify(
-        self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
+        self,
+        rows: Generator[EventAsRow, None, None] | Sequence[Row | EventAsRow] | Result,
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -184,7 +185,7 @@ class EventProcessor:
 
 
 def _humanify(
-    rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow, None, None] | Sequence[Row | EventAsRow] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -19,6 +19,7 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import JSON_DUMP
 import homeassistant.util.dt as dt_util
 
+from .cache import async_get_cached_events
 from .const import DOMAIN
 from .helpers import (
     async_determine_event_types,
@@ -95,6 +96,16 @@ async def _async_send_historical_events(
     This function returns the time of the most recent event we sent to the
     websocket.
     """
+    if (
+        events := async_get_cached_events(hass, event_processor, start_time, end_time)
+    ) is not None:
+        stream_message = _generate_stream_message(events, start_time, end_time)
+        if partial:
+            stream_message["partial"] = True
+        if events or not partial or force_send:
+            connection.send_message(JSON_DUMP(formatter(msg_id, stream_message)))
+        return dt_util.utc_from_timestamp(events[-1]["when"]) if events else None
+
     is_big_query = (
         not event_processor.entity_ids
         and not event_processor.device_ids
@@ -167,7 +178,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[str, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -373,6 +384,35 @@ async def ws_event_stream(
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
+    if (
+        events := async_get_cached_events(
+            hass, event_processor, start_time, subscriptions_setup_complete_time
+        )
+    ) is not None:
+        # The cache already has every event up to the subscriptions, there is
+        # no need to wait for the recorder to catch up before going live.
+        connection.send_message(
+            JSON_DUMP(
+                messages.event_message(
+                    msg_id,
+                    _generate_stream_message(
+                        events, start_time, subscriptions_setup_complete_time
+                    ),
+                )
+            )
+        )
+        event_processor.switch_to_live()
+        live_stream.task = asyncio.create_task(
+            _async_events_consumer(
+                subscriptions_setup_complete_time,
+                connection,
+                msg_id,
+                stream_queue,
+                event_processor,
+            )
+        )
+        return
+
     # Fetch everything from history
     last_event_time = await _async_send_historical_events(
         hass,
@@ -503,8 +543,14 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if (
+        events := async_get_cached_events(hass, event_processor, start_time, end_time)
+    ) is not None:
+        connection.send_result(msg["id"], events)
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -27,7 +27,7 @@ from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import (
     EventStateChangedData,
-    async_track_state_change_event,
+    async_track_state_change_batch,
 )
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.typing import (
@@ -249,8 +249,8 @@ class MinMaxSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Handle added to Hass."""
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, self._entity_ids, self._async_min_max_sensor_state_listener
+            async_track_state_change_batch(
+                self.hass, self._entity_ids, self._async_min_max_sensor_batch_listener
             )
         )
 
@@ -290,6 +290,16 @@ class MinMaxSensor(SensorEntity):
             return {ATTR_LAST_ENTITY_ID: self.last_entity_id}
         return None
 
+    @callback
+    def _async_min_max_sensor_batch_listener(
+        self, events: list[EventType[EventStateChangedData]]
+    ) -> None:
+        """Handle the sensor state changes of one loop iteration at once."""
+        for event in events:
+            self._async_min_max_sensor_state_listener(event, update_state=False)
+        self._calc_values()
+        self.async_write_ha_state()
+
     @callback
     def _async_min_max_sensor_state_listener(
         self, event: EventType[EventStateChangedData], update_state: bool = True
@@ -14,14 +14,23 @@ from typing import Any, cast
 from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    JOB_PROFILER_BUCKETS,
+    HomeAssistant,
+    JobProfiler,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.polling import async_get_polling_scheduler
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.timer_wheel import async_get_timer_wheel
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
 
@@ -35,6 +44,9 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_START_LISTENER_STATS = "start_listener_stats"
+SERVICE_STOP_LISTENER_STATS = "stop_listener_stats"
+SERVICE_DUMP_LISTENER_STATS = "dump_listener_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -46,6 +58,7 @@ _KNOWN_LRU_CLASSES = (
     "StateAttributesManager",
     "StatisticsMetaManager",
     "IntegrationMatcher",
+    "TemplateEnvironment",
 )
 
 SERVICES = (
@@ -57,12 +70,18 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_LISTENER_STATS,
+    SERVICE_STOP_LISTENER_STATS,
+    SERVICE_DUMP_LISTENER_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+# Number of the slowest listeners, jobs and services to log
+MAX_LISTENER_STATS_LOGGED = 50
+
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
 
@@ -71,6 +90,16 @@ LOG_INTERVAL_SUB = "log_interval_subscription"
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the profiler websocket commands."""
+    websocket_api.async_register_command(hass, websocket_listener_stats)
+    websocket_api.async_register_command(hass, websocket_timer_wheel_stats)
+    websocket_api.async_register_command(hass, websocket_polling_stats)
+    return True
+
 
 async def async_setup_entry(  # noqa: C901
     hass: HomeAssistant, entry: ConfigEntry
@@ -254,6 +283,38 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    @callback
+    def _async_start_listener_stats(call: ServiceCall) -> None:
+        if hass.job_profiler is not None:
+            raise HomeAssistantError("Listener stats already started")
+        hass.job_profiler = JobProfiler(hass)
+
+    @callback
+    def _async_stop_listener_stats(call: ServiceCall) -> None:
+        if hass.job_profiler is None:
+            raise HomeAssistantError("Listener stats not running")
+        hass.job_profiler = None
+
+    @callback
+    def _async_dump_listener_stats(call: ServiceCall) -> None:
+        """Log the slowest listeners, jobs and services."""
+        if (profiler := hass.job_profiler) is None:
+            raise HomeAssistantError("Listener stats not running")
+
+        for kind, kind_stats in profiler.async_as_dict().items():
+            for name, stats in list(kind_stats.items())[:MAX_LISTENER_STATS_LOGGED]:
+                _LOGGER.critical("Stats for %s %s: %s", kind, name, stats)
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Listener stats have been dumped to the log. See [the"
+                " logs](/config/logs) to review the stats."
+            ),
+            title="Listener stats completed",
+            notification_id="profile_listener_stats",
+        )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,15 +409,95 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LISTENER_STATS,
+        _async_start_listener_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LISTENER_STATS,
+        _async_stop_listener_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_LISTENER_STATS,
+        _async_dump_listener_stats,
+    )
+
     return True
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/listener_stats"})
+def websocket_listener_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the call counts and latency histograms of listeners and jobs."""
+    profiler = hass.job_profiler
+    connection.send_result(
+        msg["id"],
+        {
+            "running": profiler is not None,
+            "buckets": JOB_PROFILER_BUCKETS,
+            "stats": profiler.async_as_dict() if profiler is not None else {},
+        },
+    )
+
+
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/timer_wheel_stats"})
+def websocket_timer_wheel_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the statistics of the timer wheel."""
+    wheel = async_get_timer_wheel(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "running": wheel is not None,
+            "stats": wheel.async_stats() if wheel is not None else {},
+        },
+    )
+
+
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/polling_stats"})
+def websocket_polling_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the polling statistics of each entity platform."""
+    scheduler = async_get_polling_scheduler(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "running": scheduler is not None,
+            "stats": scheduler.async_stats() if scheduler is not None else {},
+        },
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.job_profiler = None
     hass.data.pop(DOMAIN)
     return True
 
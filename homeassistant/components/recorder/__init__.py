@@ -6,8 +6,9 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EXCLUDE, EVENT_STATE_CHANGED
+from homeassistant.const import CONF_EXCLUDE, EVENT_STATE_CHANGED, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -49,9 +50,12 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_PURGE_BY_RANGE = "purge_by_range"
+CONF_PURGE_TIME_BUDGET = "purge_time_budget"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_READ_WORKERS = "db_read_workers"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
@@ -91,6 +95,8 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(CONF_PURGE_BY_RANGE, default=False): cv.boolean,
+                    vol.Optional(CONF_PURGE_TIME_BUDGET): cv.positive_time_period,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -105,6 +111,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_RETRY_WAIT, default=DEFAULT_DB_RETRY_WAIT
                     ): cv.positive_int,
+                    vol.Optional(CONF_DB_READ_WORKERS, default=0): cv.positive_int,
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
@@ -134,10 +141,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = convert_include_exclude_filter(conf).get_filter()
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
+    purge_by_range = conf[CONF_PURGE_BY_RANGE]
+    purge_time_budget = conf.get(CONF_PURGE_TIME_BUDGET)
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    db_read_workers = conf[CONF_DB_READ_WORKERS]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -150,11 +160,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         auto_purge=auto_purge,
         auto_repack=auto_repack,
+        purge_by_range=purge_by_range,
+        purge_time_budget=purge_time_budget,
         keep_days=keep_days,
         commit_interval=commit_interval,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
+        db_read_workers=db_read_workers,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
     )
@@ -164,6 +177,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     async_register_services(hass, instance)
     websocket_api.async_setup(hass)
     entity_registry.async_setup(hass)
+    if auto_purge and purge_time_budget:
+        # Report how far the budgeted purge is behind
+        hass.async_create_task(
+            discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+        )
 
     await _async_setup_integration_platform(hass, instance)
 
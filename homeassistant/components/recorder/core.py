@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
@@ -19,7 +19,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlalchemy.orm.session import Session
+from sqlalchemy.orm.session import Session, SessionTransaction
 
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
@@ -39,10 +39,12 @@ from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
 from . import migration, statistics
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
@@ -95,6 +97,7 @@ from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
+    BudgetedPurgeTask,
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
@@ -121,8 +124,10 @@ from .tasks import (
 )
 from .util import (
     build_mysqldb_conv,
+    bulk_insert_objects,
     dburl_to_path,
     end_incomplete_runs,
+    execute_on_connection,
     execute_stmt_lambda_element,
     get_index_by_name,
     is_second_sunday,
@@ -136,6 +141,7 @@ from .util import (
 _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 
@@ -171,11 +177,14 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         auto_repack: bool,
+        purge_by_range: bool,
+        purge_time_budget: timedelta | None,
         keep_days: int,
         commit_interval: int,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_read_workers: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
     ) -> None:
@@ -186,6 +195,9 @@ class Recorder(threading.Thread):
         self.thread_id: int | None = None
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
+        self.purge_by_range = purge_by_range
+        self.purge_time_budget = purge_time_budget
+        self.purge_lag: float | None = None
         self.keep_days = keep_days
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -193,6 +205,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_workers = db_read_workers
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -215,6 +228,8 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._pending_events: list[Events] = []
+        self._insert_transaction: SessionTransaction | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -226,6 +241,8 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self.read_engine: Engine | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -233,6 +250,7 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: InterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -278,6 +296,41 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for read only queries.
+
+        Sessions come from the read connection pool when there is one, except
+        in the recorder thread which must see the rows it has not committed.
+        """
+        if (
+            self._get_read_session is not None
+            and threading.get_ident() != self.thread_id
+        ):
+            return self._get_read_session()
+        return self.get_session()
+
+    @property
+    def read_workers(self) -> int:
+        """Return how many read jobs can run in parallel in the read workers."""
+        if self._db_read_executor is None or self._get_read_session is None:
+            return 0
+        return self.db_read_workers
+
+    def map_read_jobs(
+        self, target: Callable[[T], R], items: Iterable[T]
+    ) -> Iterator[R]:
+        """Run target for each item in the read workers.
+
+        The read workers only see committed rows, when called from the
+        recorder thread the pending writes of the event session are
+        committed first. The results are returned in the order of the items.
+        """
+        if self._db_read_executor is None:
+            raise RuntimeError("The recorder has no read workers")
+        if threading.get_ident() == self.thread_id:
+            self._commit_event_session_or_retry()
+        return self._db_read_executor.map(target, items)
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -294,6 +347,11 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self.db_read_workers:
+            self._db_read_executor = InterruptibleThreadPoolExecutor(
+                thread_name_prefix=DB_READ_WORKER_PREFIX,
+                max_workers=self.db_read_workers,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -368,8 +426,23 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    def async_add_read_executor_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> asyncio.Future[T]:
+        """Add a read only executor job from within the event loop.
+
+        The job runs in parallel with other reads when the read connection
+        pool is enabled and falls back to the database executor otherwise.
+        """
+        return self.hass.loop.run_in_executor(
+            self._db_read_executor or self._db_executor, target, *args
+        )
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
+        if self._db_read_executor is not None:
+            self._db_read_executor.shutdown()
+            self._db_read_executor = None
         if self._db_executor is None:
             return
         self._db_executor.shutdown()
@@ -535,11 +608,13 @@ class Recorder(threading.Thread):
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
         """Trigger the purge."""
-        if self.auto_purge:
+        repack = self.auto_repack and is_second_sunday(now)
+        # The budgeted purge runs throughout the day so there
+        # is only something left to do here when repacking
+        if self.auto_purge and (repack or not self.purge_time_budget):
             # Purge will schedule the periodic cleanups
             # after it completes to ensure it does not happen
             # until after the database is vacuumed
-            repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
@@ -550,6 +625,11 @@ class Recorder(threading.Thread):
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        if self.auto_purge and self.purge_time_budget:
+            # The budgeted purge spreads the purge over the day
+            # instead of purging everything in the nightly tasks
+            purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
+            self.queue_task(BudgetedPurgeTask(purge_before, self.purge_time_budget))
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -711,6 +791,11 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_pending_event(self, dbevent: Events) -> None:
+        """Add an event to insert in bulk with the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_events.append(dbevent)
+
     def _run(self) -> None:
         """Start processing events to save."""
         self.thread_id = threading.get_ident()
@@ -1043,7 +1128,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1068,7 +1153,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1141,7 +1226,8 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._event_session_has_pending_writes = True
+        states_manager.add_pending_insert(dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1180,7 +1266,17 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        # The pending states and events are kept until the commit succeeds.
+        # A retry only inserts them again if the transaction of the attempt
+        # that inserted them was rolled back.
+        if (
+            self._insert_transaction is None
+            or session.get_transaction() is not self._insert_transaction
+        ):
+            self._insert_pending(session)
         session.commit()
+        self._insert_transaction = None
+        self._pending_events.clear()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1199,6 +1295,29 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _insert_pending(self, session: Session) -> None:
+        """Insert the pending states and events.
+
+        States and events make up almost all rows written, they are not
+        added to the session but inserted with executemany once the
+        rows they reference have been flushed by the unit of work.
+        """
+        # A rollback expunged the rows the unit of work flushed for the
+        # pending states and events, they have to be flushed again first.
+        self.state_attributes_manager.restore_pending(session)
+        self.event_data_manager.restore_pending(session)
+        self.event_type_manager.restore_pending(session)
+        self.states_meta_manager.restore_pending(session)
+        try:
+            session.flush()
+            self.states_manager.insert_pending(session)
+            bulk_insert_objects(session, self._pending_events)
+        except SQLAlchemyError:
+            # Don't leave a retry with part of the rows inserted
+            session.rollback()
+            raise
+        self._insert_transaction = session.get_transaction()
+
     def _handle_sqlite_corruption(self) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1212,6 +1331,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_events.clear()
+        self._insert_transaction = None
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1362,11 +1483,25 @@ class Recorder(threading.Thread):
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
 
+    def _setup_read_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read connection pool."""
+        assert self.read_engine is not None
+        setup_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection, False
+        )
+        if self.read_engine.dialect.name == SupportedDialect.SQLITE:
+            execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
         kwargs: dict[str, Any] = {}
         self._completed_first_database_setup = False
 
+        # The read connection pool needs a database that can serve
+        # readers while the recorder writes, so not in-memory SQLite
+        read_kwargs: dict[str, Any] | None = None
         if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
             kwargs["connect_args"] = {"check_same_thread": False}
             kwargs["poolclass"] = MutexPool
@@ -1374,6 +1509,7 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
+            read_kwargs = {"connect_args": {"check_same_thread": False}}
         elif self.db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
@@ -1391,6 +1527,9 @@ class Recorder(threading.Thread):
                 # it tried to import it below.
                 with contextlib.suppress(ImportError):
                     kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+            read_kwargs = {"connect_args": kwargs["connect_args"]}
+        else:
+            read_kwargs = {}
 
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
@@ -1407,8 +1546,32 @@ class Recorder(threading.Thread):
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+        if self.db_read_workers and read_kwargs is not None:
+            self.read_engine = create_engine(
+                self.db_url,
+                **read_kwargs,
+                echo=False,
+                pool_size=self.db_read_workers,
+                max_overflow=0,
+                future=True,
+            )
+            sqlalchemy_event.listen(
+                self.read_engine, "connect", self._setup_read_connection
+            )
+            self._get_read_session = scoped_session(
+                sessionmaker(bind=self.read_engine, future=True)
+            )
+            _LOGGER.debug(
+                "Created read connection pool with %s connections",
+                self.db_read_workers,
+            )
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
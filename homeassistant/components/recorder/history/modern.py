@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -20,6 +20,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -34,6 +35,7 @@ from ..models import (
     extract_metadata_ids,
     process_timestamp,
     row_to_compressed_state,
+    rows_to_compressed_states,
 )
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
@@ -211,6 +213,108 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Yield the significant states of a period in chunks.
+
+    The states are in compressed state format. Each chunk holds up to
+    chunk_size states of a single entity, the chunks of an entity are
+    yielded in order. Periods longer than a day are read from the database
+    in batches so the full result set is never held in memory.
+
+    The database session stays open until the generator is exhausted, the
+    next chunk is only read once the caller asks for it. A caller that waits
+    for each chunk to be delivered throttles the query to its consumer.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        metadata_id_to_entity_id = {
+            v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+        }
+        rows = execute_stmt_lambda_element(
+            session, stmt, start_time, end_time, orm_rows=False
+        )
+        attr_cache: dict[str, dict[str, Any]] = {}
+        for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+            entity_id = metadata_id_to_entity_id[metadata_id]
+            states = _entity_rows_to_states(
+                group,
+                entity_id,
+                attr_cache,
+                start_time_ts,
+                minimal_response,
+                True,
+                no_attributes,
+            )
+            while chunk := list(islice(states, chunk_size)):
+                yield entity_id, cast(list[dict[str, Any]], chunk)
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the statement for the significant states of the entities.
+
+    Also returns the metadata ids of the entities and the start time to use
+    for the states at the start time, or None if none of the entities have
+    been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +323,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +361,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -648,20 +748,6 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    field_map = _FIELD_MAP
-    state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
-        State | dict[str, Any],
-    ]
-    if compressed_state_format:
-        state_class = row_to_compressed_state
-        attr_time = COMPRESSED_STATE_LAST_UPDATED
-        attr_state = COMPRESSED_STATE_STATE
-    else:
-        state_class = LazyState
-        attr_time = LAST_CHANGED_KEY
-        attr_state = STATE_KEY
-
     # Set all entity IDs to empty lists in result set to maintain the order
     result: dict[str, list[State | dict[str, Any]]] = {
         entity_id: [] for entity_id in entity_ids
@@ -678,84 +764,23 @@ def _sorted_states_to_dict(
             (metadata_id, iter(states)),
         )
     else:
-        key_func = itemgetter(field_map["metadata_id"])
+        key_func = itemgetter(_FIELD_MAP["metadata_id"])
         states_iter = groupby(states, key_func)
 
-    state_idx = field_map["state"]
-    last_updated_ts_idx = field_map["last_updated_ts"]
-
     # Append all changes to it
+    attr_cache: dict[str, dict[str, Any]] = {}
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
-        attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
-        if (
-            not minimal_response
-            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
-        ):
-            ent_results.extend(
-                state_class(
-                    db_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    db_state[state_idx],
-                    db_state[last_updated_ts_idx],
-                    False,
-                )
-                for db_state in group
-            )
-            continue
-
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
-            )
-
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
+        result[entity_id].extend(
+            _entity_rows_to_states(
+                group,
+                entity_id,
+                attr_cache,
+                start_time_ts,
+                minimal_response,
+                compressed_state_format,
+                no_attributes,
             )
-            continue
-
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            {
-                attr_state: (prev_state := state),  # noqa: F841
-                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
-            }
-            for row in group
-            if (state := row[state_idx]) != prev_state
         )
 
     if descending:
@@ -764,3 +789,95 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _entity_rows_to_states(
+    rows: Iterator[Row],
+    entity_id: str,
+    attr_cache: dict[str, dict[str, Any]],
+    start_time_ts: float | None,
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[State | dict[str, Any]]:
+    """Convert the rows of an entity, sorted by last_updated, to states."""
+    field_map = _FIELD_MAP
+    state_class: Callable[
+        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        State | dict[str, Any],
+    ]
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
+
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    if not minimal_response or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        if compressed_state_format:
+            if (first_row := next(rows, None)) is not None:
+                yield from rows_to_compressed_states(
+                    chain((first_row,), rows),
+                    first_row._fields,
+                    attr_cache,
+                    start_time_ts,
+                    False,
+                )
+            return
+        for db_state in rows:
+            yield state_class(
+                db_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                db_state[state_idx],
+                db_state[last_updated_ts_idx],
+                False,
+            )
+        return
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if (first_state := next(rows, None)) is None:
+        return
+    prev_state: str | None = first_state[state_idx]
+    yield state_class(
+        first_state,
+        attr_cache,
+        start_time_ts,
+        entity_id,
+        prev_state,  # type: ignore[arg-type]
+        first_state[last_updated_ts_idx],
+        no_attributes,
+    )
+
+    #
+    # minimal_response only makes sense with last_updated == last_updated
+    #
+    # We use last_updated for for last_changed since its the same
+    #
+    # With minimal response we do not care about attribute
+    # changes so we can filter out duplicate states
+    if compressed_state_format:
+        # Compressed state format uses the timestamp directly
+        for row in rows:
+            if (state := row[state_idx]) != prev_state:
+                prev_state = state
+                yield {attr_state: state, attr_time: row[last_updated_ts_idx]}
+        return
+
+    # Non-compressed state format returns an ISO formatted string
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    for row in rows:
+        if (state := row[state_idx]) != prev_state:
+            prev_state = state
+            yield {
+                attr_state: state,
+                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
+            }
@@ -1,6 +1,7 @@
 """Models states in for Recorder."""
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 import logging
 from typing import Any
@@ -161,3 +162,47 @@ def row_to_compressed_state(
     ):
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
     return comp_state
+
+
+def rows_to_compressed_states(
+    rows: Iterable[Row],
+    fields: tuple[str, ...],
+    attr_cache: dict[str, dict[str, Any]],
+    start_time_ts: float | None,
+    no_attributes: bool,
+) -> Iterator[dict[str, Any]]:
+    """Convert database rows to compressed states schema 41 and later.
+
+    This is the fast path of row_to_compressed_state for whole result sets.
+    The columns are read by their position in fields instead of by name and
+    each attributes blob is decoded once for all rows sharing attr_cache.
+    """
+    state_idx = fields.index("state")
+    last_updated_ts_idx = fields.index("last_updated_ts")
+    last_changed_ts_idx = (
+        fields.index("last_changed_ts") if "last_changed_ts" in fields else None
+    )
+    attributes_idx = (
+        fields.index("attributes")
+        if not no_attributes and "attributes" in fields
+        else None
+    )
+    attr_cache_get = attr_cache.get
+    for row in rows:
+        comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: row[state_idx]}
+        if attributes_idx is not None:
+            source = row[attributes_idx]
+            if (attributes := attr_cache_get(source)) is None:
+                attributes = decode_attributes_from_source(source, attr_cache)
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = attributes
+        elif not no_attributes:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = {}
+        row_last_updated_ts = row[last_updated_ts_idx] or start_time_ts
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = row_last_updated_ts
+        if (
+            last_changed_ts_idx is not None
+            and (row_last_changed_ts := row[last_changed_ts_idx])
+            and row_last_updated_ts != row_last_changed_ts
+        ):
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
+        yield comp_state
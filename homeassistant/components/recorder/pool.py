@@ -15,7 +15,7 @@ from sqlalchemy.pool import (
 from homeassistant.helpers.frame import report
 from homeassistant.util.async_ import check_loop
 
-from .const import DB_WORKER_PREFIX
+from .const import DB_READ_WORKER_PREFIX, DB_WORKER_PREFIX
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,7 +49,8 @@ class RecorderPool(SingletonThreadPool, NullPool):  # type: ignore[misc]
         """Check if the thread is a recorder or dbworker thread."""
         thread_name = threading.current_thread().name
         return bool(
-            thread_name == "Recorder" or thread_name.startswith(DB_WORKER_PREFIX)
+            thread_name == "Recorder"
+            or thread_name.startswith((DB_WORKER_PREFIX, DB_READ_WORKER_PREFIX))
         )
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
@@ -1,14 +1,16 @@
 """Purge old data helper."""
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import datetime
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
 from itertools import zip_longest
 import logging
 import time
 from typing import TYPE_CHECKING
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 import homeassistant.util.dt as dt_util
 
@@ -22,21 +24,32 @@ from .queries import (
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
+    delete_events_id_range,
     delete_recorder_runs_rows,
+    delete_short_term_statistics_id_range,
     delete_states_attributes_rows,
+    delete_states_id_range,
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
+    disconnect_states_id_range,
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_in_id_range,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event_id,
+    find_oldest_short_term_statistic_id,
+    find_oldest_state_id,
+    find_oldest_state_last_updated_ts,
+    find_short_term_statistics_in_id_range,
     find_short_term_statistics_to_purge,
+    find_states_in_id_range,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -52,6 +65,9 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The budgeted purge yields to recording once the backlog reaches this size
+BUDGETED_PURGE_MAX_BACKLOG = 1000
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -95,12 +111,16 @@ def purge_old_data(
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
+        if instance.purge_by_range:
+            has_more_to_purge |= _purge_short_term_statistics_id_range(
+                instance, session, purge_before
+            )
+        short_term_statistics = _select_short_term_statistics_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
@@ -132,6 +152,45 @@ def _purging_legacy_format(session: Session) -> bool:
     return bool(session.execute(find_legacy_row()).scalar())
 
 
+def purge_old_data_with_budget(
+    instance: Recorder, purge_before: datetime, budget: timedelta
+) -> bool:
+    """Purge old data in small steps until the time budget is used up.
+
+    The batch sizes shrink as the recorder backlog grows and the purge
+    stops early once the backlog reaches BUDGETED_PURGE_MAX_BACKLOG so
+    recording is never held up for long.
+
+    Returns true if the purge finished.
+    """
+    deadline = time.monotonic() + budget.total_seconds()
+    while (backlog := instance.backlog) < BUDGETED_PURGE_MAX_BACKLOG:
+        idle = 1 - backlog / BUDGETED_PURGE_MAX_BACKLOG
+        if purge_old_data(
+            instance,
+            purge_before,
+            repack=False,
+            events_batch_size=max(1, int(DEFAULT_EVENTS_BATCHES_PER_PURGE * idle)),
+            states_batch_size=max(1, int(DEFAULT_STATES_BATCHES_PER_PURGE * idle)),
+        ):
+            return True
+        if time.monotonic() >= deadline:
+            break
+    _LOGGER.debug("Purge time budget used up with backlog %s", instance.backlog)
+    return False
+
+
+def find_purge_lag(instance: Recorder, purge_before: datetime) -> float:
+    """Return how many seconds the oldest state is older than purge_before."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        oldest_ts: float | None = session.execute(
+            find_oldest_state_last_updated_ts()
+        ).scalar()
+    if oldest_ts is None:
+        return 0
+    return max(0, dt_util.utc_to_timestamp(purge_before) - oldest_ts)
+
+
 def _purge_legacy_format(
     instance: Recorder, session: Session, purge_before: datetime
 ) -> bool:
@@ -191,6 +250,11 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    if instance.purge_by_range:
+        purged_ranges, attributes_ids_batch = _purge_state_id_ranges(
+            instance, session, states_batch_size, purge_before
+        )
+        states_batch_size -= purged_ranges
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -226,6 +290,11 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    if instance.purge_by_range:
+        purged_ranges, data_ids_batch = _purge_event_id_ranges(
+            instance, session, events_batch_size, purge_before
+        )
+        events_batch_size -= purged_ranges
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -244,6 +313,138 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _select_expired_id_range(
+    session: Session,
+    find_oldest_id: StatementLambdaElement,
+    find_rows_in_id_range: Callable[[int, int], StatementLambdaElement],
+    range_size: int,
+    purge_before_ts: float,
+) -> tuple[int, int, Sequence[Row]] | None:
+    """Return the oldest id range if all rows in it are older than purge_before.
+
+    Ids are allocated in the order rows are recorded, so the oldest ids
+    hold the oldest rows. When every row in an id range has expired the
+    whole range can be deleted with range conditions on the primary key,
+    much like dropping a partition, instead of deleting the rows by
+    their ids.
+
+    The timestamp must be the last column of the selected rows.
+    """
+    if (start_id := session.execute(find_oldest_id).scalar()) is None:
+        return None
+    end_id = start_id + range_size
+    rows = session.execute(find_rows_in_id_range(start_id, end_id)).all()
+    if any(row[-1] is None or row[-1] >= purge_before_ts for row in rows):
+        return None
+    return start_id, end_id, rows
+
+
+def _purge_state_id_ranges(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> tuple[int, set[int]]:
+    """Purge state id ranges where all states are older than purge_before.
+
+    Returns the number of purged ranges and the attributes ids of the
+    purged states.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    attributes_ids: set[int] = set()
+    for purged_ranges in range(states_batch_size):
+        if not (
+            expired := _select_expired_id_range(
+                session,
+                find_oldest_state_id(),
+                find_states_in_id_range,
+                instance.max_bind_vars,
+                purge_before_ts,
+            )
+        ):
+            return purged_ranges, attributes_ids
+        start_id, end_id, rows = expired
+        disconnected_rows = session.execute(
+            disconnect_states_id_range(start_id, end_id)
+        )
+        _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+        deleted_rows = session.execute(delete_states_id_range(start_id, end_id))
+        _LOGGER.debug(
+            "Deleted %s states in range %s-%s", deleted_rows, start_id, end_id
+        )
+        attributes_ids.update(
+            attributes_id for _, attributes_id, _ in rows if attributes_id
+        )
+        # Evict eny entries in the old_states cache referring to a purged state
+        instance.states_manager.evict_purged_state_ids(
+            {state_id for state_id, *_ in rows}
+        )
+    return states_batch_size, attributes_ids
+
+
+def _purge_event_id_ranges(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    purge_before: datetime,
+) -> tuple[int, set[int]]:
+    """Purge event id ranges where all events are older than purge_before.
+
+    Returns the number of purged ranges and the data ids of the
+    purged events.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    data_ids: set[int] = set()
+    for purged_ranges in range(events_batch_size):
+        if not (
+            expired := _select_expired_id_range(
+                session,
+                find_oldest_event_id(),
+                find_events_in_id_range,
+                instance.max_bind_vars,
+                purge_before_ts,
+            )
+        ):
+            return purged_ranges, data_ids
+        start_id, end_id, rows = expired
+        deleted_rows = session.execute(delete_events_id_range(start_id, end_id))
+        _LOGGER.debug(
+            "Deleted %s events in range %s-%s", deleted_rows, start_id, end_id
+        )
+        data_ids.update(data_id for _, data_id, _ in rows if data_id)
+    return events_batch_size, data_ids
+
+
+def _purge_short_term_statistics_id_range(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge a short term statistics id range older than purge_before.
+
+    Returns true if a range was purged.
+    """
+    if not (
+        expired := _select_expired_id_range(
+            session,
+            find_oldest_short_term_statistic_id(),
+            find_short_term_statistics_in_id_range,
+            instance.max_bind_vars,
+            purge_before.timestamp(),
+        )
+    ):
+        return False
+    start_id, end_id, _ = expired
+    deleted_rows = session.execute(
+        delete_short_term_statistics_id_range(start_id, end_id)
+    )
+    _LOGGER.debug(
+        "Deleted %s short term statistics in range %s-%s",
+        deleted_rows,
+        start_id,
+        end_id,
+    )
+    return True
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
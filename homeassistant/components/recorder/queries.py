@@ -656,6 +656,98 @@ def find_statistics_runs_to_purge(
     )
 
 
+def find_oldest_state_id() -> StatementLambdaElement:
+    """Find the oldest state_id."""
+    return lambda_stmt(lambda: select(func.min(States.state_id)))
+
+
+def find_oldest_state_last_updated_ts() -> StatementLambdaElement:
+    """Find the last_updated_ts of the oldest state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated_ts)))
+
+
+def find_states_in_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Find the states in a state_id range."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.attributes_id, States.last_updated_ts)
+        .filter(States.state_id >= start_id)
+        .filter(States.state_id < end_id)
+    )
+
+
+def disconnect_states_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Disconnect the states rows linked to a state_id range."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id >= start_id)
+        .where(States.old_state_id < end_id)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Delete the states rows in a state_id range."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.state_id >= start_id)
+        .where(States.state_id < end_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_oldest_event_id() -> StatementLambdaElement:
+    """Find the oldest event_id."""
+    return lambda_stmt(lambda: select(func.min(Events.event_id)))
+
+
+def find_events_in_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Find the events in an event_id range."""
+    return lambda_stmt(
+        lambda: select(Events.event_id, Events.data_id, Events.time_fired_ts)
+        .filter(Events.event_id >= start_id)
+        .filter(Events.event_id < end_id)
+    )
+
+
+def delete_events_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Delete the events rows in an event_id range."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.event_id >= start_id)
+        .where(Events.event_id < end_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_oldest_short_term_statistic_id() -> StatementLambdaElement:
+    """Find the oldest short term statistic id."""
+    return lambda_stmt(lambda: select(func.min(StatisticsShortTerm.id)))
+
+
+def find_short_term_statistics_in_id_range(
+    start_id: int, end_id: int
+) -> StatementLambdaElement:
+    """Find the short term statistics in an id range."""
+    return lambda_stmt(
+        lambda: select(StatisticsShortTerm.id, StatisticsShortTerm.start_ts)
+        .filter(StatisticsShortTerm.id >= start_id)
+        .filter(StatisticsShortTerm.id < end_id)
+    )
+
+
+def delete_short_term_statistics_id_range(
+    start_id: int, end_id: int
+) -> StatementLambdaElement:
+    """Delete the statistics_short_term rows in an id range."""
+    return lambda_stmt(
+        lambda: delete(StatisticsShortTerm)
+        .where(StatisticsShortTerm.id >= start_id)
+        .where(StatisticsShortTerm.id < end_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_latest_statistics_runs_run_id() -> StatementLambdaElement:
     """Find the latest statistics_runs run_id."""
     return lambda_stmt(lambda: select(func.max(StatisticsRuns.run_id)))
@@ -0,0 +1,65 @@
+"""Sensor reporting how far the budgeted recorder purge is behind."""
+from __future__ import annotations
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import SIGNAL_PURGE_LAG_UPDATED
+from .core import Recorder
+from .util import get_instance
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the recorder purge lag sensor."""
+    if discovery_info is None:
+        return
+
+    async_add_entities([RecorderPurgeLagSensor(get_instance(hass))])
+
+
+class RecorderPurgeLagSensor(SensorEntity):
+    """Representation of the age of the oldest row left to purge."""
+
+    _attr_name = "Recorder purge lag"
+    _attr_unique_id = "purge_lag"
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, instance: Recorder) -> None:
+        """Initialize the sensor."""
+        self._instance = instance
+
+    async def async_added_to_hass(self) -> None:
+        """Update the sensor when the purge lag changes."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_PURGE_LAG_UPDATED, self._async_purge_lag_updated
+            )
+        )
+
+    @callback
+    def _async_purge_lag_updated(self) -> None:
+        """Handle an update of the purge lag."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the seconds the oldest state is past the purge cutoff."""
+        return self._instance.purge_lag
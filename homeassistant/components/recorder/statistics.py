@@ -454,7 +454,13 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             modified_statistic_ids = _compile_statistics(
                 instance, session, start, end >= last_period
             )
-            if periods_without_commit == commit_interval or modified_statistic_ids:
+            # The read workers compiling the statistics in shards only see
+            # committed rows, they need the statistics of the previous period.
+            if (
+                periods_without_commit == commit_interval
+                or modified_statistic_ids
+                or instance.read_workers
+            ):
                 session.commit()
                 session.expunge_all()
                 periods_without_commit = 0
@@ -752,7 +758,7 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_executor_job(
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -4,6 +4,9 @@ from collections.abc import MutableMapping
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from lru import LRU  # pylint: disable=no-name-in-module
+from sqlalchemy.orm.session import Session
+
+from ..util import add_expunged_objects
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -42,6 +45,14 @@ class BaseTableManager(Generic[_DataT]):
         """
         return self._pending.get(shared_data)
 
+    def restore_pending(self, session: Session) -> None:
+        """Add the pending data back to the session after a rollback.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        add_expunged_objects(session, self._pending.values())
+
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
 
@@ -1,7 +1,10 @@
 """Support managing States."""
 from __future__ import annotations
 
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
+from ..util import bulk_insert_objects
 
 
 class StatesManager:
@@ -10,6 +13,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_inserts: list[States] = []
         self._last_committed_id: dict[str, int] = {}
 
     def pop_pending(self, entity_id: str) -> States | None:
@@ -43,6 +47,51 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to insert with the next commit.
+
+        The state is not added to the session, it is inserted in bulk
+        by insert_pending instead of being flushed by the unit of work.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the pending states.
+
+        A state can only be inserted once the state it links to
+        with old_state_id has its id, so the states are inserted in
+        generations where each state follows the one it replaced.
+
+        The states meta and state attributes the states relate to
+        must have been flushed before this is called.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        generations: list[list[States]] = []
+        generation_by_state: dict[States, int] = {}
+        for state in self._pending_inserts:
+            # The pending states are kept until the commit succeeds, a
+            # state inserted by an attempt that was rolled back is inserted
+            # again.
+            if state.__dict__.get("state_id") is not None:
+                del state.state_id
+            old_state = state.__dict__.get("old_state")
+            generation = (
+                generation_by_state[old_state] + 1
+                if old_state in generation_by_state
+                else 0
+            )
+            generation_by_state[state] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(state)
+        for states in generations:
+            bulk_insert_objects(session, states, return_ids=True)
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -52,6 +101,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +111,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -5,16 +5,17 @@ import abc
 import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.typing import UndefinedType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_PURGE_LAG_UPDATED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -126,6 +127,24 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class BudgetedPurgeTask(RecorderTask):
+    """Object to store information about a budgeted purge task."""
+
+    purge_before: datetime
+    budget: timedelta
+
+    def run(self, instance: Recorder) -> None:
+        """Purge the database for at most the time budget."""
+        if purge.purge_old_data_with_budget(instance, self.purge_before, self.budget):
+            with instance.get_session() as session:
+                instance.recorder_runs_manager.load_from_db(session)
+            instance.purge_lag = 0
+        else:
+            instance.purge_lag = purge.find_purge_lag(instance, self.purge_before)
+        dispatcher_send(instance.hass, SIGNAL_PURGE_LAG_UPDATED)
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -18,10 +18,11 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 import ciso8601
-from sqlalchemy import inspect, text
+from sqlalchemy import Table, insert, inspect, text
 from sqlalchemy.engine import Result, Row
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import MANYTOONE
 from sqlalchemy.orm.query import Query
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.lambdas import StatementLambdaElement
@@ -129,7 +130,8 @@ def session_scope(
     from writing and is not a security measure.
     """
     if session is None and hass is not None:
-        session = get_instance(hass).get_session()
+        instance = get_instance(hass)
+        session = instance.get_read_session() if read_only else instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -241,6 +243,96 @@ def execute_stmt_lambda_element(
     raise RuntimeError  # pragma: no cover
 
 
+@functools.cache
+def _bulk_insert_layout(
+    cls: Any,
+) -> tuple[Table, str, tuple[str, ...], tuple[tuple[str, str, str], ...]]:
+    """Return the table, primary key, columns and foreign keys of a model."""
+    mapper = inspect(cls)
+    table: Table = cls.__table__
+    primary_key = table.primary_key.columns.keys()[0]
+    columns = tuple(column.key for column in table.columns if column.key != primary_key)
+    foreign_keys = tuple(
+        (
+            relationship.key,
+            local.key,
+            relationship.mapper.get_property_by_column(remote).key,
+        )
+        for relationship in mapper.relationships
+        if relationship.direction is MANYTOONE
+        for local, remote in relationship.local_remote_pairs
+    )
+    return table, primary_key, columns, foreign_keys
+
+
+def bulk_insert_objects(
+    session: Session, objects: Sequence[Any], return_ids: bool = False
+) -> None:
+    """Insert model objects that are not part of the session in bulk.
+
+    The objects are inserted with executemany instead of being
+    flushed one by one by the unit of work, which makes inserting
+    many rows much cheaper. The foreign keys of many-to-one
+    relationships are taken from the related objects, which must
+    already have been flushed.
+
+    If return_ids is set the primary keys are fetched with RETURNING
+    where the dialect supports it and set on the objects.
+    """
+    if not objects:
+        return
+    table, primary_key, columns, foreign_keys = _bulk_insert_layout(
+        objects[0].__class__
+    )
+    batches: dict[tuple[str, ...], list[tuple[Any, dict[str, Any]]]] = {}
+    for obj in objects:
+        values = obj.__dict__
+        row = {key: values[key] for key in columns if key in values}
+        for relationship_key, local_key, remote_key in foreign_keys:
+            if (related := values.get(relationship_key)) is not None:
+                row[local_key] = getattr(related, remote_key)
+            elif local_key not in row:
+                row[local_key] = None
+        batches.setdefault(tuple(row), []).append((obj, row))
+
+    stmt = insert(table)
+    dialect = session.get_bind().dialect
+    for batch in batches.values():
+        rows = [row for _, row in batch]
+        if not return_ids:
+            session.execute(stmt, rows)
+        elif dialect.insert_executemany_returning_sort_by_parameter_order:
+            ids = session.execute(
+                stmt.returning(
+                    table.columns[primary_key], sort_by_parameter_order=True
+                ),
+                rows,
+            ).scalars()
+            for (obj, _), id_ in zip(batch, ids, strict=True):
+                setattr(obj, primary_key, id_)
+        else:
+            for obj, row in batch:
+                result = session.execute(stmt, row)
+                setattr(obj, primary_key, result.inserted_primary_key[0])
+
+
+def add_expunged_objects(session: Session, objects: Iterable[Any]) -> None:
+    """Add model objects a rollback expunged back to the session.
+
+    Objects added in a transaction that was rolled back are expunged
+    from the session, and keep the primary key of the lost row if they
+    were flushed. The primary key is cleared so the next flush inserts
+    them again. Objects that are still in the session are left alone.
+    """
+    for obj in objects:
+        if not inspect(obj).transient:
+            continue
+        primary_key = obj.__table__.primary_key.columns.keys()[0]
+        if obj.__dict__.get(primary_key) is not None:
+            delattr(obj, primary_key)
+        session.add(obj)
+
+
 def validate_or_move_away_sqlite_database(dburl: str) -> bool:
     """Ensure that the database is valid or move it away."""
     dbpath = dburl_to_path(dburl)
@@ -22,6 +22,7 @@ from homeassistant.components.recorder.models import (
     StatisticMetaData,
     StatisticResult,
 )
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     REVOLUTIONS_PER_MINUTE,
@@ -64,6 +65,8 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# The fewest sensors compiled by one read worker
+MIN_STATISTICS_SHARD_SIZE = 100
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -373,17 +376,69 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def compile_statistics(
     hass: HomeAssistant,
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
 ) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
+    """Compile statistics for all entities during start-end.
 
+    With a read connection pool the sensors are split in shards which are
+    compiled in parallel by the read workers, each with its own session.
+    """
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    instance = get_instance(hass)
+    if (
+        not (read_workers := instance.read_workers)
+        or len(sensor_states) < 2 * MIN_STATISTICS_SHARD_SIZE
+    ):
+        return _compile_statistics(
+            hass, session, start, end, sensor_states, wanted_statistics
+        )
+
+    # The warnings are tracked in sets shared by the shards
+    for warning in (WARN_DIP, WARN_NEGATIVE, WARN_UNSUPPORTED_UNIT, WARN_UNSTABLE_UNIT):
+        hass.data.setdefault(warning, set())
+
+    def _compile_shard(
+        shard_states: list[State],
+    ) -> statistics.PlatformCompiledStatistics:
+        """Compile the statistics of a shard of the sensors."""
+        with session_scope(hass=hass, read_only=True) as shard_session:
+            return _compile_statistics(
+                hass, shard_session, start, end, shard_states, wanted_statistics
+            )
+
+    shard_size = max(
+        MIN_STATISTICS_SHARD_SIZE, math.ceil(len(sensor_states) / read_workers)
+    )
+    result: list[StatisticResult] = []
+    current_metadata: dict[str, tuple[int, StatisticMetaData]] = {}
+    for compiled in instance.map_read_jobs(
+        _compile_shard,
+        (
+            sensor_states[idx : idx + shard_size]
+            for idx in range(0, len(sensor_states), shard_size)
+        ),
+    ):
+        result.extend(compiled.platform_stats)
+        current_metadata.update(compiled.current_metadata)
+    return statistics.PlatformCompiledStatistics(result, current_metadata)
+
+
+def _compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for the sensors in sensor_states during start-end."""
+    result: list[StatisticResult] = []
+
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
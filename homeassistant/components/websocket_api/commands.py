@@ -53,6 +53,7 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_event_message, construct_result_message
+from .snapshot import async_get_state_snapshot
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -83,6 +84,7 @@ def async_register_commands(
     async_reg(hass, handle_validate_config)
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_integration_descriptions)
 
 
@@ -267,6 +269,15 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if connection.user.permissions.access_all_entities(POLICY_READ):
+        try:
+            message = async_get_state_snapshot(hass).async_get_states_message(msg["id"])
+        except (ValueError, TypeError):
+            pass
+        else:
+            connection.send_message(message)
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -302,7 +313,8 @@ def _send_handle_get_states_response(
 
 
 def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
+    state_diff_message: Callable[[int, Event], str | bytes],
     entity_ids: set[str],
     user: User,
     msg_id: int,
@@ -319,7 +331,7 @@ def _forward_entity_changes(
         POLICY_READ
     ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
         return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    send_message(state_diff_message(msg_id, event))
 
 
 @callback
@@ -334,16 +346,21 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    state_diff_message: Callable[[int, Event], str | bytes]
+    if connection.can_msgpack:
+        state_diff_message = messages.cached_state_diff_msgpack
+    else:
+        state_diff_message = messages.cached_state_diff_message
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         callback(
             partial(
                 _forward_entity_changes,
                 connection.send_message,
+                state_diff_message,
                 entity_ids,
                 connection.user,
                 msg["id"],
@@ -353,6 +370,38 @@ def handle_subscribe_entities(
     )
     connection.send_result(msg["id"])
 
+    if connection.can_msgpack:
+        try:
+            payload = messages.msgpack_dumps(
+                {
+                    messages.ENTITY_EVENT_ADD: {
+                        state.entity_id: state.as_compressed_state
+                        for state in _async_get_allowed_states(hass, connection)
+                        if not entity_ids or state.entity_id in entity_ids
+                    }
+                }
+            )
+        except (ValueError, TypeError, OverflowError):
+            # Fall back to JSON which skips the unserializable states
+            pass
+        else:
+            connection.send_message(
+                messages.construct_event_msgpack(msg["id"], payload)
+            )
+            return
+
+    if not entity_ids and connection.user.permissions.access_all_entities(POLICY_READ):
+        try:
+            message = async_get_state_snapshot(hass).async_get_entities_message(
+                msg["id"]
+            )
+        except (ValueError, TypeError):
+            pass
+        else:
+            connection.send_message(message)
+            return
+
+    states = _async_get_allowed_states(hass, connection)
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -805,6 +854,19 @@ def handle_supported_features(
     connection.send_result(msg["id"])
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection_stats"})
+@decorators.require_admin
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle getting the statistics of the websocket connections."""
+    connection.send_result(
+        msg["id"],
+        [handler.async_get_stats() for handler in hass.data[const.DATA_HANDLERS]],
+    )
+
+
 @decorators.require_admin
 @decorators.websocket_command({"type": "integration/descriptions"})
 @decorators.async_response
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -42,18 +42,21 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_msgpack",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_wait_for_drain",
     )
 
     def __init__(
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_for_drain: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -64,11 +67,13 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_msgpack = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema]] = self.hass.data[
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_for_drain = wait_for_drain
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -79,6 +84,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_msgpack = const.FEATURE_MSGPACK in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -123,6 +129,15 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    async def async_wait_for_drain(self) -> None:
+        """Wait until the client has read most of the pending messages.
+
+        A sender of many messages waits for this before each message so it
+        only queues them as fast as the client reads them.
+        """
+        if self._wait_for_drain is not None:
+            await self._wait_for_drain()
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -227,7 +242,7 @@ class ActiveConnection:
 
     @callback
     def _connect_closed_error(
-        self, msg: str | dict[str, Any] | Callable[[], str]
+        self, msg: str | bytes | dict[str, Any] | Callable[[], str]
     ) -> None:
         """Send a message when the connection is closed."""
         self.logger.debug("Tried to send message %s on closed connection", msg)
@@ -25,6 +25,12 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Senders that wait for the client to keep up, like streams of many
+# messages, queue the next message once at most this many are pending.
+PENDING_MSG_DRAINED: Final = 64
+# Seconds to wait for more messages before sending the next frame once a
+# client receives bursts of messages and coalescing is enabled.
+COALESCE_WINDOW: Final = 0.01
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -47,5 +53,10 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the handlers of the authenticated connections
+DATA_HANDLERS: Final = f"{DOMAIN}.handlers"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Messages are sent as MessagePack in binary frames instead of JSON text
+# when possible, text frames stay JSON.
+FEATURE_MSGPACK = "msgpack"
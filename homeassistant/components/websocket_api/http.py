@@ -19,8 +19,11 @@ from homeassistant.util.json import json_loads
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
+    COALESCE_WINDOW,
     DATA_CONNECTIONS,
+    DATA_HANDLERS,
     MAX_PENDING_MSG,
+    PENDING_MSG_DRAINED,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -28,7 +31,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import message_to_json, message_to_msgpack, msgpack_packer
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -38,6 +41,49 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+def _coalesce_messages(messages: list[str | bytes]) -> list[str | bytes]:
+    """Join the messages into as few frames as possible, keeping their order.
+
+    JSON messages are joined into a JSON array and MessagePack messages
+    into a MessagePack array, a frame can't mix text and binary.
+    """
+    frames: list[str | bytes] = []
+    json_messages: list[str] = []
+    msgpack_messages: list[bytes] = []
+    for message in messages:
+        if isinstance(message, str):
+            if msgpack_messages:
+                frames.append(_join_msgpack_messages(msgpack_messages))
+                msgpack_messages = []
+            json_messages.append(message)
+        else:
+            if json_messages:
+                frames.append(_join_json_messages(json_messages))
+                json_messages = []
+            msgpack_messages.append(message)
+    if json_messages:
+        frames.append(_join_json_messages(json_messages))
+    if msgpack_messages:
+        frames.append(_join_msgpack_messages(msgpack_messages))
+    return frames
+
+
+def _join_json_messages(messages: list[str]) -> str:
+    """Join JSON messages into a JSON array."""
+    if len(messages) == 1:
+        return messages[0]
+    joined_messages = ",".join(messages)
+    return f"[{joined_messages}]"
+
+
+def _join_msgpack_messages(messages: list[bytes]) -> bytes:
+    """Join MessagePack messages into a MessagePack array."""
+    if len(messages) == 1:
+        return messages[0]
+    array_header: bytes = msgpack_packer().pack_array_header(len(messages))
+    return array_header + b"".join(messages)
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -75,6 +121,11 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_drain_future",
+        "_peak_queue_size",
+        "_frames_sent",
+        "_messages_sent",
+        "_characters_sent",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -94,8 +145,14 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | bytes | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # Set while senders wait for the queue to drain
+        self._drain_future: asyncio.Future[None] | None = None
+        self._peak_queue_size = 0
+        self._frames_sent = 0
+        self._messages_sent = 0
+        self._characters_sent = 0
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -115,6 +172,23 @@ class WebSocketHandler:
             return describe_request(request)
         return "finished connection"
 
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the statistics of the connection for diagnostics."""
+        frames_sent = self._frames_sent
+        return {
+            "description": self.description,
+            "coalesce": bool(self._connection and self._connection.can_coalesce),
+            "queue_size": len(self._message_queue),
+            "peak_queue_size": self._peak_queue_size,
+            "frames_sent": frames_sent,
+            "messages_sent": self._messages_sent,
+            "characters_sent": self._characters_sent,
+            "coalesce_ratio": (
+                round(self._messages_sent / frames_sent, 2) if frames_sent else None
+            ),
+        }
+
     async def _writer(self) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -122,18 +196,32 @@ class WebSocketHandler:
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
+        send_bytes = wsock.send_bytes
         loop = self._hass.loop
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
         logging_debug = logging.DEBUG
+        # Set after sending a coalesced frame, the client receives a burst of
+        # messages and the next frame waits for more of them.
+        wait_for_burst = False
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
+                if (drain_future := self._drain_future) is not None and len(
+                    message_queue
+                ) <= PENDING_MSG_DRAINED:
+                    self._drain_future = None
+                    drain_future.set_result(None)
+
                 if (messages_remaining := len(message_queue)) == 0:
                     self._ready_future = loop.create_future()
                     await self._ready_future
                     messages_remaining = len(message_queue)
 
+                if wait_for_burst:
+                    await asyncio.sleep(COALESCE_WINDOW)
+                    messages_remaining = len(message_queue)
+
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
@@ -148,10 +236,17 @@ class WebSocketHandler:
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                    wait_for_burst = False
+                    self._frames_sent += 1
+                    self._messages_sent += 1
+                    self._characters_sent += len(message)
+                    if isinstance(message, bytes):
+                        await send_bytes(message)
+                    else:
+                        await send_str(message)
                     continue
 
-                messages: list[str] = [message]
+                messages: list[str | bytes] = [message]
                 while messages_remaining:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
@@ -159,11 +254,17 @@ class WebSocketHandler:
                     messages.append(message)
                     messages_remaining -= 1
 
-                joined_messages = ",".join(messages)
-                coalesced_messages = f"[{joined_messages}]"
-                if debug_enabled:
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                wait_for_burst = True
+                self._messages_sent += len(messages)
+                for coalesced_messages in _coalesce_messages(messages):
+                    if debug_enabled:
+                        debug("%s: Sending %s", self.description, coalesced_messages)
+                    self._frames_sent += 1
+                    self._characters_sent += len(coalesced_messages)
+                    if isinstance(coalesced_messages, bytes):
+                        await send_bytes(coalesced_messages)
+                    else:
+                        await send_str(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -173,6 +274,27 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            # Nothing is sent anymore, release the senders waiting for it
+            if (drain_future := self._drain_future) is not None:
+                self._drain_future = None
+                drain_future.set_result(None)
+
+    async def _async_wait_for_drain(self) -> None:
+        """Wait until the client has read the pending messages.
+
+        Returns once at most PENDING_MSG_DRAINED messages are pending or
+        the messages are no longer sent.
+        """
+        while (
+            len(self._message_queue) > PENDING_MSG_DRAINED
+            and not self._closing
+            and (writer_task := self._writer_task) is not None
+            and not writer_task.done()
+        ):
+            if (drain_future := self._drain_future) is None:
+                drain_future = self._drain_future = self._hass.loop.create_future()
+            # Shielded as the future is shared by all the waiting senders
+            await asyncio.shield(drain_future)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -182,7 +304,7 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -195,7 +317,10 @@ class WebSocketHandler:
             return
 
         if isinstance(message, dict):
-            message = message_to_json(message)
+            if (connection := self._connection) and connection.can_msgpack:
+                message = message_to_msgpack(message)
+            else:
+                message = message_to_json(message)
 
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
@@ -214,6 +339,8 @@ class WebSocketHandler:
             return
 
         message_queue.append(message)
+        if queue_size_before_add >= self._peak_queue_size:
+            self._peak_queue_size = queue_size_before_add + 1
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
@@ -292,7 +419,14 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(logger, hass, self._send_message, self._cancel, request)
+        auth = AuthPhase(
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            self._async_wait_for_drain,
+        )
         connection = None
         disconnect_warn = None
 
@@ -325,6 +459,7 @@ class WebSocketHandler:
             connection = await auth.async_handle(auth_msg_data)
             self._connection = connection
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
+            hass.data.setdefault(DATA_HANDLERS, set()).add(self)
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
             self._authenticated = True
@@ -448,6 +583,7 @@ class WebSocketHandler:
 
                     if connection is not None:
                         hass.data[DATA_CONNECTIONS] -= 1
+                        hass.data[DATA_HANDLERS].discard(self)
                         self._connection = None
 
                     async_dispatcher_send(hass, SIGNAL_WEBSOCKET_DISCONNECTED)
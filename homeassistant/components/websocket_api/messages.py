@@ -1,9 +1,13 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
-from functools import lru_cache
+from dataclasses import fields, is_dataclass
+import datetime as dt
+from enum import Enum
+from functools import cache, lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
+from uuid import UUID
 
 import voluptuous as vol
 
@@ -16,11 +20,18 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.json import JSON_DUMP, find_paths_unserializable_data
+from homeassistant.helpers.json import (
+    JSON_DUMP,
+    find_paths_unserializable_data,
+    json_encoder_default,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const
 
+if TYPE_CHECKING:
+    import msgpack
+
 _LOGGER: Final = logging.getLogger(__name__)
 
 # Minimal requirements of a message
@@ -42,6 +53,11 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+# The parts of a MessagePack event message around the id, the event payload
+# follows them: {"id": iden, "type": "event", "event": payload}
+MSGPACK_EVENT_ID: Final[bytes] = b"\x83\xa2id"
+MSGPACK_EVENT_TYPE: Final[bytes] = b"\xa4type\xa5event\xa5event"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -70,6 +86,15 @@ def construct_event_message(iden: int, payload: str) -> str:
     return f'{{"id":{iden_str},"type":"event","event":{payload}}}'
 
 
+def construct_event_msgpack(iden: int, payload: bytes) -> bytes:
+    """Construct a MessagePack event message from a packed event payload.
+
+    Must be called from the event loop.
+    """
+    packed_id: bytes = msgpack_packer().pack(iden)
+    return MSGPACK_EVENT_ID + packed_id + MSGPACK_EVENT_TYPE + payload
+
+
 def event_message(iden: int, event: Any) -> dict[str, Any]:
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
@@ -123,6 +148,29 @@ def _cached_state_diff_message(event: Event) -> str:
     )
 
 
+def cached_state_diff_msgpack(iden: int, event: Event) -> str | bytes:
+    """Return a MessagePack event message.
+
+    Pack the state diff once per event for all the
+    connections using MessagePack. Falls back to a JSON
+    message if the state can't be packed.
+
+    Must be called from the event loop.
+    """
+    try:
+        payload = _cached_state_diff_msgpack(event)
+    except (ValueError, TypeError, OverflowError):
+        return cached_state_diff_message(iden, event)
+    packed_id: bytes = msgpack_packer().pack(iden)
+    return MSGPACK_EVENT_ID + packed_id + payload
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_msgpack(event: Event) -> bytes:
+    """Cache and pack the part of the message following the id."""
+    return MSGPACK_EVENT_TYPE + msgpack_dumps(_state_diff_event(event))
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -205,3 +253,56 @@ def message_to_json(message: dict[str, Any]) -> str:
                 message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
             )
         )
+
+
+@cache
+def msgpack_packer() -> msgpack.Packer:
+    """Return a packer for the message ids and array headers.
+
+    msgpack is a requirement of the integration rather than of core, it is
+    imported once a client asks for MessagePack. Creating a Packer for every
+    message is slow.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import msgpack
+
+    return msgpack.Packer()
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Convert the objects orjson serializes natively the way it does.
+
+    Other objects are converted like for JSON.
+    """
+    if isinstance(obj, (dt.date, dt.time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    return json_encoder_default(obj)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Pack an object with MessagePack.
+
+    Objects MessagePack can't pack are converted like orjson does.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import msgpack
+
+    packed: bytes = msgpack.packb(obj, default=_msgpack_default)
+    return packed
+
+
+def message_to_msgpack(message: dict[str, Any]) -> str | bytes:
+    """Serialize a websocket message to MessagePack.
+
+    Messages that can't be packed are sent as JSON instead.
+    """
+    try:
+        return msgpack_dumps(message)
+    except (ValueError, TypeError, OverflowError):
+        return message_to_json(message)
@@ -0,0 +1,182 @@
+"""Snapshot of the states for the websocket commands sending all states.
+
+Every client calls get_states or subscribe_entities when it connects, which
+joins the JSON of every state into one large message. The snapshot keeps the
+states in blocks and caches the joined JSON of each block. A state change only
+invalidates the block of its entity so a reconnect storm joins the blocks
+instead of every state for every client. The messages themselves are cached
+by message id until the next state change, as the clients of a reconnect storm
+usually send the same message ids.
+"""
+from __future__ import annotations
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+
+from .messages import construct_event_message, construct_result_message
+
+DATA_STATE_SNAPSHOT = "websocket_api_state_snapshot"
+
+# The number of states kept in one block
+BLOCK_SIZE = 256
+
+# The most messages cached until the next state change
+MAX_CACHED_MESSAGES = 16
+
+
+class _SnapshotBlock:
+    """A block of states and their joined JSON."""
+
+    __slots__ = ("states", "dict_json", "compressed_state_json")
+
+    def __init__(self) -> None:
+        """Initialize the block."""
+        self.states: dict[str, State] = {}
+        self.dict_json: str | None = None
+        self.compressed_state_json: str | None = None
+
+    def invalidate(self) -> None:
+        """Drop the joined JSON after a state of the block changed."""
+        self.dict_json = None
+        self.compressed_state_json = None
+
+    def get_dict_json(self) -> str:
+        """Return the joined JSON of the states."""
+        if self.dict_json is None:
+            self.dict_json = ",".join(
+                state.as_dict_json for state in self.states.values()
+            )
+        return self.dict_json
+
+    def get_compressed_state_json(self) -> str:
+        """Return the joined JSON key value pairs of the compressed states."""
+        if self.compressed_state_json is None:
+            self.compressed_state_json = ",".join(
+                state.as_compressed_state_json for state in self.states.values()
+            )
+        return self.compressed_state_json
+
+
+class StateSnapshot:
+    """Keep the joined JSON of all states up to date.
+
+    The blocks keep the states in the order of the state machine, new
+    entities are always added to the last block.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self.hass = hass
+        self._blocks: list[_SnapshotBlock] = []
+        self._entity_blocks: dict[str, _SnapshotBlock] = {}
+        self._dict_json: str | None = None
+        self._compressed_state_json: str | None = None
+        self._messages: dict[tuple[str, int], str] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Add the current states and follow the state changes."""
+        for state in self.hass.states.async_all():
+            self._async_add_state(state)
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_add_state(self, state: State) -> None:
+        """Add the state of a new entity to the last block."""
+        blocks = self._blocks
+        if not blocks or len(blocks[-1].states) >= BLOCK_SIZE:
+            blocks.append(_SnapshotBlock())
+        block = blocks[-1]
+        block.states[state.entity_id] = state
+        block.invalidate()
+        self._entity_blocks[state.entity_id] = block
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the block of the entity that changed."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        self._dict_json = None
+        self._compressed_state_json = None
+        self._messages.clear()
+        if (block := self._entity_blocks.get(entity_id)) is None:
+            if new_state is not None:
+                self._async_add_state(new_state)
+            return
+        block.invalidate()
+        if new_state is not None:
+            block.states[entity_id] = new_state
+            return
+        del block.states[entity_id]
+        del self._entity_blocks[entity_id]
+        if not block.states:
+            self._blocks.remove(block)
+
+    @callback
+    def async_get_dict_json(self) -> str:
+        """Return the joined JSON of all states.
+
+        Raises ValueError or TypeError if a state can't be serialized.
+        """
+        if self._dict_json is None:
+            self._dict_json = ",".join(block.get_dict_json() for block in self._blocks)
+        return self._dict_json
+
+    @callback
+    def async_get_compressed_state_json(self) -> str:
+        """Return the joined JSON key value pairs of all compressed states.
+
+        Raises ValueError or TypeError if a state can't be serialized.
+        """
+        if self._compressed_state_json is None:
+            self._compressed_state_json = ",".join(
+                block.get_compressed_state_json() for block in self._blocks
+            )
+        return self._compressed_state_json
+
+    @callback
+    def async_get_states_message(self, msg_id: int) -> str:
+        """Return the get_states result message of all states.
+
+        Raises ValueError or TypeError if a state can't be serialized.
+        """
+        key = ("get_states", msg_id)
+        if (message := self._messages.get(key)) is None:
+            message = construct_result_message(
+                msg_id, f"[{self.async_get_dict_json()}]"
+            )
+            self._async_cache_message(key, message)
+        return message
+
+    @callback
+    def async_get_entities_message(self, msg_id: int) -> str:
+        """Return the subscribe_entities event message adding all states.
+
+        Raises ValueError or TypeError if a state can't be serialized.
+        """
+        key = ("subscribe_entities", msg_id)
+        if (message := self._messages.get(key)) is None:
+            message = construct_event_message(
+                msg_id, f'{{"a":{{{self.async_get_compressed_state_json()}}}}}'
+            )
+            self._async_cache_message(key, message)
+        return message
+
+    @callback
+    def _async_cache_message(self, key: tuple[str, int], message: str) -> None:
+        """Cache a message until the next state change."""
+        if len(self._messages) >= MAX_CACHED_MESSAGES:
+            self._messages.clear()
+        self._messages[key] = message
+
+
+@callback
+def async_get_state_snapshot(hass: HomeAssistant) -> StateSnapshot:
+    """Return the state snapshot, start it on first use."""
+    snapshot: StateSnapshot | None = hass.data.get(DATA_STATE_SNAPSHOT)
+    if snapshot is None:
+        snapshot = hass.data[DATA_STATE_SNAPSHOT] = StateSnapshot(hass)
+        snapshot.async_start()
+    return snapshot
@@ -292,6 +292,7 @@ EVENT_LOGGING_CHANGED: Final = "logging_changed"
 EVENT_SERVICE_REGISTERED: Final = "service_registered"
 EVENT_SERVICE_REMOVED: Final = "service_removed"
 EVENT_STATE_CHANGED: Final = "state_changed"
+EVENT_STATE_CHANGED_BATCH: Final = "state_changed_batch"
 EVENT_THEMES_UPDATED: Final = "themes_updated"
 
 # #### DEVICE CLASSES ####
@@ -6,14 +6,17 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
+import bisect
 from collections import UserDict, defaultdict
 from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
+    MutableMapping,
     ValuesView,
 )
 import concurrent.futures
@@ -41,11 +44,11 @@ from typing import (
 )
 from urllib.parse import urlparse
 
+from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 import yarl
 
 from . import block_async_io, util
-from .backports.functools import cached_property
 from .const import (
     ATTR_DOMAIN,
     ATTR_FRIENDLY_NAME,
@@ -66,6 +69,7 @@ from .const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     LENGTH_METERS,
     MATCH_ALL,
     MAX_LENGTH_EVENT_EVENT_TYPE,
@@ -303,6 +307,148 @@ def _get_hassjob_callable_job_type(target: Callable[..., Any]) -> HassJobType:
     return HassJobType.Executor
 
 
+# Upper bounds in seconds of the latency buckets of the job profiler, the
+# last bucket counts everything slower
+JOB_PROFILER_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+
+
+def _job_target_name(target: Callable[..., Any]) -> str:
+    """Return a name for the callable of a job that is stable across instances."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    if (qualname := getattr(target, "__qualname__", None)) is None:
+        return repr(target)
+    return f"{target.__module__}.{qualname}"
+
+
+class JobStats:
+    """Call count and latency histogram of a job."""
+
+    __slots__ = ("count", "total", "max", "histogram")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(JOB_PROFILER_BUCKETS) + 1)
+
+    def record(self, duration: float) -> None:
+        """Record a call."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.histogram[bisect.bisect_left(JOB_PROFILER_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "histogram": self.histogram.copy(),
+        }
+
+
+class JobProfiler:
+    """Record call counts and latencies of bus listeners, jobs and services.
+
+    Callbacks and executor jobs are timed while they run. Coroutines are timed
+    from their start until they finish, which includes the time they spend
+    awaiting, so their latency is wall time and not the time they block the
+    event loop.
+
+    The profiler is only consulted when it is set as hass.job_profiler, so
+    the hot paths only pay for a None check while it is not in use.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiler."""
+        self._hass = hass
+        self.stats: dict[str, dict[str, JobStats]] = defaultdict(
+            lambda: defaultdict(JobStats)
+        )
+
+    @callback
+    def async_record(self, kind: str, name: str, duration: float) -> None:
+        """Record a call of <kind> named <name>."""
+        self.stats[kind][name].record(duration)
+
+    @callback
+    def async_as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the stats, slowest in total first."""
+        return {
+            kind: {
+                name: job_stats.as_dict()
+                for name, job_stats in sorted(
+                    kind_stats.items(), key=lambda item: item[1].total, reverse=True
+                )
+            }
+            for kind, kind_stats in self.stats.items()
+        }
+
+    @callback
+    def async_run_hass_job(
+        self, kind: str, name: str, hassjob: HassJob[..., Any], *args: Any
+    ) -> asyncio.Future[Any] | None:
+        """Run a HassJob like HomeAssistant.async_run_hass_job and time it."""
+        if hassjob.job_type == HassJobType.Callback:
+            self._run_timed(kind, name, hassjob.target, *args)
+            return None
+        return self.async_add_hass_job(kind, name, hassjob, *args)
+
+    @callback
+    def async_add_hass_job(
+        self, kind: str, name: str, hassjob: HassJob[..., Any], *args: Any
+    ) -> asyncio.Future[Any] | None:
+        """Add a HassJob like HomeAssistant.async_add_hass_job and time it."""
+        hass = self._hass
+        if hassjob.job_type == HassJobType.Callback:
+            hass.loop.call_soon(self._run_timed, kind, name, hassjob.target, *args)
+            return None
+        if hassjob.job_type == HassJobType.Coroutinefunction:
+            return hass.async_create_task(
+                self.async_time_coro(kind, name, hassjob.target(*args)), hassjob.name
+            )
+        return hass.async_add_executor_job(
+            self._run_timed_in_executor, kind, name, hassjob.target, *args
+        )
+
+    async def async_time_coro(
+        self, kind: str, name: str, coro: Coroutine[Any, Any, _R]
+    ) -> _R:
+        """Await a coroutine and record the wall time until it finished."""
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            self.async_record(kind, name, time.perf_counter() - start)
+
+    def _run_timed(
+        self, kind: str, name: str, target: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a callback and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return target(*args)
+        finally:
+            self.async_record(kind, name, time.perf_counter() - start)
+
+    def _run_timed_in_executor(
+        self, kind: str, name: str, target: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a function in the executor and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return target(*args)
+        finally:
+            self._hass.loop.call_soon_threadsafe(
+                self.async_record, kind, name, time.perf_counter() - start
+            )
+
+
 class CoreState(enum.Enum):
     """Represent the current state of Home Assistant."""
 
@@ -358,6 +504,8 @@ class HomeAssistant:
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
         self._stop_future: concurrent.futures.Future[None] | None = None
+        # Set to a JobProfiler to record how long jobs take to run
+        self.job_profiler: JobProfiler | None = None
 
     @property
     def is_running(self) -> bool:
@@ -649,6 +797,11 @@ class HomeAssistant:
         hassjob: HassJob
         args: parameters for method to call.
         """
+        if self.job_profiler is not None:
+            return self.job_profiler.async_run_hass_job(
+                "job", _job_target_name(hassjob.target), hassjob, *args
+            )
+
         # This code path is performance sensitive and uses
         # if TYPE_CHECKING to avoid the overhead of constructing
         # the type used for the cast. For history see:
@@ -1005,6 +1158,11 @@ class Event:
         return f"<Event {self.event_type}[{str(self.origin)[0]}]>"
 
 
+_EVENTS_EXCLUDED_FROM_MATCH_ALL = {
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_STATE_CHANGED_BATCH,
+}
+
 _FilterableJobType = tuple[
     HassJob[[Event], Coroutine[Any, Any, None] | None],  # job
     Callable[[Event], bool] | None,  # event_filter
@@ -1015,13 +1173,17 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = ("_listeners", "_match_all_listeners", "_indexed_listeners", "_hass")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # event_type -> event data key -> event data value -> listeners
+        self._indexed_listeners: dict[
+            str, dict[str, dict[Hashable, list[_FilterableJobType]]]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -1030,7 +1192,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, indexes in self._indexed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for index in indexes.values() for jobs in index.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1070,6 +1237,19 @@ class EventBus:
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
 
+        # Listeners registered with a match key are only looked up for the
+        # value carried by this event, so the cost of routing does not grow
+        # with the number of indexed listeners for the event type.
+        if event_data and (indexes := self._indexed_listeners.get(event_type)):
+            for data_key, index in indexes.items():
+                try:
+                    matched = index.get(event_data.get(data_key))
+                except TypeError:
+                    # The value in the event data is not hashable
+                    continue
+                if matched:
+                    listeners = listeners + matched
+
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -1079,9 +1259,12 @@ class EventBus:
             return
 
         # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+        # and EVENT_STATE_CHANGED_BATCH only repeats EVENT_STATE_CHANGED events
+        # that MATCH_ALL listeners have already received
+        if event_type not in _EVENTS_EXCLUDED_FROM_MATCH_ALL:
             listeners = match_all_listeners + listeners
 
+        profiler = self._hass.job_profiler
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1090,7 +1273,9 @@ class EventBus:
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error in event filter")
                     continue
-            if run_immediately:
+            if profiler is not None:
+                self._async_run_profiled_listener(profiler, job, event, run_immediately)
+            elif run_immediately:
                 try:
                     job.target(event)
                 except Exception:  # pylint: disable=broad-except
@@ -1098,6 +1283,24 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_run_profiled_listener(
+        self,
+        profiler: JobProfiler,
+        job: HassJob[[Event], Coroutine[Any, Any, None] | None],
+        event: Event,
+        run_immediately: bool,
+    ) -> None:
+        """Run a listener and record how long it took."""
+        name = f"{event.event_type} {_job_target_name(job.target)}"
+        if not run_immediately:
+            profiler.async_add_hass_job("listener", name, job, event)
+            return
+        try:
+            profiler.async_run_hass_job("listener", name, job, event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: str,
@@ -1125,6 +1328,7 @@ class EventBus:
         listener: Callable[[Event], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[Event], bool] | None = None,
         run_immediately: bool = False,
+        match_key: tuple[str, Hashable] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1139,26 +1343,44 @@ class EventBus:
         right away instead of using call_soon. Only use this if
         the callback results in scheduling another task.
 
+        An optional match_key of (data key, value), for example
+        ("entity_id", "light.kitchen") or ("device_id", device_id),
+        indexes the listener so it is only considered for events
+        where event.data[data key] == value. The event_filter, if any,
+        is only called for those events.
+
         This method must be run in the event loop.
         """
         if event_filter is not None and not is_callback(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         if run_immediately and not is_callback(listener):
             raise HomeAssistantError(f"Event listener {listener} is not a callback")
+        if match_key is not None and event_type == MATCH_ALL:
+            raise HomeAssistantError("A match key cannot be used with MATCH_ALL")
         return self._async_listen_filterable_job(
             event_type,
             (HassJob(listener, f"listen {event_type}"), event_filter, run_immediately),
+            match_key,
         )
 
     @callback
     def _async_listen_filterable_job(
-        self, event_type: str, filterable_job: _FilterableJobType
+        self,
+        event_type: str,
+        filterable_job: _FilterableJobType,
+        match_key: tuple[str, Hashable] | None = None,
     ) -> CALLBACK_TYPE:
-        self._listeners.setdefault(event_type, []).append(filterable_job)
+        if match_key is None:
+            self._listeners.setdefault(event_type, []).append(filterable_job)
+        else:
+            data_key, value = match_key
+            self._indexed_listeners.setdefault(event_type, {}).setdefault(
+                data_key, {}
+            ).setdefault(value, []).append(filterable_job)
 
         def remove_listener() -> None:
             """Remove the listener."""
-            self._async_remove_listener(event_type, filterable_job)
+            self._async_remove_listener(event_type, filterable_job, match_key)
 
         return remove_listener
 
@@ -1231,12 +1453,19 @@ class EventBus:
 
     @callback
     def _async_remove_listener(
-        self, event_type: str, filterable_job: _FilterableJobType
+        self,
+        event_type: str,
+        filterable_job: _FilterableJobType,
+        match_key: tuple[str, Hashable] | None = None,
     ) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
+        if match_key is not None:
+            self._async_remove_indexed_listener(event_type, filterable_job, match_key)
+            return
+
         try:
             self._listeners[event_type].remove(filterable_job)
 
@@ -1250,6 +1479,37 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: str,
+        filterable_job: _FilterableJobType,
+        match_key: tuple[str, Hashable],
+    ) -> None:
+        """Remove a listener indexed by match key of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        data_key, value = match_key
+        try:
+            indexes = self._indexed_listeners[event_type]
+            index = indexes[data_key]
+            jobs = index[value]
+            jobs.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        # delete empty index levels
+        if not jobs:
+            del index[value]
+            if not index:
+                del indexes[data_key]
+                if not indexes:
+                    del self._indexed_listeners[event_type]
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -1264,6 +1524,27 @@ class State:
     object_id: Object id of this state.
     """
 
+    __slots__ = (
+        "entity_id",
+        "state",
+        "attributes",
+        "last_updated",
+        "last_changed",
+        "context",
+        "state_info",
+        "domain",
+        "object_id",
+        "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_as_compressed_state_json",
+    )
+
+    # The JSON caches are only set once they are first built
+    _as_dict_json: str
+    _as_compressed_state: dict[str, Any]
+    _as_compressed_state_json: str
+
     def __init__(
         self,
         entity_id: str,
@@ -1288,7 +1569,13 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # A ReadOnlyDict can be shared with the state it came from, which
+        # avoids a copy when only the state or the timestamps change.
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # pylint: disable=unidiomatic-typecheck
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1329,12 +1616,16 @@ class State:
             )
         return self._as_dict
 
-    @cached_property
+    @property
     def as_dict_json(self) -> str:
         """Return a JSON string of the State."""
-        return json_dumps(self.as_dict())
+        try:
+            return self._as_dict_json
+        except AttributeError:
+            self._as_dict_json = json_dumps(self.as_dict())
+            return self._as_dict_json
 
-    @cached_property
+    @property
     def as_compressed_state(self) -> dict[str, Any]:
         """Build a compressed dict of a state for adds.
 
@@ -1342,6 +1633,14 @@ class State:
 
         Sends c (context) as a string if it only contains an id.
         """
+        try:
+            return self._as_compressed_state
+        except AttributeError:
+            self._as_compressed_state = self._build_compressed_state()
+            return self._as_compressed_state
+
+    def _build_compressed_state(self) -> dict[str, Any]:
+        """Build the compressed dict of the state."""
         state_context = self.context
         if state_context.parent_id is None and state_context.user_id is None:
             context: dict[str, Any] | str = state_context.id
@@ -1359,7 +1658,7 @@ class State:
             )
         return compressed_state
 
-    @cached_property
+    @property
     def as_compressed_state_json(self) -> str:
         """Build a compressed JSON key value pair of a state for adds.
 
@@ -1367,7 +1666,13 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_dumps({self.entity_id: self.as_compressed_state})[1:-1]
+        try:
+            return self._as_compressed_state_json
+        except AttributeError:
+            self._as_compressed_state_json = json_dumps(
+                {self.entity_id: self.as_compressed_state}
+            )[1:-1]
+            return self._as_compressed_state_json
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -1678,35 +1983,17 @@ class StateMachine:
         new_state = str(new_state)
         attributes = attributes or {}
         if (old_state := self._states_data.get(entity_id)) is None:
-            same_state = False
-            same_attr = False
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            if old_state.attributes == attributes:
+                if same_state:
+                    return
+                # Share the unchanged attributes with the old state
+                attributes = old_state.attributes
             last_changed = old_state.last_changed if same_state else None
 
-        if same_state and same_attr:
-            return
-
-        if context is None:
-            # It is much faster to convert a timestamp to a utc datetime object
-            # than converting a utc datetime object to a timestamp since cpython
-            # does not have a fast path for handling the UTC timezone and has to do
-            # multiple local timezone conversions.
-            #
-            # from_timestamp implementation:
-            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-            #
-            # timestamp implementation:
-            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-            timestamp = time.time()
-            now = dt_util.utc_from_timestamp(timestamp)
-            context = Context(id=ulid_at_time(timestamp))
-        else:
-            now = dt_util.utcnow()
-
+        context, now = _async_context_and_time(context)
         state = State(
             entity_id,
             new_state,
@@ -1728,6 +2015,113 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        fire_batch_event: bool = False,
+    ) -> None:
+        """Set the states of multiple entities in one pass.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+        All changed states share the same context and last_updated time, and
+        are stored before any event is fired. A state_changed event is then
+        fired for each changed state, in order.
+
+        If fire_batch_event is passed, a single state_changed_batch event
+        carrying all the changes is fired after the state_changed events.
+
+        This method must be run in the event loop.
+        """
+        states_data = self._states_data
+        pending: dict[str, State] = {}
+        changes: list[dict[str, Any]] = []
+        context_and_time: tuple[Context, datetime.datetime] | None = None
+        for requested_entity_id, requested_state, requested_attributes in states:
+            entity_id = requested_entity_id.lower()
+            new_state = str(requested_state)
+            attributes = requested_attributes or {}
+            old_state = pending.get(entity_id) or states_data.get(entity_id)
+            if old_state is None:
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                if old_state.attributes == attributes:
+                    if same_state:
+                        continue
+                    attributes = old_state.attributes
+                last_changed = old_state.last_changed if same_state else None
+
+            if context_and_time is None:
+                context_and_time = _async_context_and_time(context)
+            # States are validated for the whole batch before any is stored
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                context_and_time[1],
+                context_and_time[0],
+                old_state is None,
+            )
+            pending[entity_id] = state
+            changes.append(
+                {"entity_id": entity_id, "old_state": old_state, "new_state": state}
+            )
+
+        if context_and_time is None:
+            return
+
+        context, now = context_and_time
+        for event_data in changes:
+            if (old_state := event_data["old_state"]) is not None:
+                old_state.expire()
+            self._states[event_data["entity_id"]] = event_data["new_state"]
+
+        bus_fire = self._bus.async_fire
+        for event_data in changes:
+            bus_fire(
+                EVENT_STATE_CHANGED,
+                event_data,
+                EventOrigin.local,
+                context,
+                time_fired=now,
+            )
+        if fire_batch_event:
+            bus_fire(
+                EVENT_STATE_CHANGED_BATCH,
+                {"changes": changes},
+                EventOrigin.local,
+                context,
+                time_fired=now,
+            )
+
+
+@callback
+def _async_context_and_time(
+    context: Context | None,
+) -> tuple[Context, datetime.datetime]:
+    """Return the context and time to use for a state write."""
+    if context is None:
+        # It is much faster to convert a timestamp to a utc datetime object
+        # than converting a utc datetime object to a timestamp since cpython
+        # does not have a fast path for handling the UTC timezone and has to do
+        # multiple local timezone conversions.
+        #
+        # from_timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+        #
+        # timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        timestamp = time.time()
+        return Context(id=ulid_at_time(timestamp)), dt_util.utc_from_timestamp(
+            timestamp
+        )
+    return context, dt_util.utcnow()
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -1742,10 +2136,64 @@ class SupportsResponse(enum.StrEnum):
     """The service is read-only and the caller must always ask for response data."""
 
 
+# Number of validated payloads kept per service
+SERVICE_VALIDATION_CACHE_SIZE = 64
+
+_PLAIN_SERVICE_DATA_TYPES = {str, int, float, bool}
+_IMMUTABLE_SERVICE_DATA_TYPES = (str, int, float, enum.Enum, datetime.timedelta)
+
+
+def _service_data_fingerprint(value: Any) -> Hashable:
+    """Return a hashable fingerprint of plain service data.
+
+    The type of every value is part of the fingerprint, so 1, 1.0 and True
+    do not share a fingerprint. Raises TypeError if the data contains values
+    other than dicts, lists, strings, numbers and None.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return (
+            dict,
+            frozenset(
+                (key, _service_data_fingerprint(item)) for key, item in value.items()
+            ),
+        )
+    if value_type is list or value_type is tuple:
+        return (value_type, tuple(_service_data_fingerprint(item) for item in value))
+    if value is None or value_type in _PLAIN_SERVICE_DATA_TYPES:
+        return (value_type, value)
+    raise TypeError(f"Unsupported service data type {value_type}")
+
+
+def _copy_validated_service_data(value: Any) -> Any:
+    """Copy the containers of validated service data.
+
+    Raises TypeError if the data contains values that could be mutated
+    through a copy, as those cannot be handed out more than once.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_validated_service_data(item) for key, item in value.items()}
+    if type(value) is list:  # noqa: E721
+        return [_copy_validated_service_data(item) for item in value]
+    if type(value) is tuple:  # noqa: E721
+        return tuple(_copy_validated_service_data(item) for item in value)
+    if value is None or isinstance(value, _IMMUTABLE_SERVICE_DATA_TYPES):
+        return value
+    raise TypeError(f"Unsupported validated service data type {type(value)}")
+
+
 class Service:
     """Representation of a callable service."""
 
-    __slots__ = ["job", "schema", "domain", "service", "supports_response"]
+    __slots__ = [
+        "job",
+        "schema",
+        "domain",
+        "service",
+        "supports_response",
+        "cache_validation",
+        "_validated",
+    ]
 
     def __init__(
         self,
@@ -1755,11 +2203,39 @@ class Service:
         service: str,
         context: Context | None = None,
         supports_response: SupportsResponse = SupportsResponse.NONE,
+        cache_validation: bool = False,
     ) -> None:
         """Initialize a service."""
         self.job = HassJob(func, f"service {domain}.{service}")
         self.schema = schema
         self.supports_response = supports_response
+        self.cache_validation = cache_validation
+        self._validated: MutableMapping[Hashable, dict[str, Any]] | None = None
+
+    def validate(self, service_data: dict[str, Any]) -> dict[str, Any]:
+        """Validate service data against the schema of the service.
+
+        If the service was registered with cache_validation, the result for a
+        payload is memoized by a fingerprint of it. Payloads or results that
+        are not plain data are validated every time.
+        """
+        assert self.schema is not None
+        if not self.cache_validation:
+            return self.schema(service_data)  # type: ignore[no-any-return]
+        try:
+            fingerprint = _service_data_fingerprint(service_data)
+        except TypeError:
+            return self.schema(service_data)  # type: ignore[no-any-return]
+        if self._validated is None:
+            self._validated = LRU(SERVICE_VALIDATION_CACHE_SIZE)
+        elif (validated := self._validated.get(fingerprint)) is not None:
+            # Handlers get their own containers so they cannot change the
+            # cached result
+            return _copy_validated_service_data(validated)  # type: ignore[no-any-return]
+        processed_data: dict[str, Any] = self.schema(service_data)
+        with suppress(TypeError):
+            self._validated[fingerprint] = _copy_validated_service_data(processed_data)
+        return processed_data
 
 
 class ServiceCall:
@@ -1862,17 +2338,28 @@ class ServiceRegistry:
         ],
         schema: vol.Schema | None = None,
         supports_response: SupportsResponse = SupportsResponse.NONE,
+        cache_validation: bool = False,
     ) -> None:
         """Register a service.
 
         Schema is called to coerce and validate the service data.
 
+        With cache_validation the validated data is reused for calls with the
+        same plain data. Only pass it for schemas that always return the same
+        result for the same data: schemas with defaults computed at call time
+        or that look up current state must not be cached.
+
         This method must be run in the event loop.
         """
         domain = domain.lower()
         service = service.lower()
         service_obj = Service(
-            service_func, schema, domain, service, supports_response=supports_response
+            service_func,
+            schema,
+            domain,
+            service,
+            supports_response=supports_response,
+            cache_validation=cache_validation,
         )
 
         if domain in self._services:
@@ -1998,7 +2485,7 @@ class ServiceRegistry:
 
         if handler.schema:
             try:
-                processed_data: dict[str, Any] = handler.schema(service_data)
+                processed_data: dict[str, Any] = handler.validate(service_data)
             except vol.Invalid:
                 _LOGGER.debug(
                     "Invalid data for service call %s.%s: %s",
@@ -2025,6 +2512,8 @@ class ServiceRegistry:
         )
 
         coro = self._execute_service(handler, service_call)
+        if (profiler := self._hass.job_profiler) is not None:
+            coro = profiler.async_time_coro("service", f"{domain}.{service}", coro)
         if not blocking:
             self._hass.async_create_task(
                 self._run_service_call_catch_exceptions(coro, service_call),
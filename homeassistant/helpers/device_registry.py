@@ -1,7 +1,7 @@
 """Provide a way to connect entities belonging to one device."""
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Coroutine, ValuesView
 from enum import StrEnum
 import logging
@@ -23,6 +23,7 @@ from . import storage
 from .debounce import Debouncer
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import RegistryIndexType, reindex_value, reindex_values
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -389,8 +390,8 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
     def __setitem__(self, key: str, entry: _EntryTypeT) -> None:
         """Add an item."""
         data = self.data
-        if key in data:
-            old_entry = data[key]
+        old_entry = data.get(key)
+        if old_entry is not None:
             for connection in old_entry.connections:
                 del self._connections[connection]
             for identifier in old_entry.identifiers:
@@ -400,6 +401,7 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
             self._connections[connection] = entry
         for identifier in entry.identifiers:
             self._identifiers[identifier] = entry
+        self._reindex_entry(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
@@ -408,8 +410,14 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
             del self._connections[connection]
         for identifier in entry.identifiers:
             del self._identifiers[identifier]
+        self._reindex_entry(key, entry, None)
         super().__delitem__(key)
 
+    def _reindex_entry(
+        self, key: str, old_entry: _EntryTypeT | None, entry: _EntryTypeT | None
+    ) -> None:
+        """Update the additional indexes of subclasses."""
+
     def get_entry(
         self,
         identifiers: set[tuple[str, str]] | None,
@@ -428,10 +436,56 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active device registry items, maps device id -> entry.
+
+    Maintains two more indexes than DeviceRegistryItems:
+    - area_id -> device ids
+    - config_entry_id -> device ids
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
+
+    def _reindex_entry(
+        self, key: str, old_entry: DeviceEntry | None, entry: DeviceEntry | None
+    ) -> None:
+        """Update the area and config entry indexes."""
+        reindex_value(
+            self._area_id_index,
+            key,
+            old_entry.area_id if old_entry else None,
+            entry.area_id if entry else None,
+        )
+        reindex_values(
+            self._config_entry_id_index,
+            key,
+            old_entry.config_entries if old_entry else (),
+            entry.config_entries if entry else (),
+        )
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -444,6 +498,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
@@ -772,7 +827,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -935,7 +990,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -943,11 +998,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
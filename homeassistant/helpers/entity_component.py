@@ -225,8 +225,12 @@ class EntityComponent(Generic[_EntityT]):
         func: str | Callable[..., Any],
         required_features: list[int] | None = None,
         supports_response: SupportsResponse = SupportsResponse.NONE,
+        cache_validation: bool = False,
     ) -> None:
-        """Register an entity service."""
+        """Register an entity service.
+
+        See ServiceRegistry.async_register for when to pass cache_validation.
+        """
         if isinstance(schema, dict):
             schema = cv.make_entity_service_schema(schema)
 
@@ -237,7 +241,12 @@ class EntityComponent(Generic[_EntityT]):
             )
 
         self.hass.services.async_register(
-            self.domain, name, handle_service, schema, supports_response
+            self.domain,
+            name,
+            handle_service,
+            schema,
+            supports_response,
+            cache_validation=cache_validation,
         )
 
     async def async_setup_platform(
@@ -41,6 +41,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later, async_track_time_interval
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling import async_get_polling_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -527,6 +528,10 @@ class EntityPlatform:
         ):
             return
 
+        if (scheduler := async_get_polling_scheduler(self.hass)) is not None:
+            self._async_unsub_polling = scheduler.async_track_platform(self)
+            return
+
         self._async_unsub_polling = async_track_time_interval(
             self.hass,
             self._update_entity_states,
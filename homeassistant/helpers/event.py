@@ -45,6 +45,7 @@ from .entity_registry import (
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
+from .timer_wheel import TimerWheelHandle, async_get_timer_wheel
 from .typing import EventType, TemplateVarsType
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
@@ -75,6 +76,9 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# State fields that are the same for every state of an entity
+_STATIC_STATE_FIELDS = {"domain", "object_id"}
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _P = ParamSpec("_P")
 
@@ -279,6 +283,71 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
+@bind_hass
+def async_track_state_change_batch(
+    hass: HomeAssistant,
+    entity_ids: str | Iterable[str],
+    action: Callable[[list[EventType[EventStateChangedData]]], Any],
+) -> CALLBACK_TYPE:
+    """Track state change events of entities and deliver them in batches.
+
+    The state change events of the tracked entities that are fired in the
+    same loop iteration are passed to the action as one list, so
+    listeners that aggregate many entities can recompute once per batch
+    instead of once per entity.
+    """
+    if not (entity_ids := _async_string_to_lower_list(entity_ids)):
+        return _remove_empty_listener
+
+    job = HassJob(action, f"track state changed batch {entity_ids}")
+    pending: list[EventType[EventStateChangedData]] = []
+    flush_handle: asyncio.Handle | None = None
+
+    @callback
+    def _async_flush() -> None:
+        """Deliver the collected events."""
+        nonlocal flush_handle
+        flush_handle = None
+        events = pending.copy()
+        pending.clear()
+        try:
+            hass.async_run_hass_job(job, events)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while dispatching state change batch to %s", job)
+
+    @callback
+    def _async_collect(event: EventType[EventStateChangedData]) -> None:
+        """Collect an event until the loop gets to the flush."""
+        nonlocal flush_handle
+        pending.append(event)
+        if flush_handle is None:
+            flush_handle = hass.loop.call_soon(_async_flush)
+
+    # Collecting runs while the event is fired so the flush is queued before
+    # anything the caller that changed the states schedules afterwards.
+    listen = hass.bus.async_listen
+    removes = [
+        listen(
+            EVENT_STATE_CHANGED,
+            _async_collect,  # type: ignore[arg-type]
+            run_immediately=True,
+            match_key=("entity_id", entity_id),
+        )
+        for entity_id in entity_ids
+    ]
+
+    @callback
+    def _async_remove() -> None:
+        """Stop tracking and drop the events that were not delivered."""
+        for remove in removes:
+            remove()
+        if flush_handle is not None:
+            flush_handle.cancel()
+        pending.clear()
+
+    return _async_remove
+
+
 @callback
 def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
@@ -1395,8 +1464,9 @@ def async_track_point_in_utc_time(
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    cancel_callback: asyncio.TimerHandle | TimerWheelHandle | None = None
     loop = hass.loop
+    call_at = _async_get_call_at(hass)
 
     @callback
     def run_action(job: HassJob[[datetime], Coroutine[Any, Any, None] | None]) -> None:
@@ -1410,7 +1480,7 @@ def async_track_point_in_utc_time(
         if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+            cancel_callback = call_at(loop.time() + delta, run_action, job)
             return
 
         hass.async_run_hass_job(job, utc_point_in_time)
@@ -1421,7 +1491,7 @@ def async_track_point_in_utc_time(
         else HassJob(action, f"track point in utc time {utc_point_in_time}")
     )
     delta = expected_fire_timestamp - time.time()
-    cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+    cancel_callback = call_at(loop.time() + delta, run_action, job)
 
     @callback
     def unsub_point_in_time_listener() -> None:
@@ -1435,6 +1505,16 @@ def async_track_point_in_utc_time(
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
 
+@callback
+def _async_get_call_at(
+    hass: HomeAssistant,
+) -> Callable[..., asyncio.TimerHandle | TimerWheelHandle]:
+    """Return the call_at of the timer wheel if it is enabled or of the loop."""
+    if (wheel := async_get_timer_wheel(hass)) is not None:
+        return wheel.call_at
+    return hass.loop.call_at
+
+
 def _run_async_call_action(
     hass: HomeAssistant, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
 ) -> None:
@@ -1456,7 +1536,7 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return _async_get_call_at(hass)(loop_time, _run_async_call_action, hass, job).cancel
 
 
 @callback
@@ -1475,8 +1555,8 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    call_at = _async_get_call_at(hass)
+    return call_at(hass.loop.time() + delay, _run_async_call_action, hass, job).cancel
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1776,16 +1856,37 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        if new_state is None or old_state is None or info.exception:
+            return True
+        # The template only needs to be re-rendered if a State field
+        # it read during the last render is different in the new state
+        return _state_fields_changed(info.state_fields, old_state, new_state)
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _state_fields_changed(
+    state_fields: Iterable[str], old_state: State, new_state: State
+) -> bool:
+    """Return True if any of the State fields differ between the states."""
+    for field in state_fields:
+        if field in _STATIC_STATE_FIELDS:
+            continue
+        # The name is derived from the friendly_name attribute
+        state_field = "attributes" if field == "name" else field
+        if getattr(old_state, state_field) != getattr(new_state, state_field):
+            return True
+    return False
+
+
 @callback
 def _rate_limit_for_event(
     event: EventType[EventStateChangedData],
@@ -0,0 +1,220 @@
+"""Spread the polling of entity platforms over their scan interval.
+
+By default an entity platform updates all of its polling entities at the
+same instant every scan interval. With many polling entities that makes the
+executor and the network see a burst of requests every interval.
+
+Once ``async_setup_polling_scheduler`` has been called, which starting Home
+Assistant with ``--polling-scheduler`` does, entity platforms hand their
+polling to the scheduler instead. It staggers the polls of a
+platform evenly across its scan interval, caps how many polls run at the
+same time globally and per integration and polls entities that share a
+device together, so the device sees one burst of requests per interval
+instead of separate ones. The profiler integration returns the statistics of
+each platform with the ``profiler/polling_stats`` websocket command.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+
+from .event import async_call_later, async_track_time_interval
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .entity_platform import EntityPlatform
+
+DATA_POLLING_SCHEDULER = "polling_scheduler"
+
+DEFAULT_MAX_POLLS = 16
+DEFAULT_MAX_POLLS_PER_INTEGRATION = 4
+
+
+@dataclass(slots=True)
+class PollingStats:
+    """Statistics about the polls of an entity platform."""
+
+    polls: int = 0
+    skipped: int = 0
+    lateness_total: float = 0
+    lateness_max: float = 0
+    duration_total: float = 0
+    duration_max: float = 0
+
+    @callback
+    def async_record(self, lateness: float, duration: float) -> None:
+        """Record a poll."""
+        self.polls += 1
+        self.lateness_total += lateness
+        self.lateness_max = max(self.lateness_max, lateness)
+        self.duration_total += duration
+        self.duration_max = max(self.duration_max, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        polls = self.polls or 1
+        return {
+            "polls": self.polls,
+            "skipped": self.skipped,
+            "lateness_avg": self.lateness_total / polls,
+            "lateness_max": self.lateness_max,
+            "duration_avg": self.duration_total / polls,
+            "duration_max": self.duration_max,
+        }
+
+
+class PollingScheduler:
+    """Schedule the polls of entity platforms."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_polls: int = DEFAULT_MAX_POLLS,
+        max_polls_per_integration: int = DEFAULT_MAX_POLLS_PER_INTEGRATION,
+    ) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self._max_polls_per_integration = max_polls_per_integration
+        self._semaphore = asyncio.Semaphore(max_polls)
+        self._integration_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.stats: dict[str, PollingStats] = {}
+
+    @callback
+    def async_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the polling statistics of each platform."""
+        return {key: stats.as_dict() for key, stats in self.stats.items()}
+
+    @callback
+    def async_track_platform(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Poll the entities of a platform every scan interval.
+
+        Returns a callback that stops polling.
+        """
+        hass = self.hass
+        loop = hass.loop
+        name = f"{platform.domain}.{platform.platform_name}"
+        stats = self.stats.setdefault(name, PollingStats())
+        integration_semaphore = self._integration_semaphores.setdefault(
+            platform.platform_name, asyncio.Semaphore(self._max_polls_per_integration)
+        )
+        polling: set[str] = set()
+        cancel_polls: dict[str, CALLBACK_TYPE] = {}
+
+        async def _async_poll(key: str, entities: list[Entity], due: float) -> None:
+            """Poll a group of entities that share a device."""
+            polling.add(key)
+            try:
+                async with self._semaphore, integration_semaphore:
+                    start = loop.time()
+                    for entity in entities:
+                        # The entity may have been removed while an entity
+                        # before it was updated
+                        if entity.should_poll and entity.hass:
+                            await entity.async_update_ha_state(True)
+                    stats.async_record(max(start - due, 0), loop.time() - start)
+            finally:
+                polling.discard(key)
+
+        @callback
+        def _async_start_poll(
+            key: str,
+            entities: list[Entity],
+            due: float,
+            now: datetime | None = None,
+        ) -> None:
+            """Start polling a group unless its previous poll is still running."""
+            cancel_polls.pop(key, None)
+            if key in polling:
+                stats.skipped += 1
+                platform.logger.debug(
+                    "Skipping poll of %s as its previous poll is still running", key
+                )
+                return
+            hass.async_create_task(
+                _async_poll(key, entities, due), f"EntityPlatform poll {name} {key}"
+            )
+
+        @callback
+        def _async_poll_platform(now: datetime) -> None:
+            """Spread the polls of the groups over the scan interval."""
+            groups = _async_group_polling_entities(platform)
+            if not groups:
+                return
+            step = platform.scan_interval.total_seconds() / len(groups)
+            start = loop.time()
+            for idx, (key, entities) in enumerate(groups.items()):
+                if cancel := cancel_polls.pop(key, None):
+                    cancel()
+                if not idx:
+                    _async_start_poll(key, entities, start)
+                    continue
+                cancel_polls[key] = async_call_later(
+                    hass,
+                    idx * step,
+                    HassJob(
+                        partial(_async_start_poll, key, entities, start + idx * step),
+                        f"EntityPlatform poll {name} {key}",
+                        cancel_on_shutdown=True,
+                    ),
+                )
+
+        unsub_interval = async_track_time_interval(
+            hass,
+            _async_poll_platform,
+            platform.scan_interval,
+            name=f"EntityPlatform poll {name}",
+        )
+
+        @callback
+        def _async_unsub() -> None:
+            """Stop polling the platform."""
+            unsub_interval()
+            for cancel in cancel_polls.values():
+                cancel()
+            cancel_polls.clear()
+
+        return _async_unsub
+
+
+@callback
+def _async_group_polling_entities(
+    platform: EntityPlatform,
+) -> dict[str, list[Entity]]:
+    """Group the polling entities of a platform by their device."""
+    groups: dict[str, list[Entity]] = {}
+    for entity in platform.entities.values():
+        if not entity.should_poll:
+            continue
+        if (entry := entity.registry_entry) is not None and entry.device_id:
+            key = entry.device_id
+        else:
+            key = entity.entity_id
+        groups.setdefault(key, []).append(entity)
+    return groups
+
+
+@callback
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler | None:
+    """Return the polling scheduler if it is enabled."""
+    scheduler: PollingScheduler | None = hass.data.get(DATA_POLLING_SCHEDULER)
+    return scheduler
+
+
+@callback
+def async_setup_polling_scheduler(
+    hass: HomeAssistant,
+    max_polls: int = DEFAULT_MAX_POLLS,
+    max_polls_per_integration: int = DEFAULT_MAX_POLLS_PER_INTEGRATION,
+) -> PollingScheduler:
+    """Let the polling scheduler poll entity platforms that start polling."""
+    if (scheduler := async_get_polling_scheduler(hass)) is not None:
+        return scheduler
+    scheduler = hass.data[DATA_POLLING_SCHEDULER] = PollingScheduler(
+        hass, max_polls, max_polls_per_integration
+    )
+    return scheduler
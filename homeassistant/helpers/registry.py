@@ -0,0 +1,45 @@
+"""Provide helpers shared by the registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Literal
+
+# Maps an indexed value to the keys of the registry entries having it. Python
+# has no ordered set, a dict with True values keeps the insertion order.
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def reindex_value(
+    index: RegistryIndexType, key: str, old_value: str | None, new_value: str | None
+) -> None:
+    """Move the key of an entry from the old value to the new value in an index."""
+    if old_value == new_value:
+        return
+    if old_value is not None:
+        _unindex(index, key, old_value)
+    if new_value is not None:
+        index[new_value][key] = True
+
+
+def reindex_values(
+    index: RegistryIndexType,
+    key: str,
+    old_values: Iterable[str],
+    new_values: Iterable[str],
+) -> None:
+    """Move the key of an entry from the old values to the new values in an index."""
+    old_set = set(old_values)
+    new_set = set(new_values)
+    for old_value in old_set - new_set:
+        _unindex(index, key, old_value)
+    for new_value in new_set - old_set:
+        index[new_value][key] = True
+
+
+def _unindex(index: RegistryIndexType, key: str, value: str) -> None:
+    """Remove the key of an entry from the keys of a value."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
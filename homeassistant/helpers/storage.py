@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
@@ -11,6 +12,8 @@ import logging
 import os
 from typing import Any, Generic, TypeVar
 
+import orjson
+
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -24,7 +27,8 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -38,6 +42,178 @@ STORAGE_SEMAPHORE = "storage_semaphore"
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
+JOURNAL_SUFFIX = ".journal"
+
+# A journaled store writes a new snapshot once its journal grows larger than
+# this share of the snapshot
+JOURNAL_COMPACT_RATIO = 0.5
+
+
+class _JournalCollection:
+    """The serialized items of a list of dicts with unique string ids."""
+
+    __slots__ = ("ids", "items")
+
+    def __init__(self, items: dict[str, bytes]) -> None:
+        """Initialize the collection."""
+        self.ids = list(items)
+        self.items = items
+
+
+_JournalStateType = dict[str, _JournalCollection | bytes]
+
+
+def _journal_state(data: Any) -> _JournalStateType | None:
+    """Serialize the values of the stored data for journaling.
+
+    Lists of dicts with unique string ids are serialized per item so a change
+    only journals the items that changed. Returns None if the data is not a
+    dict, such data is always written as a snapshot.
+
+    Raises TypeError if the data can't be serialized.
+    """
+    if not isinstance(data, dict):
+        return None
+    state: _JournalStateType = {}
+    for key, value in data.items():
+        if (collection := _journal_collection(value)) is not None:
+            state[key] = collection
+        else:
+            state[key] = json_helper.json_bytes(value)
+    return state
+
+
+def _journal_collection(value: Any) -> _JournalCollection | None:
+    """Serialize a list of dicts with unique string ids per item."""
+    if not isinstance(value, list):
+        return None
+    items: dict[str, bytes] = {}
+    for item in value:
+        if (
+            not isinstance(item, dict)
+            or not isinstance(item_id := item.get("id"), str)
+            or item_id in items
+        ):
+            return None
+        items[item_id] = json_helper.json_bytes(item)
+    return _JournalCollection(items)
+
+
+def _journal_record(
+    old_state: _JournalStateType, new_state: _JournalStateType
+) -> dict[str, Any] | None:
+    """Return the journal record changing the old state to the new state.
+
+    Returns None if nothing changed.
+    """
+    record: dict[str, Any] = {}
+    for key, value in new_state.items():
+        old_value = old_state.get(key)
+        if isinstance(value, _JournalCollection):
+            if isinstance(old_value, _JournalCollection):
+                if change := _journal_collection_change(old_value, value):
+                    record[key] = change
+            else:
+                record[key] = {
+                    "value": [orjson.Fragment(item) for item in value.items.values()]
+                }
+        elif value != old_value:
+            record[key] = {"value": orjson.Fragment(value)}
+    for key in old_state.keys() - new_state.keys():
+        record[key] = {"delete": True}
+    return record or None
+
+
+def _journal_collection_change(
+    old: _JournalCollection, new: _JournalCollection
+) -> dict[str, Any] | None:
+    """Return the change of a collection of items.
+
+    The longest sequence of unchanged items that kept their order stays in
+    place. All other items are stored with the id of the item they follow in
+    the new order, None if they are the first item.
+    """
+    new_items = new.items
+    old_items = old.items
+    changed: list[list[Any]] = []
+    previous: str | None = None
+    if old.ids == new.ids:
+        # Nothing moved, only the items that changed are stored
+        for item_id in new.ids:
+            if (item := new_items[item_id]) != old_items[item_id]:
+                changed.append([previous, orjson.Fragment(item)])
+            previous = item_id
+        return {"remove": [], "set": changed} if changed else None
+
+    removed = [item_id for item_id in old.ids if item_id not in new_items]
+    old_index = {item_id: index for index, item_id in enumerate(old.ids)}
+    kept = _longest_ordered_ids(
+        [
+            (old_index[item_id], item_id)
+            for item_id in new.ids
+            if item_id in old_items and old_items[item_id] == new_items[item_id]
+        ]
+    )
+    for item_id in new.ids:
+        if item_id not in kept:
+            changed.append([previous, orjson.Fragment(new_items[item_id])])
+        previous = item_id
+    if not removed and not changed:
+        return None
+    return {"remove": removed, "set": changed}
+
+
+def _longest_ordered_ids(indexed_ids: list[tuple[int, str]]) -> set[str]:
+    """Return the ids of the longest subsequence with increasing indexes."""
+    # The smallest last index of the increasing subsequences of each length
+    tail_indexes: list[int] = []
+    tail_positions: list[int] = []
+    predecessors: list[int] = []
+    for position, (index, _) in enumerate(indexed_ids):
+        length = bisect_left(tail_indexes, index)
+        predecessors.append(tail_positions[length - 1] if length else -1)
+        if length == len(tail_indexes):
+            tail_indexes.append(index)
+            tail_positions.append(position)
+        else:
+            tail_indexes[length] = index
+            tail_positions[length] = position
+    ids: set[str] = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        ids.add(indexed_ids[position][1])
+        position = predecessors[position]
+    return ids
+
+
+def _replay_journal_record(data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply a journal record to the stored data."""
+    for key, change in record.items():
+        if "delete" in change:
+            data.pop(key, None)
+        elif "value" in change:
+            data[key] = change["value"]
+        else:
+            _replay_journal_collection_change(data[key], change)
+
+
+def _replay_journal_collection_change(
+    items: list[dict[str, Any]], change: dict[str, Any]
+) -> None:
+    """Apply the change of a collection to its items.
+
+    Removes the removed and changed items and then inserts each changed item
+    after the item it follows, which restores the order of the collection.
+    """
+    removed = set(change["remove"])
+    removed.update(item["id"] for _, item in change["set"])
+    items[:] = [item for item in items if item["id"] not in removed]
+    ids: list[str] = [item["id"] for item in items]
+    for previous, item in change["set"]:
+        index = 0 if previous is None else ids.index(previous) + 1
+        ids.insert(index, item["id"])
+        items.insert(index, item)
+
 
 @bind_hass
 async def async_migrator(
@@ -94,8 +270,18 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the changes of each save to a journal next
+        to the snapshot of the data and only writes a new snapshot once the
+        journal grows too large. Lists of dicts with unique string ids in the
+        stored data are journaled per item, all other values of the stored
+        data are journaled as a whole. Journaling requires the default encoder.
+        """
+        if journal and encoder is not None:
+            raise ValueError("A journaled store can't use a custom encoder")
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,6 +295,12 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = journal
+        # The serialized data as of the last write, None until the next snapshot
+        self._journal_state: _JournalStateType | None = None
+        self._journal_version: tuple[int, int] | None = None
+        self._journal_size = 0
+        self._snapshot_size = 0
 
     @property
     def path(self):
@@ -159,7 +351,7 @@ class Store(Generic[_T]):
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    self._load_data, self.path
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -251,6 +443,46 @@ class Store(Generic[_T]):
 
         return stored
 
+    def _load_data(self, path: str) -> Any:
+        """Load the snapshot and replay the journal of a journaled store."""
+        data = json_util.load_json(path)
+        if (
+            self._journal
+            and isinstance(data, dict)
+            and isinstance(journal_id := data.pop("journal_id", None), str)
+        ):
+            self._replay_journal(f"{path}{JOURNAL_SUFFIX}", journal_id, data)
+        return data
+
+    def _replay_journal(
+        self, journal_path: str, journal_id: str, data: dict[str, Any]
+    ) -> None:
+        """Replay the records of the journal of the snapshot."""
+        try:
+            with open(journal_path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            raise HomeAssistantError(err) from err
+        try:
+            header = json_util.json_loads(lines[0]) if lines else None
+        except ValueError:
+            header = None
+        if header != {"journal_id": journal_id}:
+            # A write of a new snapshot was interrupted before its journal
+            # was started, the records belong to the previous snapshot
+            _LOGGER.debug("Ignoring stale journal of %s", self.key)
+            return
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # An append was interrupted, it can only be the last record
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                return
+            _replay_journal_record(data["data"], record)
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -360,6 +592,10 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal:
+            self._write_journaled_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -369,6 +605,68 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+    def _write_journaled_data(self, path: str, data: dict) -> None:
+        """Append the changes to the journal or write a new snapshot."""
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        old_state = self._journal_state
+        version = (data["version"], data["minor_version"])
+        # Forget the state until the write succeeded so a failed write is
+        # followed by a new snapshot
+        self._journal_state = None
+        try:
+            state = _journal_state(data["data"])
+        except TypeError:
+            # Let the snapshot write report what can't be serialized
+            state = None
+
+        if state is None:
+            _LOGGER.debug("Writing data for %s to %s", self.key, path)
+            json_helper.save_json(
+                path, data, self._private, atomic_writes=self._atomic_writes
+            )
+            with suppress(FileNotFoundError):
+                os.unlink(journal_path)
+            return
+
+        if (
+            old_state is not None
+            and version == self._journal_version
+            and self._journal_size < self._snapshot_size * JOURNAL_COMPACT_RATIO
+        ):
+            if (record := _journal_record(old_state, state)) is not None:
+                _LOGGER.debug("Appending changes of %s to %s", self.key, journal_path)
+                line = json_helper.json_bytes(record) + b"\n"
+                self._append_journal(journal_path, line)
+                self._journal_size += len(line)
+            self._journal_state = state
+            return
+
+        _LOGGER.debug("Writing snapshot for %s to %s", self.key, path)
+        journal_id = random_uuid_hex()
+        json_helper.save_json(
+            path,
+            {**data, "journal_id": journal_id},
+            self._private,
+            atomic_writes=self._atomic_writes,
+        )
+        header = json_helper.json_bytes({"journal_id": journal_id}) + b"\n"
+        write_utf8_file_atomic(journal_path, header.decode(), self._private)
+        self._snapshot_size = os.path.getsize(path)
+        self._journal_size = len(header)
+        self._journal_version = version
+        self._journal_state = state
+
+    def _append_journal(self, journal_path: str, line: bytes) -> None:
+        """Append a record to the journal."""
+        try:
+            with open(journal_path, "ab") as fdesc:
+                fdesc.write(line)
+                if self._atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+        except OSError as err:
+            raise WriteError(err) from err
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -380,3 +678,8 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
@@ -0,0 +1,340 @@
+"""A hierarchical timer wheel for scheduling many timers on the event loop.
+
+Every timer scheduled with ``loop.call_at`` becomes an entry in the asyncio
+heap, which makes scheduling and cancelling O(log n). Installations with
+thousands of polling entities and debouncers keep that heap large.
+
+The timer wheel keeps timers in hashed buckets instead. Scheduling and
+cancelling are O(1), callbacks that are due in the same tick are run as
+one batch and only a single ``loop.call_at`` handle is kept armed for the
+next tick that has work. Timers never fire early, they may fire up to one
+tick late.
+
+The wheel is opt-in. Starting Home Assistant with ``--timer-wheel`` calls
+``async_setup_timer_wheel``, which routes the time helpers in
+``homeassistant.helpers.event`` through it. The profiler integration returns
+its statistics with the ``profiler/timer_wheel_stats`` websocket command.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+import logging
+import math
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HassJob, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TIMER_WHEEL = "timer_wheel"
+
+DEFAULT_TICK = 0.05
+
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 4
+# Timers further away than this are parked in the top level and re-inserted
+# every time their slot comes around
+MAX_TICKS = 1 << (WHEEL_BITS * WHEEL_LEVELS)
+
+
+class TimerWheelHandle:
+    """A timer scheduled on a timer wheel."""
+
+    __slots__ = (
+        "tick",
+        "_wheel",
+        "_bucket",
+        "_level",
+        "_callback",
+        "_args",
+        "_cancelled",
+    )
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        tick: int,
+        callback_: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        self.tick = tick
+        self._wheel = wheel
+        self._bucket: dict[TimerWheelHandle, None] | None = None
+        self._level = 0
+        self._callback = callback_
+        self._args = args
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        state = " cancelled" if self._cancelled else ""
+        return f"<TimerWheelHandle tick={self.tick} {self._callback}{state}>"
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        """Return the arguments the callback is called with."""
+        return self._args
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled."""
+        return self._cancelled
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        if self._bucket is not None:
+            self._wheel._async_remove(self)  # pylint: disable=protected-access
+
+    def _run(self) -> None:
+        """Run the callback."""
+        self._callback(*self._args)
+
+
+class TimerWheel:
+    """A hierarchical timer wheel driven by a single loop timer.
+
+    Level ``n`` has ``WHEEL_SIZE`` slots that each span ``WHEEL_SIZE ** n``
+    ticks. Timers move down a level when the wheel reaches the start of
+    their slot and run when they reach a slot of the lowest level.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, tick: float) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._tick = tick
+        self._current = math.floor(loop.time() / tick)
+        self._levels: list[list[dict[TimerWheelHandle, None]]] = [
+            [{} for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)
+        ]
+        self._level_counts = [0] * WHEEL_LEVELS
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_tick = 0
+        self.ticks = 0
+        self.callbacks_fired = 0
+        self.fired_per_tick: Counter[int] = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of scheduled timers."""
+        return sum(self._level_counts)
+
+    @property
+    def tick(self) -> float:
+        """Return the length of a tick in seconds."""
+        return self._tick
+
+    @callback
+    def call_at(
+        self, when: float, callback_: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule a callback to be called at loop time <when>."""
+        if self._timer is None and not any(self._level_counts):
+            # The wheel is empty, catch up with the loop so new timers do
+            # not have to cascade through the time it was idle.
+            self._current = max(
+                self._current, math.floor(self._loop.time() / self._tick)
+            )
+        tick = max(math.ceil(when / self._tick), self._current + 1)
+        handle = TimerWheelHandle(self, tick, callback_, args)
+        self._async_insert(handle)
+        if self._timer is None or tick < self._timer_tick:
+            self._async_arm(tick)
+        return handle
+
+    @callback
+    def call_later(
+        self, delay: float, callback_: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule a callback to be called in <delay> seconds."""
+        return self.call_at(self._loop.time() + delay, callback_, *args)
+
+    @callback
+    def async_handles(self) -> list[TimerWheelHandle]:
+        """Return all scheduled timers."""
+        return [
+            handle for level in self._levels for bucket in level for handle in bucket
+        ]
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return statistics about the wheel."""
+        return {
+            "scheduled": len(self),
+            "ticks": self.ticks,
+            "callbacks_fired": self.callbacks_fired,
+            "fired_per_tick": dict(sorted(self.fired_per_tick.items())),
+        }
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the loop timer that drives the wheel."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _async_insert(self, handle: TimerWheelHandle) -> None:
+        """Put a timer in the bucket matching its distance from now."""
+        tick = handle.tick
+        delta = tick - self._current
+        if delta >= MAX_TICKS:
+            tick = self._current + MAX_TICKS - 1
+            delta = MAX_TICKS - 1
+        level = 0
+        while delta >= WHEEL_SIZE:
+            delta >>= WHEEL_BITS
+            level += 1
+        bucket = self._levels[level][(tick >> (WHEEL_BITS * level)) & WHEEL_MASK]
+        bucket[handle] = None
+        handle._bucket = bucket  # pylint: disable=protected-access
+        handle._level = level  # pylint: disable=protected-access
+        self._level_counts[level] += 1
+
+    def _async_remove(self, handle: TimerWheelHandle) -> None:
+        """Remove a cancelled timer from its bucket."""
+        bucket = handle._bucket  # pylint: disable=protected-access
+        assert bucket is not None
+        del bucket[handle]
+        handle._bucket = None  # pylint: disable=protected-access
+        self._level_counts[handle._level] -= 1  # pylint: disable=protected-access
+
+    def _async_arm(self, tick: int) -> None:
+        """Arm the loop timer for <tick>."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_tick = tick
+        self._timer = self._loop.call_at(tick * self._tick, self._async_run)
+
+    def _async_run(self) -> None:
+        """Run all timers that are due and arm the loop timer again."""
+        self._timer = None
+        # The loop may run a timer up to its clock resolution early
+        self._async_advance(
+            max(math.floor(self._loop.time() / self._tick), self._timer_tick)
+        )
+        if (next_tick := self._async_next_tick()) is not None:
+            self._async_arm(next_tick)
+
+    def _async_advance(self, target: int) -> None:
+        """Advance the wheel to <target>, skipping ticks without work."""
+        counts = self._level_counts
+        while self._current < target:
+            current = self._current
+            for level in range(WHEEL_LEVELS):
+                if counts[level]:
+                    break
+            else:
+                self._current = target
+                return
+            if level:
+                # Nothing can fire before the next slot of the lowest
+                # level that has timers comes around.
+                span = 1 << (WHEEL_BITS * level)
+                if (skip_to := (current | (span - 1))) > current:
+                    self._current = current = min(skip_to, target)
+                    if current == target:
+                        return
+            self._current = current = current + 1
+            self._async_cascade(current)
+            self._async_fire(current)
+
+    def _async_cascade(self, current: int) -> None:
+        """Move timers down to lower levels at slot boundaries."""
+        boundary = 0
+        for level in range(1, WHEEL_LEVELS):
+            if current & ((1 << (WHEEL_BITS * level)) - 1):
+                break
+            boundary = level
+        for level in range(boundary, 0, -1):
+            bucket = self._levels[level][(current >> (WHEEL_BITS * level)) & WHEEL_MASK]
+            if not bucket:
+                continue
+            handles = list(bucket)
+            bucket.clear()
+            self._level_counts[level] -= len(handles)
+            for handle in handles:
+                self._async_insert(handle)
+
+    def _async_fire(self, current: int) -> None:
+        """Run the timers of the lowest level slot for <current>."""
+        bucket = self._levels[0][current & WHEEL_MASK]
+        if not bucket:
+            return
+        handles = list(bucket)
+        bucket.clear()
+        self._level_counts[0] -= len(handles)
+        fired = 0
+        for handle in handles:
+            handle._bucket = None  # pylint: disable=protected-access
+            # A timer that ran earlier in this batch may have cancelled it
+            if handle._cancelled:  # pylint: disable=protected-access
+                continue
+            handle._cancelled = True  # pylint: disable=protected-access
+            fired += 1
+            try:
+                handle._run()  # pylint: disable=protected-access
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running timer %s", handle)
+        self.ticks += 1
+        self.callbacks_fired += fired
+        self.fired_per_tick[fired] += 1
+
+    def _async_next_tick(self) -> int | None:
+        """Return the next tick the wheel has work to do."""
+        current = self._current
+        next_tick: int | None = None
+        for level, count in enumerate(self._level_counts):
+            if not count:
+                continue
+            shift = WHEEL_BITS * level
+            slots = self._levels[level]
+            block = current >> shift
+            for offset in range(1, WHEEL_SIZE + 1):
+                if slots[(block + offset) & WHEEL_MASK]:
+                    # Timers in a higher level need to cascade at the start
+                    # of their slot, the lowest level runs them right away.
+                    tick = (block + offset) << shift
+                    if next_tick is None or tick < next_tick:
+                        next_tick = tick
+                    break
+        return next_tick
+
+
+@callback
+def async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel | None:
+    """Return the timer wheel if it is enabled."""
+    wheel: TimerWheel | None = hass.data.get(DATA_TIMER_WHEEL)
+    return wheel
+
+
+@callback
+def async_setup_timer_wheel(
+    hass: HomeAssistant, tick: float = DEFAULT_TICK
+) -> TimerWheel:
+    """Route the time helpers through a timer wheel."""
+    if (wheel := async_get_timer_wheel(hass)) is not None:
+        return wheel
+    wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass.loop, tick)
+
+    @callback
+    def _async_cancel_cancellable_timers(_: Event) -> None:
+        """Cancel timers marked as cancellable, like the loop does."""
+        for handle in wheel.async_handles():
+            if (
+                (args := handle.args)
+                and type(job := args[-1]) is HassJob  # noqa: E721
+                and job.cancel_on_shutdown
+            ):
+                handle.cancel()
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, _async_cancel_cancellable_timers
+    )
+    return wheel
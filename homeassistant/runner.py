@@ -54,6 +54,9 @@ class RuntimeConfig:
     debug: bool = False
     open_ui: bool = False
 
+    timer_wheel: bool = False
+    polling_scheduler: bool = False
+
 
 def can_use_pidfd() -> bool:
     """Check if pidfd_open is available.
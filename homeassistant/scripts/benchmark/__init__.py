@@ -6,19 +6,29 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from functools import partial
 import json
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import entity
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.recorder import async_initialize_recorder
+from homeassistant.helpers.timer_wheel import async_setup_timer_wheel
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -227,6 +237,216 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_filtered_listeners(hass):
+    """Run 100k state changed events through 10k filtered bus listeners."""
+    return await _state_changed_filtered_listeners(hass, indexed=False)
+
+
+@benchmark
+async def state_changed_indexed_listeners(hass):
+    """Run 100k state changed events through 10k indexed bus listeners."""
+    return await _state_changed_filtered_listeners(hass, indexed=True)
+
+
+async def _state_changed_filtered_listeners(hass, indexed):
+    """Fire state changed events at listeners that each want one entity."""
+    count = 0
+    entity_id = "light.kitchen"
+    listener_count = 10**4
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listener_count):
+        listener_entity_id = f"{entity_id}{idx}"
+        if indexed:
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                listener,
+                match_key=("entity_id", listener_entity_id),
+                run_immediately=True,
+            )
+            continue
+
+        @core.callback
+        def event_filter(event, listener_entity_id=listener_entity_id):
+            """Filter event."""
+            return event.data["entity_id"] == listener_entity_id
+
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            listener,
+            event_filter=event_filter,
+            run_immediately=True,
+        )
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def call_later_reschedule(hass):
+    """Reschedule 10k timers ten times, like debouncers that keep resetting."""
+    return await _call_later_reschedule(hass)
+
+
+@benchmark
+async def call_later_reschedule_timer_wheel(hass):
+    """Reschedule 10k timers ten times on the timer wheel."""
+    wheel = async_setup_timer_wheel(hass)
+    runtime = await _call_later_reschedule(hass)
+    wheel.async_shutdown()
+    return runtime
+
+
+async def _call_later_reschedule(hass):
+    """Schedule timers and cancel each one to schedule it again."""
+    timer_count = 10**4
+    reschedules = 10
+
+    @core.callback
+    def action(_):
+        """Handle timer."""
+
+    start = timer()
+
+    cancels = [
+        async_call_later(hass, 60 + idx % 600, action) for idx in range(timer_count)
+    ]
+    for _ in range(reschedules):
+        for idx, cancel in enumerate(cancels):
+            cancel()
+            cancels[idx] = async_call_later(hass, 60 + idx % 600, action)
+
+    runtime = timer() - start
+    for cancel in cancels:
+        cancel()
+    return runtime
+
+
+@benchmark
+async def light_turn_on_service_calls(hass):
+    """Make 10k light.turn_on calls with the same data."""
+    return await _light_turn_on_service_calls(hass, False)
+
+
+@benchmark
+async def light_turn_on_service_calls_cached(hass):
+    """Make 10k light.turn_on calls with the same data and cached validation."""
+    return await _light_turn_on_service_calls(hass, True)
+
+
+async def _light_turn_on_service_calls(hass, cache_validation):
+    """Make 10k light.turn_on calls with the same data."""
+    await _register_light_turn_on(hass, cache_validation)
+    service_data = {
+        "entity_id": "light.kitchen",
+        "brightness_pct": 60,
+        "color_temp_kelvin": 3000,
+        "transition": 2,
+    }
+
+    start = timer()
+
+    for _ in range(10**4):
+        await hass.services.async_call(
+            "light", "turn_on", dict(service_data), blocking=True
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def service_target_area(hass):
+    """Resolve 10k area targets in registries of 12k entities.
+
+    There are 100 areas, each with 20 devices of 6 entities.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+    )
+    from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        await ar.async_load(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        area_reg = ar.async_get(hass)
+        dev_reg = dr.async_get(hass)
+        ent_reg = er.async_get(hass)
+        for area_idx in range(100):
+            area = area_reg.async_create(f"Area {area_idx}")
+            for device_idx in range(20):
+                device = dr.DeviceEntry(
+                    area_id=area.id,
+                    config_entries={"benchmark"},
+                    identifiers={("benchmark", f"{area_idx}_{device_idx}")},
+                )
+                dev_reg.devices[device.id] = device
+                for entity_idx in range(6):
+                    ent_reg.async_get_or_create(
+                        "sensor",
+                        "benchmark",
+                        f"{area_idx}_{device_idx}_{entity_idx}",
+                        device_id=device.id,
+                    )
+        service_call = core.ServiceCall("light", "turn_on", {"area_id": area.id})
+
+        start = timer()
+
+        for _ in range(10**4):
+            async_extract_referenced_entity_ids(hass, service_call, False)
+
+        runtime = timer() - start
+        await hass.async_stop()
+
+    return runtime
+
+
+async def _register_light_turn_on(hass, cache_validation):
+    """Register a light.turn_on service with the schema of the light service."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.light import LIGHT_TURN_ON_SCHEMA
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+
+    @core.callback
+    def turn_on(call):
+        """Handle the service call."""
+
+    hass.services.async_register(
+        "light",
+        "turn_on",
+        turn_on,
+        cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA),
+        cache_validation=cache_validation,
+    )
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +534,406 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def subscribe_entities_reconnect(hass):
+    """Subscribe 1000 reconnecting clients to the entities of 5000 states.
+
+    A state changes after every tenth client.
+    """
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.auth import models as auth_models
+    from homeassistant.components.websocket_api import const as ws_const
+    from homeassistant.components.websocket_api.commands import (
+        handle_subscribe_entities,
+    )
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    for idx in range(5000):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx}",
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Benchmark {idx}"},
+        )
+    hass.data[ws_const.DOMAIN] = {}
+    user = auth_models.User(name="Benchmark", perm_lookup=None, is_owner=True)
+    refresh_token = auth_models.RefreshToken(
+        user=user, client_id=None, access_token_expiration=timedelta(minutes=30)
+    )
+    sent = 0
+
+    def send_message(message):
+        """Count the sent messages."""
+        nonlocal sent
+        sent += 1
+
+    start = timer()
+
+    for idx in range(1000):
+        if not idx % 10:
+            hass.states.async_set("sensor.benchmark_0", str(idx))
+        connection = ActiveConnection(
+            logging.getLogger(__name__), hass, send_message, user, refresh_token
+        )
+        handle_subscribe_entities(
+            hass, connection, {"id": 1, "type": "subscribe_entities"}
+        )
+        for unsub in connection.subscriptions.values():
+            unsub()
+
+    runtime = timer() - start
+    assert sent == 2000
+    return runtime
+
+
+@benchmark
+async def state_diff_messages_json(hass):
+    """Encode 10k state diffs as JSON for 10 connections each."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import (
+        cached_state_diff_message,
+    )
+
+    def encode(iden, event):
+        # aiohttp encodes text frames to UTF-8 for every connection
+        return cached_state_diff_message(iden, event).encode()
+
+    return await _state_diff_messages(hass, encode)
+
+
+@benchmark
+async def state_diff_messages_msgpack(hass):
+    """Encode 10k state diffs as MessagePack for 10 connections each."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import (
+        cached_state_diff_msgpack,
+    )
+
+    return await _state_diff_messages(hass, cached_state_diff_msgpack)
+
+
+async def _state_diff_messages(hass, encode):
+    """Encode 10k state diffs for 10 connections each."""
+    events = []
+
+    @core.callback
+    def listen(event):
+        """Collect the state changed events."""
+        events.append(event)
+
+    for idx in range(100):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx}",
+            "0",
+            {
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "friendly_name": f"Benchmark {idx}",
+            },
+        )
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listen, run_immediately=True)
+    for value in range(100):
+        for idx in range(100):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx}",
+                str(value / 10),
+                {
+                    "unit_of_measurement": "W",
+                    "device_class": "power",
+                    "state_class": "measurement",
+                    "friendly_name": f"Benchmark {idx}",
+                },
+            )
+    size = 0
+
+    start = timer()
+
+    for event in events:
+        for iden in range(10):
+            size += len(encode(iden, event))
+
+    runtime = timer() - start
+    print(f"Bytes per message: {size / len(events) / 10:.1f}")
+    return runtime
+
+
+@benchmark
+async def entity_registry_rename(hass):
+    """Save the entity registry of 12k entities after each of 100 renames."""
+    return await _entity_registry_rename(hass, True)
+
+
+@benchmark
+async def entity_registry_rename_snapshot(hass):
+    """Save the entity registry of 12k entities after each of 100 renames.
+
+    The store writes the whole registry on every save.
+    """
+    return await _entity_registry_rename(hass, False)
+
+
+async def _entity_registry_rename(hass, journal):
+    """Save the entity registry of 12k entities after each of 100 renames."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er
+
+    def bytes_written():
+        """Return the bytes the process wrote so far."""
+        with open("/proc/self/io", encoding="utf-8") as fdesc:
+            for line in fdesc:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+        raise RuntimeError("Bytes written are not available")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        await er.async_load(hass)
+        ent_reg = er.async_get(hass)
+        # pylint: disable=protected-access
+        ent_reg._store._journal = journal
+        entity_ids = [
+            ent_reg.async_get_or_create(
+                "sensor",
+                "benchmark",
+                str(idx),
+                original_name=f"Benchmark sensor {idx}",
+            ).entity_id
+            for idx in range(12000)
+        ]
+        # The first save writes a snapshot
+        await ent_reg._store.async_save(ent_reg._data_to_save())
+        written = await hass.async_add_executor_job(bytes_written)
+
+        start = timer()
+
+        for idx, entity_id in enumerate(entity_ids[:100]):
+            ent_reg.async_update_entity(entity_id, name=f"Renamed {idx}")
+            await ent_reg._store.async_save(ent_reg._data_to_save())
+
+        runtime = timer() - start
+        written = await hass.async_add_executor_job(bytes_written) - written
+        await hass.async_stop()
+
+    print(f"Bytes written per rename: {written / 100:.0f}")
+    return runtime
+
+
+@benchmark
+async def state_memory(hass):
+    """Measure memory held by 50k states of 5k entities.
+
+    Every state is kept referenced, like a tracker holding a history, and
+    only the state changes while the attributes stay the same.
+    """
+    entity_count = 5000
+    states_per_entity = 10
+    attributes = {
+        "friendly_name": "Plug power",
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "icon": "mdi:flash",
+    }
+    for idx in range(entity_count):
+        hass.states.async_set(f"sensor.plug_{idx}_power", "0", attributes)
+
+    held_states = []
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    start = timer()
+
+    for value in range(1, states_per_entity + 1):
+        for idx in range(entity_count):
+            entity_id = f"sensor.plug_{idx}_power"
+            hass.states.async_set(entity_id, str(value), dict(attributes))
+            held_states.append(hass.states.get(entity_id))
+    for state in held_states:
+        state.as_compressed_state  # noqa: B018
+
+    runtime = timer() - start
+    used_memory = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+    print(f"Bytes per State: {used_memory / len(held_states):.0f}")
+
+    return runtime
+
+
+@benchmark
+async def recorder_state_changes(hass):
+    """Record 50k state changes of 2k entities.
+
+    Every state change flips an attribute between two values. The database
+    defaults to SQLite, set RECORDER_DB_URL to benchmark MariaDB,
+    MySQL or PostgreSQL.
+    """
+    entity_count = 2000
+    changes_per_entity = 25
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        instance = await _async_setup_recorder(hass, tmp_dir)
+        attributes = {"unit_of_measurement": "W", "device_class": "power"}
+
+        start = timer()
+
+        for value in range(changes_per_entity):
+            for idx in range(entity_count):
+                hass.states.async_set(
+                    f"sensor.plug_{idx}_power",
+                    str(value),
+                    {**attributes, "voltage": 230 + value % 2},
+                )
+            # Let the loop run like it would between state changes
+            await asyncio.sleep(0)
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        print(f"Events per second: {entity_count * changes_per_entity / runtime:.0f}")
+        await hass.async_stop()
+
+    return runtime
+
+
+@benchmark
+async def history_1m_states(hass):
+    """Fetch the history of 1M states of 1k entities in compressed format.
+
+    Every entity changes between 5 attribute sets. The rows are decoded by
+    name one at a time like before, then by position. The database defaults
+    to SQLite, set RECORDER_DB_URL to benchmark MariaDB, MySQL or PostgreSQL.
+    """
+    # pylint: disable=import-outside-toplevel
+    from unittest.mock import patch
+
+    from sqlalchemy import insert
+
+    from homeassistant.components.recorder import history
+    from homeassistant.components.recorder.db_schema import (
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.history import modern
+    from homeassistant.components.recorder.models import row_to_compressed_state
+
+    # pylint: enable=import-outside-toplevel
+
+    entity_count = 1000
+    states_per_entity = 1000
+    attribute_sets = 5
+    entity_ids = [f"sensor.plug_{idx}_power" for idx in range(entity_count)]
+    start_ts = dt_util.utcnow().timestamp() - states_per_entity - 1
+
+    def _insert_states() -> None:
+        with instance.engine.begin() as conn:
+            conn.execute(
+                insert(StatesMeta),
+                [{"entity_id": entity_id} for entity_id in entity_ids],
+            )
+            conn.execute(
+                insert(StateAttributes),
+                [
+                    {
+                        "hash": idx,
+                        "shared_attrs": json.dumps(
+                            {
+                                "unit_of_measurement": "W",
+                                "device_class": "power",
+                                "friendly_name": f"Plug {idx // attribute_sets}",
+                                "voltage": 230 + idx % attribute_sets,
+                            }
+                        ),
+                    }
+                    for idx in range(entity_count * attribute_sets)
+                ],
+            )
+            for offset in range(states_per_entity):
+                conn.execute(
+                    insert(States),
+                    [
+                        {
+                            "metadata_id": idx + 1,
+                            "state": str(offset),
+                            "attributes_id": idx * attribute_sets
+                            + offset % attribute_sets
+                            + 1,
+                            "last_updated_ts": start_ts + offset + 1,
+                            "last_changed_ts": start_ts + offset + 1 - offset % 2,
+                        }
+                        for idx in range(entity_count)
+                    ],
+                )
+
+    def _rows_to_compressed_states_by_name(
+        rows, fields, attr_cache, start_time_ts, no_attributes
+    ):
+        """Decode the rows of an entity one at a time by name."""
+        entity_attr_cache = {}
+        for row in rows:
+            yield row_to_compressed_state(
+                row,
+                entity_attr_cache,
+                start_time_ts,
+                "",
+                row.state,
+                row.last_updated_ts,
+                no_attributes,
+            )
+
+    async def _async_fetch_states() -> float:
+        start = timer()
+        states = await instance.async_add_executor_job(
+            partial(
+                history.get_significant_states,
+                hass,
+                dt_util.utc_from_timestamp(start_ts),
+                entity_ids=entity_ids,
+                significant_changes_only=False,
+                compressed_state_format=True,
+            )
+        )
+        runtime = timer() - start
+        rows = sum(len(entity_states) for entity_states in states.values())
+        print(f"States per second: {rows / runtime:.0f}")
+        return runtime
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        instance = await _async_setup_recorder(hass, tmp_dir)
+        await instance.async_add_executor_job(_insert_states)
+
+        print("Decoding by name:")
+        with patch.object(
+            modern, "rows_to_compressed_states", _rows_to_compressed_states_by_name
+        ):
+            await _async_fetch_states()
+        print("Decoding by position:")
+        runtime = await _async_fetch_states()
+        await hass.async_stop()
+
+    return runtime
+
+
+async def _async_setup_recorder(hass, tmp_dir):
+    """Set up the recorder for a benchmark."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    hass.config.config_dir = tmp_dir
+    loader.async_setup(hass)
+    entity.async_setup(hass)
+    async_initialize_recorder(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    db_url = os.environ.get("RECORDER_DB_URL", f"sqlite:///{tmp_dir}/bench.db")
+    await async_setup_component(
+        hass, "recorder", {"recorder": {"db_url": db_url, "commit_interval": 1}}
+    )
+    await hass.async_start()
+    instance = recorder.get_instance(hass)
+    await instance.async_db_ready
+    await instance.async_block_till_done()
+    return instance
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
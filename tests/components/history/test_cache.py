@@ -0,0 +1,255 @@
+"""The tests for the history cache."""
+from datetime import timedelta
+import itertools
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.history import websocket_api
+from homeassistant.components.history.cache import (
+    TRIM_INTERVAL,
+    async_get_history_cache,
+)
+from homeassistant.components.recorder import Recorder, get_instance, history
+from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_loads
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+from tests.components.recorder.common import async_wait_recording_done
+from tests.typing import WebSocketGenerator
+
+
+async def test_history_cache_matches_database(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache answers history queries like the database does."""
+    await async_setup_component(
+        hass, "history", {"history": {"cache_window": {"hours": 1}}}
+    )
+    cache = async_get_history_cache(hass)
+    assert cache is not None
+
+    def _tick() -> None:
+        freezer.tick(timedelta(seconds=1))
+
+    _tick()
+    hass.states.async_set("sensor.test", "on", {"any": "attr"})
+    hass.states.async_set("climate.test", "heat", {"temperature": 20})
+    hass.states.async_set("sensor.gone", "1")
+    _tick()
+    hass.states.async_set("sensor.test", "off", {"any": "attr"})
+    _tick()
+    start_time = dt_util.utcnow()
+    _tick()
+    hass.states.async_set("sensor.test", "off", {"any": "changed"})
+    hass.states.async_set("climate.test", "heat", {"temperature": 21})
+    _tick()
+    hass.states.async_set(
+        "sensor.test", "on", {"any": "changed", ATTR_ATTRIBUTION: "unrecorded"}
+    )
+    hass.states.async_remove("sensor.gone")
+    _tick()
+    end_time = dt_util.utcnow()
+    _tick()
+    hass.states.async_set("sensor.test", "off", {"any": "changed"})
+    await async_wait_recording_done(hass)
+    entity_ids = ["sensor.test", "climate.test", "sensor.gone", "sensor.missing"]
+    # Entities the cache never saw are answered by the database
+    assert (
+        cache.async_get_significant_states(
+            start_time, None, entity_ids, True, True, False, False
+        )
+        is None
+    )
+    entity_ids.pop()
+
+    client = await hass_ws_client()
+    msg_id = 0
+    for options in itertools.product((True, False), repeat=4):
+        include_start_time_state, significant_changes_only = options[:2]
+        minimal_response, no_attributes = options[2:]
+        for end in (None, end_time):
+            db_states = json_loads(
+                websocket_api.JSON_DUMP(
+                    await get_instance(hass).async_add_executor_job(
+                        history.get_significant_states,
+                        hass,
+                        start_time,
+                        end,
+                        entity_ids,
+                        None,
+                        include_start_time_state,
+                        significant_changes_only,
+                        minimal_response,
+                        no_attributes,
+                        True,
+                    )
+                )
+            )
+            msg_id += 1
+            query = {
+                "id": msg_id,
+                "type": "history/history_during_period",
+                "start_time": start_time.isoformat(),
+                "entity_ids": entity_ids,
+                "include_start_time_state": include_start_time_state,
+                "significant_changes_only": significant_changes_only,
+                "minimal_response": minimal_response,
+                "no_attributes": no_attributes,
+            }
+            if end:
+                query["end_time"] = end.isoformat()
+            with patch.object(
+                websocket_api,
+                "_ws_get_significant_states",
+                side_effect=AssertionError("database queried"),
+            ):
+                await client.send_json(query)
+                response = await client.receive_json()
+            assert response["success"]
+            assert response["result"] == db_states, (options, end)
+
+
+async def test_history_cache_window(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache only answers queries within its window."""
+    setup_time = dt_util.utcnow()
+    await async_setup_component(
+        hass, "history", {"history": {"cache_window": {"hours": 1}}}
+    )
+    cache = async_get_history_cache(hass)
+    assert cache is not None
+    freezer.tick(timedelta(seconds=30))
+    for value in range(100):
+        hass.states.async_set("sensor.test", str(value % 10))
+        freezer.tick(timedelta(minutes=1))
+
+    # Nothing is cached before the cache started
+    before = setup_time - timedelta(seconds=1)
+    assert (
+        cache.async_get_significant_states(
+            before, None, ["sensor.test"], True, True, False, False
+        )
+        is None
+    )
+    assert len(cache) == 100
+
+    freezer.tick(TRIM_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    # The states of the last hour and the one before it are kept
+    assert len(cache) == 55
+    assert (
+        cache.async_get_significant_states(
+            dt_util.utcnow() - timedelta(minutes=70),
+            None,
+            ["sensor.test"],
+            True,
+            True,
+            False,
+            False,
+        )
+        is None
+    )
+    states = cache.async_get_significant_states(
+        dt_util.utcnow() - timedelta(minutes=30),
+        None,
+        ["sensor.test"],
+        True,
+        True,
+        True,
+        True,
+    )
+    assert states is not None
+    # The state at the start time and the 24 changes after it
+    assert len(states["sensor.test"]) == 25
+    assert "a" not in states["sensor.test"][0]
+    assert states["sensor.test"][1].keys() == {"s", "lu"}
+
+
+async def test_history_cache_recorder_disabled(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache does not answer for states the recorder did not write."""
+    await async_setup_component(
+        hass, "history", {"history": {"cache_window": {"hours": 1}}}
+    )
+    cache = async_get_history_cache(hass)
+    assert cache is not None
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.other", "a")
+    freezer.tick(timedelta(seconds=1))
+    before_disable = dt_util.utcnow()
+    freezer.tick(timedelta(seconds=1))
+
+    get_instance(hass).set_enable(False)
+    hass.states.async_set("sensor.test", "2")
+    freezer.tick(timedelta(seconds=1))
+    get_instance(hass).set_enable(True)
+    after_enable = dt_util.utcnow()
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.test", "3")
+    freezer.tick(timedelta(seconds=1))
+    await async_wait_recording_done(hass)
+
+    # The state written while disabled is never served
+    assert (
+        cache.async_get_significant_states(
+            before_disable, None, ["sensor.test"], True, True, False, False
+        )
+        is None
+    )
+    # The database has the state from before the gap at the start time
+    assert (
+        cache.async_get_significant_states(
+            after_enable, None, ["sensor.test"], True, True, False, False
+        )
+        is None
+    )
+    assert (
+        cache.async_get_significant_states(
+            after_enable, None, ["sensor.other"], True, True, False, False
+        )
+        is None
+    )
+    states = cache.async_get_significant_states(
+        dt_util.utcnow(), None, ["sensor.test"], True, True, False, False
+    )
+    assert states is not None
+    assert [state["s"] for state in states["sensor.test"]] == ["3"]
+
+
+async def test_history_cache_trims_recorded_entities(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache forgets the removed entities with the window."""
+    await async_setup_component(
+        hass, "history", {"history": {"cache_window": {"hours": 1}}}
+    )
+    cache = async_get_history_cache(hass)
+    assert cache is not None
+    for idx in range(10):
+        hass.states.async_set(f"sensor.test_{idx}", "on")
+        hass.states.async_remove(f"sensor.test_{idx}")
+    hass.states.async_set("sensor.kept", "on")
+    assert len(cache._recorded) == 11
+
+    freezer.tick(timedelta(hours=1) + TRIM_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert cache._recorded == {"sensor.kept": True}
@@ -1,14 +1,18 @@
 """The tests the History component websocket_api."""
 import asyncio
 from datetime import timedelta
+from typing import Any, cast
 from unittest.mock import patch
 
+from aiohttp import web
 from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
+from homeassistant.components.websocket_api import http
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -171,6 +175,116 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_resolution(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period returns statistics for a coarse resolution."""
+    now = dt_util.utcnow()
+    start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=3)
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    hass.states.async_set("sensor.power", "5", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.mode", "eco")
+    await async_recorder_block_till_done(hass)
+    metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": "sensor.power",
+        "unit_of_measurement": "W",
+    }
+    hourly = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour + 0.5,
+            "min": hour,
+            "max": hour + 1,
+        }
+        for hour in range(2)
+    ]
+    # No numeric states in the last hour
+    hourly.append(
+        {"start": start + timedelta(hours=2), "mean": None, "min": None, "max": None}
+    )
+    short_term = [
+        {
+            "start": start + timedelta(minutes=5 * idx),
+            "mean": idx + 0.5,
+            "min": idx,
+            "max": idx + 1,
+        }
+        for idx in range(3)
+    ]
+    get_instance(hass).async_import_statistics(metadata, hourly, Statistics)
+    get_instance(hass).async_import_statistics(
+        metadata, short_term, StatisticsShortTerm
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    query = {
+        "type": "history/history_during_period",
+        "start_time": start.isoformat(),
+        "entity_ids": ["sensor.power", "sensor.mode"],
+        "minimal_response": True,
+    }
+    await client.send_json({"id": 1, **query, "resolution": 7200})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.power": [
+            {
+                "s": "0.5",
+                "lu": start.timestamp(),
+                "mn": 0.0,
+                "mx": 1.0,
+                "a": {"unit_of_measurement": "W"},
+            },
+            {
+                "s": "1.5",
+                "lu": (start + timedelta(hours=1)).timestamp(),
+                "mn": 1.0,
+                "mx": 2.0,
+            },
+            # The states after the last compiled period
+            {
+                "s": "5",
+                "lu": hass.states.get("sensor.power").last_updated.timestamp(),
+            },
+        ],
+        "sensor.mode": [
+            {
+                "s": "eco",
+                "a": {},
+                "lu": hass.states.get("sensor.mode").last_updated.timestamp(),
+            }
+        ],
+    }
+
+    await client.send_json({"id": 2, **query, "resolution": 600})
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.power"]] == [
+        "0.5",
+        "1.5",
+        "2.5",
+        "5",
+    ]
+
+    # Fine resolutions need the states
+    await client.send_json({"id": 3, **query, "resolution": 10})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sensor.power"] == [
+        {
+            "s": "5",
+            "a": {"unit_of_measurement": "W"},
+            "lu": hass.states.get("sensor.power").last_updated.timestamp(),
+        }
+    ]
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -523,6 +637,139 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends the historical states in chunks."""
+    start_time = dt_util.utcnow() - timedelta(days=2)
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(250):
+        hass.states.async_set("sensor.one", str(value), attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    query = {
+        "type": "history/stream",
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
+        "significant_changes_only": False,
+        "minimal_response": True,
+    }
+    await client.send_json({"id": 1, **query})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    expected_states = response["event"]["states"]
+    assert len(expected_states["sensor.one"]) == 250
+
+    await client.send_json({"id": 2, **query, "chunk_size": 100})
+    response = await client.receive_json()
+    assert response["success"]
+    states: dict[str, list[dict[str, Any]]] = {}
+    chunks = []
+    for _ in range(4):
+        response = await client.receive_json()
+        assert response["id"] == 2
+        event = response["event"]
+        assert event["start_time"] == start_time.timestamp()
+        ((entity_id, chunk),) = event["states"].items()
+        assert event["end_time"] >= chunk[-1]["lu"]
+        chunks.append((entity_id, len(chunk)))
+        states.setdefault(entity_id, []).extend(chunk)
+
+    assert chunks == [
+        ("sensor.one", 100),
+        ("sensor.one", 100),
+        ("sensor.one", 50),
+        ("sensor.two", 1),
+    ]
+    assert states == expected_states
+
+    await client.send_json({"id": 3, **query, "chunk_size": 99})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_stream_chunked_slow_client(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream only reads the next chunk once the client keeps up."""
+    start_time = dt_util.utcnow() - timedelta(days=2)
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(500):
+        hass.states.async_set("sensor.one", str(value))
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    # The client reads nothing while the gate is closed
+    gate = asyncio.Event()
+    gate.set()
+    orig_send_str = web.WebSocketResponse.send_str
+
+    async def _gated_send_str(self, *args: Any, **kwargs: Any) -> None:
+        await gate.wait()
+        await orig_send_str(self, *args, **kwargs)
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ), patch.object(web.WebSocketResponse, "send_str", _gated_send_str), patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_DRAINED", 1
+    ):
+        client = await hass_ws_client()
+        instance = cast(http.WebSocketHandler, setup_instance)
+        message_queue = instance._message_queue
+
+        gate.clear()
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one"],
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "significant_changes_only": False,
+                "minimal_response": True,
+                "chunk_size": 100,
+            }
+        )
+        # The result is being sent, the first two chunks are queued and the
+        # stream waits for the client before it reads the others
+        for _ in range(100):
+            if len(message_queue) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        assert len(message_queue) == 2
+
+        gate.set()
+        response = await client.receive_json()
+        assert response["success"]
+        states: list[dict[str, Any]] = []
+        for _ in range(5):
+            response = await client.receive_json()
+            assert response["id"] == 1
+            states.extend(response["event"]["states"]["sensor.one"])
+
+    assert [state["s"] for state in states] == [str(value) for value in range(500)]
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
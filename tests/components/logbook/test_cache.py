@@ -0,0 +1,198 @@
+"""The tests for the logbook cache."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.cache import (
+    TRIM_INTERVAL,
+    async_get_logbook_cache,
+)
+from homeassistant.components.logbook.helpers import async_determine_event_types
+from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+from tests.components.recorder.common import async_wait_recording_done
+from tests.typing import WebSocketGenerator
+
+
+async def test_logbook_cache_matches_database(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache answers logbook queries like the database does."""
+    for comp in ("homeassistant", "automation"):
+        await async_setup_component(hass, comp, {})
+    await async_setup_component(
+        hass, "logbook", {"logbook": {"cache_window": {"hours": 1}}}
+    )
+    cache = async_get_logbook_cache(hass)
+    assert cache is not None
+
+    def _tick() -> None:
+        freezer.tick(timedelta(seconds=1))
+
+    _tick()
+    start_time = dt_util.utcnow()
+    _tick()
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("sensor.power", "1", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    _tick()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("sensor.power", "2", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    _tick()
+    context = Context(user_id="b400facee45711eaa9308bfd3d19e474")
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.mock"},
+        context=context,
+    )
+    _tick()
+    hass.states.async_set("light.kitchen", "off", context=context)
+    _tick()
+    await hass.services.async_call(
+        "logbook",
+        "log",
+        {"name": "Alarm", "message": "is triggered", "entity_id": "switch.test"},
+        blocking=True,
+    )
+    _tick()
+    end_time = dt_util.utcnow()
+    _tick()
+    hass.states.async_set("light.kitchen", "on")
+    await async_wait_recording_done(hass)
+
+    event_processor = EventProcessor(
+        hass,
+        async_determine_event_types(hass, None, None),
+        timestamp=True,
+        include_entity_name=False,
+    )
+    db_events = await get_instance(hass).async_add_executor_job(
+        event_processor.get_events, start_time, end_time
+    )
+    assert len(db_events) == 4
+    assert cache.async_get_events(start_time, end_time) == db_events
+    # Nothing is cached before the cache started
+    assert cache.async_get_events(start_time - timedelta(hours=1), end_time) is None
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api,
+        "_ws_formatted_get_events",
+        side_effect=AssertionError("database queried"),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/get_events",
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+            }
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == db_events
+
+    _tick()
+    with patch.object(
+        websocket_api,
+        "_ws_stream_get_events",
+        side_effect=AssertionError("database queried"),
+    ):
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "logbook/event_stream",
+                "start_time": start_time.isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+    assert "partial" not in response["event"]
+    assert response["event"]["events"][:4] == db_events
+    assert response["event"]["events"][4]["state"] == "on"
+
+
+async def test_logbook_cache_window(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache only answers queries within its window."""
+    await async_setup_component(
+        hass, "logbook", {"logbook": {"cache_window": {"hours": 1}}}
+    )
+    cache = async_get_logbook_cache(hass)
+    assert cache is not None
+    freezer.tick(timedelta(seconds=30))
+    for value in range(100):
+        hass.states.async_set("light.test", "on" if value % 2 else "off")
+        freezer.tick(timedelta(minutes=1))
+    # The first state has no old state and is not in the logbook
+    assert len(cache) == 99
+
+    freezer.tick(TRIM_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(cache) == 54
+    now = dt_util.utcnow()
+    assert cache.async_get_events(now - timedelta(minutes=70), now) is None
+    events = cache.async_get_events(now - timedelta(minutes=30), now)
+    assert events is not None
+    assert len(events) == 24
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"exclude": {"entities": ["light.excluded"]}}]
+)
+async def test_logbook_cache_recorder_filter(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache leaves out the entities the recorder does not record."""
+    await async_setup_component(
+        hass, "logbook", {"logbook": {"cache_window": {"hours": 1}}}
+    )
+    cache = async_get_logbook_cache(hass)
+    assert cache is not None
+
+    freezer.tick(timedelta(seconds=1))
+    start_time = dt_util.utcnow()
+    freezer.tick(timedelta(seconds=1))
+    for state in ("off", "on"):
+        hass.states.async_set("light.excluded", state)
+        hass.states.async_set("light.included", state)
+    await hass.services.async_call(
+        "logbook",
+        "log",
+        {"name": "Excluded", "message": "is logged", "entity_id": "light.excluded"},
+        blocking=True,
+    )
+    freezer.tick(timedelta(seconds=1))
+    end_time = dt_util.utcnow()
+    await async_wait_recording_done(hass)
+
+    event_processor = EventProcessor(
+        hass,
+        async_determine_event_types(hass, None, None),
+        timestamp=True,
+        include_entity_name=False,
+    )
+    db_events = await get_instance(hass).async_add_executor_job(
+        event_processor.get_events, start_time, end_time
+    )
+    assert [event["entity_id"] for event in db_events] == ["light.included"]
+    assert cache.async_get_events(start_time, end_time) == db_events
@@ -13,24 +13,31 @@ from homeassistant.components.profiler import (
     _LRU_CACHE_WRAPPER_OBJECT,
     _SQLALCHEMY_LRU_OBJECT,
     CONF_SECONDS,
+    SERVICE_DUMP_LISTENER_STATS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_START,
+    SERVICE_START_LISTENER_STATS,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_LISTENER_STATS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.polling import PollingStats, async_setup_polling_scheduler
+from homeassistant.helpers.timer_wheel import async_setup_timer_wheel
+from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -302,6 +309,123 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "sqlalchemy_test" in caplog.text
 
 
+async def test_listener_stats(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test recording, dumping and fetching listener stats."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/listener_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is False
+    assert response["result"]["stats"] == {}
+
+    with pytest.raises(HomeAssistantError, match="Listener stats not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_LISTENER_STATS, blocking=True
+        )
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_LISTENER_STATS, blocking=True)
+    with pytest.raises(HomeAssistantError, match="Listener stats already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_LISTENER_STATS, blocking=True
+        )
+
+    @callback
+    def _profiled_listener(event):
+        """Handle an event."""
+
+    hass.bus.async_listen("profiler_test_event", _profiled_listener)
+    hass.bus.async_fire("profiler_test_event")
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(DOMAIN, SERVICE_DUMP_LISTENER_STATS, blocking=True)
+    assert "_profiled_listener" in caplog.text
+
+    await client.send_json_auto_id({"type": "profiler/listener_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["running"] is True
+    listener_stats = next(
+        stats
+        for name, stats in result["stats"]["listener"].items()
+        if name.startswith("profiler_test_event ")
+        and name.endswith("_profiled_listener")
+    )
+    assert listener_stats["count"] == 1
+    assert sum(listener_stats["histogram"]) == 1
+    assert len(listener_stats["histogram"]) == len(result["buckets"]) + 1
+    assert f"{DOMAIN}.{SERVICE_DUMP_LISTENER_STATS}" in result["stats"]["service"]
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_LISTENER_STATS, blocking=True)
+    assert hass.job_profiler is None
+    with pytest.raises(HomeAssistantError, match="Listener stats not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_LISTENER_STATS, blocking=True
+        )
+
+    # The command is registered once and outlives the config entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    await client.send_json_auto_id({"type": "profiler/listener_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is False
+
+
+async def test_timer_wheel_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fetching the statistics of the timer wheel."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/timer_wheel_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"running": False, "stats": {}}
+
+    wheel = async_setup_timer_wheel(hass)
+    handle = wheel.call_later(60, lambda: None)
+    await client.send_json_auto_id({"type": "profiler/timer_wheel_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    assert response["result"]["stats"]["scheduled"] == 1
+    handle.cancel()
+    wheel.async_shutdown()
+
+
+async def test_polling_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fetching the polling statistics of the entity platforms."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/polling_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"running": False, "stats": {}}
+
+    scheduler = async_setup_polling_scheduler(hass)
+    stats = scheduler.stats["sensor.demo"] = PollingStats()
+    stats.async_record(0.5, 1.5)
+    await client.send_json_auto_id({"type": "profiler/polling_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    assert response["result"]["stats"] == {"sensor.demo": stats.as_dict()}
+
+
 async def test_log_object_sources(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
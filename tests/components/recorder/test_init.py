@@ -12,6 +12,8 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -60,7 +62,7 @@ from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
 )
-from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.util import bulk_insert_objects, session_scope
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_CLOSE,
@@ -112,16 +114,62 @@ def _default_recorder(hass):
         hass,
         auto_purge=True,
         auto_repack=True,
+        purge_by_range=False,
+        purge_time_budget=None,
         keep_days=7,
         commit_interval=1,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_read_workers=0,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
 
 
+async def test_read_connection_pool(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read only queries run on the read connection pool."""
+    if recorder_db_url == "sqlite://":
+        # The read connection pool is not used with in-memory databases
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass,
+        {recorder.CONF_DB_URL: recorder_db_url, recorder.CONF_DB_READ_WORKERS: 2},
+    )
+    assert instance.read_engine is not None
+
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> tuple[str, bool, list[str]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            on_read_pool = session.get_bind() is instance.read_engine
+            states = [state.state for state in session.query(States)]
+        return threading.current_thread().name, on_read_pool, states
+
+    thread_name, on_read_pool, states = await instance.async_add_read_executor_job(
+        _read_states
+    )
+    assert thread_name.startswith("DbReadWorker")
+    assert on_read_pool
+    assert states == ["on"]
+
+    # Sessions that may write still use the recorder connection
+    def _write_session_bind() -> Engine:
+        with session_scope(hass=hass) as session:
+            return session.get_bind()
+
+    assert (
+        await instance.async_add_read_executor_job(_write_session_bind)
+        is instance.engine
+    )
+
+
 async def test_shutdown_before_startup_finishes(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -378,11 +426,8 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass).states_manager._pending_inserts:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -420,11 +465,8 @@ def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass).states_manager._pending_inserts:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -449,6 +491,205 @@ def test_saving_state_with_sqlalchemy_exception(
     assert "SQLAlchemyError error processing task" not in caplog.text
 
 
+def test_saving_state_retried_after_rollback(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test states are inserted again when the commit was rolled back."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    attributes = {"test_attr": 5}
+    hass.states.set("test.recorder", "on", attributes)
+    wait_recording_done(hass)
+
+    session = instance.event_session
+    commit = session.commit
+    failures = []
+
+    def _rollback_once() -> None:
+        if not failures:
+            failures.append(True)
+            session.rollback()
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with patch("time.sleep"), patch.object(
+        session, "commit", side_effect=_rollback_once
+    ):
+        hass.states.set("test.recorder", "off", attributes)
+        wait_recording_done(hass)
+
+    assert failures
+    assert "Error executing query" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        states = {state.state: state for state in session.query(States)}
+        assert states.keys() == {"on", "off"}
+        assert states["off"].old_state_id == states["on"].state_id
+
+    hass.states.set("test.recorder", "on", attributes)
+    wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 3
+        assert db_states[2].old_state_id == db_states[1].state_id
+
+
+def test_saving_state_retried_after_rollback_with_new_rows(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test rows first flushed in a rolled back transaction are inserted again."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    hass.states.set("test.recorder", "on", {"test_attr": 5})
+    wait_recording_done(hass)
+
+    session = instance.event_session
+    commit = session.commit
+    failures = []
+
+    def _rollback_once() -> None:
+        if not failures:
+            failures.append(True)
+            session.rollback()
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with patch("time.sleep"), patch.object(
+        session, "commit", side_effect=_rollback_once
+    ):
+        hass.states.set("test.recorder", "off", {"test_attr": 6})
+        hass.states.set("test.brandnew", "on", {"test_attr": 7})
+        hass.bus.fire("brand_new_event", {"data": "new"})
+        wait_recording_done(hass)
+
+    assert failures
+    assert "Error executing query" in caplog.text
+    assert "Unrecoverable sqlite3 database corruption detected" not in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        states = {
+            (state.entity_id, state.state): state
+            for state in session.execute(
+                select(
+                    StatesMeta.entity_id,
+                    States.state,
+                    States.state_id,
+                    States.old_state_id,
+                    StateAttributes.shared_attrs,
+                )
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+            )
+        }
+        assert states.keys() == {
+            ("test.recorder", "on"),
+            ("test.recorder", "off"),
+            ("test.brandnew", "on"),
+        }
+        assert states[("test.recorder", "off")].shared_attrs == '{"test_attr":6}'
+        assert states[("test.brandnew", "on")].shared_attrs == '{"test_attr":7}'
+        assert (
+            states[("test.recorder", "off")].old_state_id
+            == states[("test.recorder", "on")].state_id
+        )
+        events = list(
+            session.execute(
+                select(EventTypes.event_type, EventData.shared_data)
+                .select_from(Events)
+                .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .outerjoin(EventData, Events.data_id == EventData.data_id)
+                .where(EventTypes.event_type == "brand_new_event")
+            )
+        )
+        assert events == [("brand_new_event", '{"data":"new"}')]
+
+    # The pending rows were committed with their new ids
+    hass.states.set("test.brandnew", "off", {"test_attr": 7})
+    hass.bus.fire("brand_new_event", {"data": "new"})
+    wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesMeta).count() == 2
+        assert session.query(StateAttributes).count() == 3
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data == '{"data":"new"}')
+            .count()
+        ) == 1
+        db_states = list(
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.brandnew")
+            .order_by(States.state_id)
+        )
+        assert len(db_states) == 2
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[1].attributes_id == db_states[0].attributes_id
+
+
+def test_saving_state_retried_after_failed_insert(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test states are not inserted twice when inserting the events failed."""
+    hass = hass_recorder()
+    failures = []
+
+    def _fail_events_once(session, objects, return_ids=False):
+        if not failures:
+            failures.append(True)
+            raise OperationalError("insert events", "fake params", "forced to fail")
+        bulk_insert_objects(session, objects, return_ids)
+
+    with patch("time.sleep"), patch.object(
+        recorder.core, "bulk_insert_objects", side_effect=_fail_events_once
+    ):
+        hass.states.set("test.recorder", "on", {})
+        wait_recording_done(hass)
+
+    assert failures
+    assert "Error executing query" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 1
+
+
+def test_saving_state_retried_in_open_transaction(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test states and events are not inserted twice when the transaction is still open."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    session = instance.event_session
+    commit = session.commit
+    failures = []
+
+    def _fail_once() -> None:
+        if not failures:
+            failures.append(True)
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with patch("time.sleep"), patch.object(session, "commit", side_effect=_fail_once):
+        hass.bus.fire("brand_new_event", {"data": "new"})
+        hass.states.set("test.recorder", "on", {"test_attr": 5})
+        wait_recording_done(hass)
+
+    assert failures
+    assert "Error executing query" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 1
+        assert session.query(StateAttributes).count() == 1
+        assert (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "brand_new_event")
+            .count()
+        ) == 1
+
+
 async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -1144,6 +1385,52 @@ def test_auto_purge_no_auto_repack_on_not_second_sunday(
     dt_util.set_default_time_zone(original_tz)
 
 
+@pytest.mark.parametrize("enable_nightly_purge", [True])
+def test_auto_purge_with_time_budget(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test the budgeted purge runs every five minutes instead of nightly."""
+    hass = hass_recorder({"purge_time_budget": {"seconds": 10}})
+
+    original_tz = dt_util.DEFAULT_TIME_ZONE
+
+    tz = dt_util.get_time_zone("Europe/Copenhagen")
+    dt_util.set_default_time_zone(tz)
+
+    now = dt_util.utcnow()
+    test_time = datetime(now.year + 2, 1, 1, 4, 7, 0, tzinfo=tz)
+    run_tasks_at_time(hass, test_time)
+    hass.block_till_done()
+    # Nothing is left to purge in the new database
+    assert hass.states.get("sensor.recorder_purge_lag").state == "0"
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data_with_budget",
+        return_value=False,
+    ) as purge_old_data_with_budget, patch(
+        "homeassistant.components.recorder.purge.find_purge_lag",
+        return_value=3600,
+    ), patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data, patch(
+        "homeassistant.components.recorder.tasks.periodic_db_cleanups"
+    ) as periodic_db_cleanups:
+        test_time = test_time.replace(minute=10, second=10)
+        run_tasks_at_time(hass, test_time)
+        assert len(purge_old_data_with_budget.mock_calls) == 1
+        assert purge_old_data_with_budget.mock_calls[0][1][2] == timedelta(seconds=10)
+        hass.block_till_done()
+        assert hass.states.get("sensor.recorder_purge_lag").state == "3600"
+
+        # The nightly tasks only clean up, the purge already ran
+        test_time = test_time.replace(minute=12, second=0)
+        run_tasks_at_time(hass, test_time)
+        assert len(purge_old_data.mock_calls) == 0
+        assert len(periodic_db_cleanups.mock_calls) == 1
+
+    dt_util.set_default_time_zone(original_tz)
+
+
 @pytest.mark.parametrize("enable_nightly_purge", [True])
 def test_auto_purge_disabled(hass_recorder: Callable[..., HomeAssistant]) -> None:
     """Test periodic db cleanup still run when auto purge is disabled."""
@@ -1390,6 +1677,54 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+def test_saving_sets_old_state_inside_commit_interval(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test states inserted in bulk in one commit link to their old state."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "s1", {})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "s2", {})
+    hass.states.set("test.two", "s3", {})
+    hass.states.set("test.one", "s4", {"changed": True})
+    hass.states.set("test.one", "s5", {})
+    hass.states.set("test.two", "s6", {})
+    hass.states.remove("test.two")
+    hass.bus.fire("test_event", {"bulk": True})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 7
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s6"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s6"].state_id
+        events = list(
+            session.query(Events).filter(
+                Events.event_type_id.in_(select_event_type_ids(("test_event",)))
+            )
+        )
+        assert len(events) == 1
+        assert events[0].data_id is not None
+
+    hass.states.set("test.one", "s7", {})
+    wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        state = session.query(States).filter(States.state == "s7").one()
+        assert state.old_state_id == states_by_state["s5"].state_id
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
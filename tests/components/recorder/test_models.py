@@ -18,6 +18,8 @@ from homeassistant.components.recorder.models import (
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
+    row_to_compressed_state,
+    rows_to_compressed_states,
     ulid_to_bytes_or_none,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -370,6 +372,52 @@ async def test_lazy_state_handles_same_last_updated_and_last_changed(
     }
 
 
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_rows_to_compressed_states_matches_row_to_compressed_state(
+    no_attributes: bool,
+) -> None:
+    """Test decoding rows by position matches decoding them by name."""
+    now = dt_util.utcnow().timestamp()
+    fields = ("state", "attributes", "last_updated_ts", "last_changed_ts")
+    rows = [
+        PropertyMock(**dict(zip(fields, values)), values=values)
+        for values in (
+            ("on", '{"shared":true}', now, now),
+            ("off", '{"shared":true}', now + 1, now),
+            ("off", None, now + 2, None),
+            ("off", "{}", None, now - 1),
+            ("on", "{INVALID_JSON}", now + 3, now + 3),
+        )
+    ]
+    attr_cache: dict = {}
+    states = list(
+        rows_to_compressed_states(
+            (row.values for row in rows), fields, attr_cache, now - 5, no_attributes
+        )
+    )
+    assert states == [
+        row_to_compressed_state(
+            row,
+            {},
+            now - 5,
+            "sensor.any",
+            row.state,
+            row.last_updated_ts,
+            no_attributes,
+        )
+        for row in rows
+    ]
+    if not no_attributes:
+        assert states[0]["a"] is states[1]["a"]
+
+    # Rows without an attributes column decode to empty attributes
+    assert list(
+        rows_to_compressed_states(
+            [("on", now)], ("state", "last_updated_ts"), {}, None, False
+        )
+    ) == [{"s": "on", "a": {}, "lu": now}]
+
+
 @pytest.mark.parametrize(
     "time_zone", ["Europe/Berlin", "America/Chicago", "US/Hawaii", "UTC"]
 )
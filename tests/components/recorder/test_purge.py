@@ -2,7 +2,7 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -22,7 +22,12 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    BUDGETED_PURGE_MAX_BACKLOG,
+    find_purge_lag,
+    purge_old_data,
+    purge_old_data_with_budget,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -322,6 +327,143 @@ async def test_purge_old_events(
         assert events.count() == 2
 
 
+async def test_purge_by_range(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging expired state and event id ranges."""
+    instance = await async_setup_recorder_instance(hass, {"purge_by_range": True})
+    await async_wait_recording_done(hass)
+    # Remove the startup events so the test events have the oldest ids
+    with session_scope(hass=hass) as session:
+        session.query(Events).delete()
+
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+    await _add_test_statistics(hass)
+    await async_wait_recording_done(hass)
+
+    with patch.object(instance, "max_bind_vars", 2), session_scope(
+        hass=hass
+    ) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        statistics = session.query(StatisticsShortTerm)
+        assert states.count() == 6
+        assert events.count() == 6
+        assert statistics.count() == 6
+        state_ids = [state.state_id for state in states.order_by(States.state_id)]
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        with patch(
+            "homeassistant.components.recorder.purge._select_state_attributes_ids_to_purge",
+            side_effect=AssertionError("states purged by id"),
+        ), patch(
+            "homeassistant.components.recorder.purge._select_event_data_ids_to_purge",
+            side_effect=AssertionError("events purged by id"),
+        ):
+            finished = purge_old_data(
+                instance,
+                purge_before,
+                states_batch_size=2,
+                events_batch_size=2,
+                repack=False,
+            )
+        assert not finished
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+        assert events.count() == 2
+        assert statistics.count() == 2
+
+        # The first remaining state no longer refers to a purged state
+        dontpurgeme_4 = session.get(States, state_ids[4])
+        assert dontpurgeme_4.old_state_id is None
+        assert session.get(States, state_ids[5]).old_state_id == state_ids[4]
+        assert "test.recorder2" in instance.states_manager._last_committed_id
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == 2
+        assert events.count() == 2
+        assert statistics.count() == 2
+
+        purge_before = dt_util.utcnow()
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 0
+        assert state_attributes.count() == 0
+        assert "test.recorder2" not in instance.states_manager._last_committed_id
+
+
+async def test_purge_by_range_falls_back_to_ids(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states recorded out of order are purged by their ids."""
+    instance = await async_setup_recorder_instance(hass, {"purge_by_range": True})
+
+    await _add_test_states(hass)
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+    with freeze_time(eleven_days_ago):
+        hass.states.async_set("test.recorder2", "late", {"late": True})
+        await async_wait_recording_done(hass)
+
+    with patch.object(instance, "max_bind_vars", 4), session_scope(
+        hass=hass
+    ) as session:
+        states = session.query(States)
+        assert states.count() == 7
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert {state.state for state in states} == {"dontpurgeme_4", "dontpurgeme_5"}
+        assert session.query(StateAttributes).count() == 1
+
+
+async def test_purge_old_data_with_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the budgeted purge shrinks its batches and yields to the backlog."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with patch.object(instance, "max_bind_vars", 1), session_scope(
+        hass=hass
+    ) as session:
+        states = session.query(States)
+        assert states.count() == 6
+        assert find_purge_lag(instance, purge_before) == pytest.approx(
+            timedelta(days=7).total_seconds(), abs=1
+        )
+
+        with patch.object(
+            type(instance),
+            "backlog",
+            PropertyMock(return_value=BUDGETED_PURGE_MAX_BACKLOG),
+        ):
+            assert not purge_old_data_with_budget(
+                instance, purge_before, timedelta(seconds=10)
+            )
+        assert states.count() == 6
+
+        # A nearly full backlog purges a single state per batch
+        with patch.object(
+            type(instance),
+            "backlog",
+            PropertyMock(return_value=BUDGETED_PURGE_MAX_BACKLOG - 1),
+        ):
+            assert not purge_old_data_with_budget(instance, purge_before, timedelta(0))
+        assert states.count() == 5
+
+        assert purge_old_data_with_budget(instance, purge_before, timedelta(minutes=1))
+        assert states.count() == 2
+        assert find_purge_lag(instance, purge_before) == 0
+
+
 async def test_purge_old_recorder_runs(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
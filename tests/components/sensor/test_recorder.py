@@ -2,7 +2,9 @@
 from collections.abc import Callable
 from datetime import datetime, timedelta
 import math
+from pathlib import Path
 from statistics import mean
+import threading
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -11,6 +13,9 @@ import pytest
 
 from homeassistant import loader
 from homeassistant.components.recorder import (
+    CONF_COMMIT_INTERVAL,
+    CONF_DB_READ_WORKERS,
+    CONF_DB_URL,
     DOMAIN as RECORDER_DOMAIN,
     Recorder,
     history,
@@ -32,7 +37,11 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -525,6 +534,103 @@ def test_compile_hourly_statistics_only_state_is_and_end_of_period(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_in_read_worker_shards(
+    hass_recorder: Callable[..., HomeAssistant],
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test compiling statistics in shards in the read workers."""
+    if recorder_db_url == "sqlite://":
+        # The read connection pool is not used with in-memory databases
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    zero = dt_util.utcnow()
+    hass = hass_recorder({CONF_DB_URL: recorder_db_url, CONF_DB_READ_WORKERS: 2})
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    with freeze_time(zero) as freezer:
+        for entity_id in ("sensor.test1", "sensor.test2"):
+            record_states(hass, freezer, zero, entity_id, TEMPERATURE_SENSOR_ATTRIBUTES)
+        record_states(
+            hass,
+            freezer,
+            zero,
+            "sensor.test3",
+            ENERGY_SENSOR_ATTRIBUTES,
+            seq=[10, 20, 30],
+        )
+
+    compile_threads: list[str] = []
+    compile_statistics = sensor_recorder._compile_statistics
+
+    def _compile_statistics(*args):
+        compile_threads.append(threading.current_thread().name)
+        return compile_statistics(*args)
+
+    with patch.object(sensor_recorder, "MIN_STATISTICS_SHARD_SIZE", 1), patch.object(
+        sensor_recorder, "_compile_statistics", _compile_statistics
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        wait_recording_done(hass)
+        do_adhoc_statistics(hass, start=zero + timedelta(minutes=5))
+        wait_recording_done(hass)
+
+    # Two shards for each period
+    assert len(compile_threads) == 4
+    assert all(name.startswith("DbReadWorker") for name in compile_threads)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats.keys() == {"sensor.test1", "sensor.test2", "sensor.test3"}
+    for entity_id in ("sensor.test1", "sensor.test2"):
+        assert [stat["mean"] for stat in stats[entity_id]] == [
+            pytest.approx(13.050847),
+            pytest.approx(30),
+        ]
+    # The sum of the second period continues from the first period
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.test3"]] == [
+        (30, 20),
+        (30, 20),
+    ]
+
+
+def test_compile_statistics_in_read_worker_shards_uncommitted(
+    hass_recorder: Callable[..., HomeAssistant],
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test the shards see the states the recorder did not commit yet."""
+    if recorder_db_url == "sqlite://":
+        # The read connection pool is not used with in-memory databases
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    zero = dt_util.utcnow()
+    hass = hass_recorder(
+        {
+            CONF_COMMIT_INTERVAL: 3600,
+            CONF_DB_URL: recorder_db_url,
+            CONF_DB_READ_WORKERS: 2,
+        }
+    )
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    instance = get_instance(hass)
+    # Without the states in the database the current state would be used
+    for minutes, state in ((1, "10"), (3, "20")):
+        with freeze_time(zero + timedelta(minutes=minutes)):
+            for entity_id in ("sensor.test1", "sensor.test2"):
+                hass.states.set(entity_id, state, TEMPERATURE_SENSOR_ATTRIBUTES)
+            hass.block_till_done()
+            instance.block_till_done()
+    assert instance._event_session_has_pending_writes
+
+    with patch.object(sensor_recorder, "MIN_STATISTICS_SHARD_SIZE", 1):
+        do_adhoc_statistics(hass, start=zero)
+        hass.block_till_done()
+        instance.block_till_done()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats.keys() == {"sensor.test1", "sensor.test2"}
+    for entity_id in ("sensor.test1", "sensor.test2"):
+        assert [stat["mean"] for stat in stats[entity_id]] == [pytest.approx(15)]
+
+
 @pytest.mark.parametrize(
     ("device_class", "state_unit", "display_unit", "statistics_unit", "unit_class"),
     [
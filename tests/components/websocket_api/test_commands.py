@@ -5,6 +5,7 @@ import datetime
 import logging
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+import msgpack
 import pytest
 import voluptuous as vol
 
@@ -1128,6 +1129,49 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_msgpack(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities with MessagePack messages."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "supported_features",
+            "features": {const.FEATURE_MSGPACK: 1},
+        }
+    )
+    msg = msgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg["id"] == 6
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = msgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = msgpack.unpackb(await websocket_client.receive_bytes())
+    original_state = hass.states.get("light.permitted")
+    assert msg == {
+        "id": 7,
+        "type": "event",
+        "event": {"a": json_loads(f"{{{original_state.as_compressed_state_json}}}")},
+    }
+
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    msg = msgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        }
+    }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
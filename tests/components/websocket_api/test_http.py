@@ -2,9 +2,10 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+import msgpack
 import pytest
 
 from homeassistant.components.websocket_api import (
@@ -14,10 +15,11 @@ from homeassistant.components.websocket_api import (
     websocket_command,
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.http import _coalesce_messages
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
 
-from tests.common import async_fire_time_changed
+from tests.common import MockUser, async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
 
 
@@ -346,6 +348,58 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_wait_for_drain(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting for the client to read the pending messages."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ), patch("homeassistant.components.websocket_api.http.PENDING_MSG_DRAINED", 2):
+        websocket_client = await hass_ws_client()
+        instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+        connection = cast(ActiveConnection, instance._connection)
+
+        # Nothing is pending
+        await connection.async_wait_for_drain()
+
+        # Queue messages without waking up the writer
+        for idx in range(5):
+            instance._message_queue.append(f'{{"id":{idx}}}')
+        waiters = [
+            asyncio.create_task(connection.async_wait_for_drain()) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert not any(waiter.done() for waiter in waiters)
+
+        # A waiter that gives up does not affect the others
+        waiters.pop().cancel()
+        await asyncio.sleep(0)
+
+        instance._send_message({"id": 5})
+        for idx in range(6):
+            assert (await websocket_client.receive_json())["id"] == idx
+        await asyncio.wait_for(waiters[0], 1)
+
+        # Closing the connection releases the waiters
+        for idx in range(5):
+            instance._message_queue.append(f'{{"id":{idx}}}')
+        waiter = asyncio.create_task(connection.async_wait_for_drain())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        instance._cancel()
+        await asyncio.wait_for(waiter, 1)
+        await connection.async_wait_for_drain()
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -431,6 +485,68 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_connection_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the statistics of coalesced messages."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    await websocket_client.send_json(
+        {"id": 2, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for _ in range(50):
+        hass.bus.async_fire("test_event")
+    received = 0
+    while received < 50:
+        msg = await websocket_client.receive_json()
+        received += len(msg) if isinstance(msg, list) else 1
+
+    await websocket_client.send_json({"id": 3, "type": "connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    stats = msg["result"][0]
+    assert stats["coalesce"] is True
+    # auth_required, auth_ok, two results and the events
+    assert stats["messages_sent"] == 54
+    assert stats["frames_sent"] < stats["messages_sent"]
+    assert stats["coalesce_ratio"] > 1
+    assert stats["peak_queue_size"] > 1
+    assert stats["characters_sent"] > 0
+
+
+async def test_connection_stats_requires_admin(
+    websocket_client: MockHAClientWebSocket, hass_admin_user: MockUser
+) -> None:
+    """Test getting the connection statistics without being admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "connection_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+def test_coalesce_messages() -> None:
+    """Test coalescing keeps the order of JSON and MessagePack messages."""
+    packed = [msgpack.packb({"id": idx}) for idx in range(3)]
+    frames = _coalesce_messages(
+        ['{"id":10}', '{"id":11}', packed[0], packed[1], '{"id":12}', packed[2]]
+    )
+    assert frames == ['[{"id":10},{"id":11}]', ANY, '{"id":12}', packed[2]]
+    assert msgpack.unpackb(frames[1]) == [{"id": 0}, {"id": 1}]
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
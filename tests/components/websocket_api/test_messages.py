@@ -1,14 +1,25 @@
 """Test Websocket API messages module."""
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from unittest.mock import patch
+from uuid import UUID
+
+import msgpack
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_msgpack,
+    construct_event_msgpack,
     message_to_json,
+    message_to_msgpack,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -254,5 +265,101 @@ async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
     assert "Unable to serialize to JSON" in caplog.text
 
 
+class _Color(Enum):
+    """An enum to serialize."""
+
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    """A dataclass to serialize."""
+
+    x: int
+    color: _Color
+
+
+async def test_message_to_msgpack(caplog: pytest.LogCaptureFixture) -> None:
+    """Test we pack the types orjson serializes like orjson does."""
+    message = {
+        "id": 1,
+        "date": date(2023, 10, 1),
+        "time": time(12, 30),
+        "datetime": datetime(2023, 10, 1, 12, 30),
+        "enum": _Color.RED,
+        "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+        "point": _Point(1, _Color.RED),
+    }
+
+    packed = message_to_msgpack(message)
+
+    assert isinstance(packed, bytes)
+    assert msgpack.unpackb(packed) == {
+        "id": 1,
+        "date": "2023-10-01",
+        "time": "12:30:00",
+        "datetime": "2023-10-01T12:30:00",
+        "enum": "red",
+        "uuid": "12345678-1234-5678-1234-567812345678",
+        "point": {"x": 1, "color": "red"},
+    }
+    assert msgpack.unpackb(packed) == msgpack.unpackb(
+        msgpack.packb(json_loads(message_to_json(message)))
+    )
+
+
+async def test_message_to_msgpack_falls_back_to_json() -> None:
+    """Test messages MessagePack can't pack are sent as JSON."""
+    with patch(
+        "homeassistant.components.websocket_api.messages.msgpack_dumps",
+        side_effect=TypeError,
+    ):
+        json_str = message_to_msgpack({"id": 1, "message": "xyz"})
+
+    assert json_str == '{"id":1,"message":"xyz"}'
+
+
+async def test_construct_event_msgpack() -> None:
+    """Test the packed event message matches packing the whole message."""
+    payload = msgpack.packb({"a": 1})
+
+    assert msgpack.unpackb(construct_event_msgpack(1234, payload)) == {
+        "id": 1234,
+        "type": "event",
+        "event": {"a": 1},
+    }
+
+
+async def test_cached_state_diff_msgpack(hass: HomeAssistant) -> None:
+    """Test state diffs are packed and fall back to JSON if they can't be."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    context = Context(user_id="user-id", id="parent-id")
+    hass.states.async_set(
+        "light.window", "on", {"point": _Point(1, _Color.RED)}, context=context
+    )
+    hass.states.async_set("light.window", "off", context=context)
+    await hass.async_block_till_done()
+
+    packed = cached_state_diff_msgpack(3, state_change_events[0])
+    assert isinstance(packed, bytes)
+    message = msgpack.unpackb(packed)
+    assert message["id"] == 3
+    assert message["type"] == "event"
+    assert message["event"]["a"]["light.window"]["a"] == {
+        "point": {"x": 1, "color": "red"}
+    }
+
+    with patch(
+        "homeassistant.components.websocket_api.messages.msgpack_dumps",
+        side_effect=TypeError,
+    ):
+        fallback = cached_state_diff_msgpack(3, state_change_events[1])
+    assert isinstance(fallback, str)
+    message = json_loads(fallback)
+    assert message["id"] == 3
+    assert message["type"] == "event"
+    assert message["event"]["c"]["light.window"]["+"]["s"] == "off"
+
+
 class _Unserializeable:
     """A class that cannot be serialized."""
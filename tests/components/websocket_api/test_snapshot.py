@@ -0,0 +1,76 @@
+"""Test the websocket state snapshot."""
+from unittest.mock import patch
+
+from homeassistant.components.websocket_api import snapshot
+from homeassistant.components.websocket_api.messages import (
+    construct_event_message,
+    construct_result_message,
+)
+from homeassistant.core import HomeAssistant
+
+
+def _joined_states(hass: HomeAssistant) -> tuple[str, str]:
+    """Join the JSON of the states of the state machine."""
+    states = hass.states.async_all()
+    return (
+        ",".join(state.as_dict_json for state in states),
+        ",".join(state.as_compressed_state_json for state in states),
+    )
+
+
+async def test_state_snapshot_follows_state_machine(hass: HomeAssistant) -> None:
+    """Test the snapshot matches the state machine after changes."""
+    for number in range(5):
+        hass.states.async_set(f"light.number_{number}", "on")
+
+    with patch.object(snapshot, "BLOCK_SIZE", 2):
+        state_snapshot = snapshot.async_get_state_snapshot(hass)
+        assert snapshot.async_get_state_snapshot(hass) is state_snapshot
+
+        def _assert_matches() -> None:
+            assert (
+                state_snapshot.async_get_dict_json(),
+                state_snapshot.async_get_compressed_state_json(),
+            ) == _joined_states(hass)
+
+        _assert_matches()
+        hass.states.async_set("light.number_1", "off", {"brightness": 5})
+        _assert_matches()
+        hass.states.async_set("light.number_5", "on")
+        _assert_matches()
+        hass.states.async_remove("light.number_2")
+        hass.states.async_remove("light.number_3")
+        _assert_matches()
+        hass.states.async_set("light.number_2", "off")
+        _assert_matches()
+        for number in range(6):
+            hass.states.async_remove(f"light.number_{number}")
+        assert state_snapshot.async_get_dict_json() == ""
+        hass.states.async_set("light.number_0", "off")
+        _assert_matches()
+
+
+async def test_state_snapshot_messages(hass: HomeAssistant) -> None:
+    """Test the messages are cached until the next state change."""
+    hass.states.async_set("light.kitchen", "on")
+    state_snapshot = snapshot.async_get_state_snapshot(hass)
+    dict_json, compressed_state_json = _joined_states(hass)
+
+    message = state_snapshot.async_get_states_message(5)
+    assert message == construct_result_message(5, f"[{dict_json}]")
+    assert state_snapshot.async_get_states_message(5) is message
+    assert state_snapshot.async_get_states_message(6) == construct_result_message(
+        6, f"[{dict_json}]"
+    )
+    message = state_snapshot.async_get_entities_message(5)
+    assert message == construct_event_message(5, f'{{"a":{{{compressed_state_json}}}}}')
+    assert state_snapshot.async_get_entities_message(5) is message
+
+    hass.states.async_set("light.kitchen", "off")
+    dict_json, compressed_state_json = _joined_states(hass)
+    assert state_snapshot.async_get_states_message(5) == construct_result_message(
+        5, f"[{dict_json}]"
+    )
+    assert state_snapshot.async_get_entities_message(5) == construct_event_message(
+        5, f'{{"a":{{{compressed_state_json}}}}}'
+    )
@@ -1066,6 +1066,52 @@ async def test_update(
     }
 
 
+async def test_devices_indexed_by_area_and_config_entry(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test the devices are found by area and config entry after updates."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+    entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [entry]
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+
+    entry = device_registry.async_update_device(
+        entry.id, area_id="kitchen", add_config_entry_id=config_entry_2.entry_id
+    )
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [entry]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [entry]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [entry]
+
+    entry = device_registry.async_update_device(
+        entry.id, area_id="office", remove_config_entry_id=config_entry_1.entry_id
+    )
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+    assert dr.async_entries_for_area(device_registry, "office") == [entry]
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_1.entry_id)
+        == []
+    )
+
+    device_registry.async_remove_device(entry.id)
+    assert dr.async_entries_for_area(device_registry, "office") == []
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_2.entry_id)
+        == []
+    )
+
+
 async def test_update_remove_config_entries(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry, update_events
 ) -> None:
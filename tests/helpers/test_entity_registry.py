@@ -1370,6 +1370,70 @@ async def test_disabled_entities_excluded_from_entity_list(
     assert entries == [entry1, entry2]
 
 
+async def test_entries_indexed_by_device_area_and_config_entry(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the entries are found by device, area and config entry after updates."""
+    config_entry_1 = MockConfigEntry(domain="light")
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry(domain="light")
+    config_entry_2.add_to_hass(hass)
+    device_1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:FF")},
+    )
+
+    entry = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        config_entry=config_entry_1,
+        device_id=device_1.id,
+    )
+    assert er.async_entries_for_device(entity_registry, device_1.id) == [entry]
+    assert er.async_entries_for_config_entry(
+        entity_registry, config_entry_1.entry_id
+    ) == [entry]
+    assert er.async_entries_for_area(entity_registry, "kitchen") == []
+
+    entry = entity_registry.async_update_entity(
+        entry.entity_id,
+        area_id="kitchen",
+        config_entry_id=config_entry_2.entry_id,
+        device_id=device_2.id,
+    )
+    assert er.async_entries_for_device(entity_registry, device_1.id) == []
+    assert er.async_entries_for_device(entity_registry, device_2.id) == [entry]
+    assert (
+        er.async_entries_for_config_entry(entity_registry, config_entry_1.entry_id)
+        == []
+    )
+    assert er.async_entries_for_config_entry(
+        entity_registry, config_entry_2.entry_id
+    ) == [entry]
+    assert er.async_entries_for_area(entity_registry, "kitchen") == [entry]
+
+    entry = entity_registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed"
+    )
+    assert er.async_entries_for_area(entity_registry, "kitchen") == [entry]
+    assert er.async_entries_for_device(entity_registry, device_2.id) == [entry]
+
+    entity_registry.async_remove(entry.entity_id)
+    assert er.async_entries_for_device(entity_registry, device_2.id) == []
+    assert er.async_entries_for_area(entity_registry, "kitchen") == []
+    assert (
+        er.async_entries_for_config_entry(entity_registry, config_entry_2.entry_id)
+        == []
+    )
+
+
 async def test_entity_max_length_exceeded(entity_registry: er.EntityRegistry) -> None:
     """Test that an exception is raised when the max character length is exceeded."""
 
@@ -32,6 +32,7 @@ from homeassistant.helpers.event import (
     async_track_same_state,
     async_track_state_added_domain,
     async_track_state_change,
+    async_track_state_change_batch,
     async_track_state_change_event,
     async_track_state_change_filtered,
     async_track_state_removed_domain,
@@ -522,6 +523,39 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_async_track_state_change_batch(hass: HomeAssistant) -> None:
+    """Test state changes in the same loop iteration are delivered as one batch."""
+    batches = []
+
+    @ha.callback
+    def batch_listener(events):
+        batches.append([event.data["entity_id"] for event in events])
+
+    unsub = async_track_state_change_batch(
+        hass, ["light.Bowl", "light.top", "light.side"], batch_listener
+    )
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.top", "on")
+    hass.states.async_set("switch.other", "on")
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert batches == [["light.bowl", "light.top", "light.bowl"]]
+
+    hass.states.async_set_many([("light.side", "on", None), ("light.top", "off", None)])
+    await hass.async_block_till_done()
+    assert batches[1] == ["light.side", "light.top"]
+
+    # Events that were not delivered yet are dropped on unsubscribe
+    hass.states.async_set("light.side", "off")
+    unsub()
+    hass.states.async_set("light.top", "on")
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+    assert async_track_state_change_batch(hass, [], batch_listener) is not None
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -1737,6 +1771,70 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_only_rerenders_on_read_fields(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are only re-rendered when a State field they read changes."""
+    hass.states.async_set("sensor.power_1", "5", {"voltage": 230})
+    hass.states.async_set("sensor.power_2", "10", {"voltage": 230})
+    state_template = Template(
+        "{{ states('sensor.power_1') | float + states('sensor.power_2') | float }}",
+        hass,
+    )
+    attribute_template = Template(
+        "{{ state_attr('sensor.power_1', 'voltage') }}",
+        hass,
+    )
+    runs = []
+
+    @ha.callback
+    def run_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend((update.template, update.result) for update in updates)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(state_template, None),
+            TrackTemplate(attribute_template, None),
+        ],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"sensor.power_1", "sensor.power_2"}
+
+    original_render_to_info = Template.async_render_to_info
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=original_render_to_info,
+    ) as render_to_info:
+
+        def _rendered() -> list[Template]:
+            return [call.args[0] for call in render_to_info.call_args_list]
+
+        # Only the attributes of sensor.power_2 change
+        hass.states.async_set("sensor.power_2", "10", {"voltage": 231})
+        await hass.async_block_till_done()
+        assert _rendered() == []
+
+        # Only the attributes of sensor.power_1 change
+        hass.states.async_set("sensor.power_1", "5", {"voltage": 231})
+        await hass.async_block_till_done()
+        assert _rendered() == [attribute_template]
+
+        hass.states.async_set("sensor.power_2", "20", {"voltage": 231})
+        await hass.async_block_till_done()
+        assert _rendered() == [attribute_template, state_template]
+
+    assert runs == [(attribute_template, 231), (state_template, 25.0)]
+
+    info.async_remove()
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -0,0 +1,122 @@
+"""Test the polling scheduler helper."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.polling import (
+    DATA_POLLING_SCHEDULER,
+    async_get_polling_scheduler,
+    async_setup_polling_scheduler,
+)
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockEntity, MockEntityPlatform, async_fire_time_changed
+
+
+async def test_polls_are_staggered(hass: HomeAssistant) -> None:
+    """Test the polls of a platform are spread over the scan interval."""
+    assert async_get_polling_scheduler(hass) is None
+    scheduler = async_setup_polling_scheduler(hass)
+    assert async_setup_polling_scheduler(hass) is scheduler
+    assert hass.data[DATA_POLLING_SCHEDULER] is scheduler
+
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=40))
+    entities = [MockEntity(should_poll=True) for _ in range(4)]
+    no_poll_entity = MockEntity(should_poll=False)
+    for entity in (*entities, no_poll_entity):
+        entity.async_update = AsyncMock()
+    await platform.async_add_entities([*entities, no_poll_entity])
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert [entity.async_update.call_count for entity in entities] == [1, 0, 0, 0]
+
+    # The polls are scheduled on the loop clock, relative to the interval
+    for polled in range(2, 5):
+        async_fire_time_changed(hass, now + timedelta(seconds=10 * (polled - 1)))
+        await hass.async_block_till_done()
+        assert [entity.async_update.call_count for entity in entities] == [1] * (
+            polled
+        ) + [0] * (4 - polled)
+
+    assert not no_poll_entity.async_update.called
+    stats = scheduler.async_stats()["test_domain.test_platform"]
+    assert stats["polls"] == 4
+    assert stats["skipped"] == 0
+
+    platform.async_unsub_polling()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=80))
+    await hass.async_block_till_done()
+    assert [entity.async_update.call_count for entity in entities] == [1] * 4
+
+
+async def test_entities_of_a_device_are_polled_together(
+    hass: HomeAssistant,
+) -> None:
+    """Test entities that share a device are polled in the same slot."""
+    async_setup_polling_scheduler(hass)
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=40))
+    entities = [MockEntity(should_poll=True) for _ in range(3)]
+    for entity in entities:
+        entity.async_update = AsyncMock()
+    await platform.async_add_entities(entities)
+    for entity in entities[:2]:
+        entity.registry_entry = er.RegistryEntry(
+            entity_id=entity.entity_id,
+            unique_id=entity.entity_id,
+            platform="test_platform",
+            device_id="device_1",
+        )
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert [entity.async_update.call_count for entity in entities] == [1, 1, 0]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert [entity.async_update.call_count for entity in entities] == [1, 1, 1]
+
+
+async def test_polls_are_capped_and_skipped(hass: HomeAssistant) -> None:
+    """Test polls per integration are capped and slow polls are not stacked."""
+    scheduler = async_setup_polling_scheduler(hass, max_polls_per_integration=1)
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    release = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def _slow_update() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+
+    entities = [MockEntity(should_poll=True) for _ in range(2)]
+    for entity in entities:
+        entity.async_update = _slow_update
+    await platform.async_add_entities(entities)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await asyncio.sleep(0)
+    assert running == 1
+
+    # The next interval starts while both polls are still waiting
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await asyncio.sleep(0)
+
+    release.set()
+    await hass.async_block_till_done()
+    assert max_running == 1
+    stats = scheduler.async_stats()["test_domain.test_platform"]
+    assert stats["polls"] == 2
+    assert stats["skipped"] == 2
+    assert stats["lateness_max"] > 0
+    platform.async_unsub_polling()
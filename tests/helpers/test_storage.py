@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+import random
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -16,7 +17,8 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.json import save_json
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import async_fire_time_changed, async_test_home_assistant
@@ -733,3 +735,136 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_journaled_store_round_trip(tmpdir: py.path.local) -> None:
+    """Test a journaled store loads the data of its last save."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+    rand = random.Random(42)
+    items = [{"id": str(number), "value": 0} for number in range(20)]
+    data: dict[str, Any] = {"items": items, "other": 0}
+    await store.async_save(data)
+    snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+
+    with patch.object(storage, "JOURNAL_COMPACT_RATIO", 100):
+        for number in range(1, 31):
+            items = [dict(item) for item in data["items"]]
+            for item in rand.sample(items, 3):
+                item["value"] = number
+            if number % 5 == 0:
+                rand.shuffle(items)
+            for _ in range(3):
+                items.insert(rand.randrange(len(items)), items.pop())
+            del items[rand.randrange(len(items))]
+            items.insert(rand.randrange(len(items)), {"id": f"new_{number}"})
+            data = {"items": items, "other": number}
+            if number % 10 == 0:
+                del data["other"]
+            await store.async_save(data)
+            loaded = await storage.Store(
+                hass, MOCK_VERSION, MOCK_KEY, journal=True
+            ).async_load()
+            assert loaded == data
+
+    # All saves were appended to the journal
+    assert (
+        await hass.async_add_executor_job(json_util.load_json, store.path) == snapshot
+    )
+    with open(journal_path, "rb") as fdesc:
+        assert len(fdesc.read().splitlines()) == 31
+
+    await store.async_remove()
+    assert not os.path.exists(store.path)
+    assert not os.path.exists(journal_path)
+
+    await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compaction(tmpdir: py.path.local) -> None:
+    """Test a journaled store writes a new snapshot when the journal grows."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+
+    def _journal_lines() -> int:
+        with open(journal_path, "rb") as fdesc:
+            return len(fdesc.read().splitlines())
+
+    items = [{"id": str(number), "name": "x" * 50} for number in range(10)]
+    await store.async_save({"items": items})
+    assert _journal_lines() == 1
+    # Saving unchanged data appends nothing
+    await store.async_save({"items": items})
+    assert _journal_lines() == 1
+
+    for number in range(20):
+        items[0] = {"id": "0", "name": str(number) * 50}
+        await store.async_save({"items": items})
+        if _journal_lines() == 1:
+            break
+    else:
+        pytest.fail("journal was not compacted")
+    snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert snapshot["data"] == {"items": items}
+
+    # A new store starts with a snapshot
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store.async_load() == {"items": items}
+    await store.async_save({"items": items[1:]})
+    assert _journal_lines() == 1
+    assert await store.async_load() == {"items": items[1:]}
+
+    await hass.async_stop(force=True)
+
+
+async def test_journaled_store_interrupted_writes(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a journaled store loads the data written before an interruption."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+    await store.async_save({"items": [{"id": "1"}], "other": 1})
+    await store.async_save({"items": [{"id": "1"}, {"id": "2"}], "other": 2})
+
+    # An interrupted append leaves an incomplete record
+    with open(journal_path, "ab") as fdesc:
+        fdesc.write(b'{"other":{"val')
+    loaded = await storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal=True
+    ).async_load()
+    assert loaded == {"items": [{"id": "1"}, {"id": "2"}], "other": 2}
+    assert "Ignoring incomplete journal record of storage-test" in caplog.text
+
+    # A snapshot written without its journal ignores the previous journal
+    snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+    snapshot["journal_id"] = "new"
+    await hass.async_add_executor_job(save_json, store.path, snapshot)
+    loaded = await storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal=True
+    ).async_load()
+    assert loaded == {"items": [{"id": "1"}], "other": 1}
+
+    await hass.async_stop(force=True)
+
+
+async def test_journaled_store_requires_default_encoder(hass: HomeAssistant) -> None:
+    """Test a journaled store can't use a custom encoder."""
+    with pytest.raises(ValueError):
+        storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True, encoder=json.JSONEncoder
+        )
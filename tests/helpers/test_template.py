@@ -246,6 +246,26 @@ def test_iterating_domain_states(hass: HomeAssistant) -> None:
     )
 
 
+def test_render_info_state_fields(hass: HomeAssistant) -> None:
+    """Test the State fields read during a render are collected."""
+    hass.states.async_set("sensor.power", "5", {"friendly_name": "Power"})
+
+    info = render_to_info(hass, "{{ states.sensor | map(attribute='state') | list }}")
+    assert info.state_fields == frozenset({"state"})
+
+    info = render_to_info(
+        hass, "{{ state_attr('sensor.power', 'friendly_name') }} {{ states.sensor }}"
+    )
+    assert info.state_fields == frozenset({"attributes"})
+
+    info = render_to_info(hass, "{{ states.sensor | list }}")
+    assert info.state_fields == frozenset(template._COLLECTABLE_STATE_ATTRIBUTES)
+
+    info = render_to_info(hass, "{{ states.sensor.power.name }}")
+    assert info.state_fields == frozenset({"name"})
+    assert info.entities == frozenset({"sensor.power"})
+
+
 async def test_import(hass: HomeAssistant) -> None:
     """Test that imports work from the config/custom_templates folder."""
     await template.async_load_custom_templates(hass)
@@ -4073,27 +4093,39 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache() -> None:
+    """Test compiled templates are shared and kept in an LRU."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    template_cache = template._NO_HASS_ENV.template_cache
+
     tpl = template.Template(
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template_cache.get(template_string)
 
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl2._compiled_code is tpl._compiled_code
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template_cache.get(template_string)
+
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE_SIZE", 2), patch.object(
+        template, "_NO_HASS_ENV", template.TemplateEnvironment(None)
+    ):
+        template_cache = template._NO_HASS_ENV.template_cache
+        for number in range(3):
+            template.Template(f"{{{{ {number} }}}}").ensure_valid()
+        assert len(template_cache) == 2
+        assert "{{ 0 }}" not in template_cache
+        assert "{{ 1 }}" in template_cache
+        assert "{{ 2 }}" in template_cache
 
 
 def test_is_template_string() -> None:
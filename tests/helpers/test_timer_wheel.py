@@ -0,0 +1,190 @@
+"""Test the timer wheel helper."""
+import asyncio
+from datetime import timedelta
+import random
+from unittest.mock import Mock
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.timer_wheel import (
+    DATA_TIMER_WHEEL,
+    WHEEL_SIZE,
+    TimerWheel,
+    async_get_timer_wheel,
+    async_setup_timer_wheel,
+)
+
+
+class MockLoop:
+    """A loop with a time that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Initialize the loop."""
+        self.now = 1000.0
+        self.timer: asyncio.TimerHandle | None = None
+
+    def time(self) -> float:
+        """Return the loop time."""
+        return self.now
+
+    def call_at(self, when, callback_, *args):
+        """Schedule the single timer of the wheel."""
+        self.timer = asyncio.TimerHandle(when, callback_, args, Mock())
+        return self.timer
+
+    def advance(self, seconds: float) -> None:
+        """Move the time forward and run the timer of the wheel when due."""
+        end = self.now + seconds
+        while (
+            self.timer is not None
+            and not self.timer.cancelled()
+            and self.timer.when() <= end
+        ):
+            timer = self.timer
+            self.timer = None
+            self.now = max(self.now, timer.when())
+            timer._run()
+        self.now = end
+
+
+def test_timer_wheel_fires_in_order_and_never_early() -> None:
+    """Test timers on all levels fire in order, and not before they are due."""
+    loop = MockLoop()
+    wheel = TimerWheel(loop, 0.1)
+    fired = []
+    rnd = random.Random(42)
+    delays = [rnd.uniform(0, 3 * 24 * 3600) for _ in range(500)]
+    delays += [0.0, 0.05, 0.1, 6.4, 409.6, 26214.4]
+
+    for delay in delays:
+        wheel.call_later(
+            delay, lambda due: fired.append((loop.now, due)), loop.now + delay
+        )
+
+    assert len(wheel) == len(delays)
+    loop.advance(3 * 24 * 3600 + 1)
+
+    assert len(fired) == len(delays)
+    assert len(wheel) == 0
+    assert [due for _, due in fired] == sorted(due for _, due in fired)
+    for fired_at, due in fired:
+        assert due <= fired_at + 1e-6
+        assert fired_at - due <= 0.1 + 1e-6
+
+
+def test_timer_wheel_far_future() -> None:
+    """Test timers beyond the top level are parked until they are in range."""
+    loop = MockLoop()
+    wheel = TimerWheel(loop, 1)
+    fired = []
+    delay = 2 * WHEEL_SIZE**4
+
+    wheel.call_later(delay, fired.append, "far")
+    loop.advance(delay - 1)
+    assert fired == []
+    loop.advance(1)
+    assert fired == ["far"]
+
+
+def test_timer_wheel_cancel() -> None:
+    """Test cancelling timers, also from a timer in the same tick."""
+    loop = MockLoop()
+    wheel = TimerWheel(loop, 0.1)
+    fired = []
+
+    first = wheel.call_later(1, fired.append, "first")
+    wheel.call_later(1, lambda: second.cancel())
+    second = wheel.call_later(1, fired.append, "second")
+    wheel.call_later(1000, fired.append, "later").cancel()
+    first.cancel()
+    assert first.cancelled()
+    assert len(wheel) == 2
+
+    loop.advance(2000)
+    assert fired == []
+    assert len(wheel) == 0
+    assert second.cancelled()
+
+
+def test_timer_wheel_stats() -> None:
+    """Test callbacks that are due in the same tick fire as one batch."""
+    loop = MockLoop()
+    wheel = TimerWheel(loop, 0.1)
+    calls = Mock()
+
+    for _ in range(3):
+        wheel.call_later(0.01, calls)
+    wheel.call_later(10.03, calls)
+    wheel.call_later(10.07, calls)
+    wheel.call_later(20, calls)
+    loop.advance(30)
+
+    assert calls.call_count == 6
+    assert wheel.async_stats() == {
+        "scheduled": 0,
+        "ticks": 3,
+        "callbacks_fired": 6,
+        "fired_per_tick": {1: 1, 2: 1, 3: 1},
+    }
+
+
+def test_timer_wheel_exception() -> None:
+    """Test a failing timer does not stop the rest of the batch."""
+    loop = MockLoop()
+    wheel = TimerWheel(loop, 0.1)
+    calls = Mock()
+
+    wheel.call_later(1, Mock(side_effect=ValueError))
+    wheel.call_later(1, calls)
+    loop.advance(2)
+
+    assert calls.call_count == 1
+
+
+async def test_setup_timer_wheel(hass: HomeAssistant) -> None:
+    """Test the time helpers use the timer wheel once it is set up."""
+    assert async_get_timer_wheel(hass) is None
+    wheel = async_setup_timer_wheel(hass, 0.01)
+    assert async_setup_timer_wheel(hass) is wheel
+    assert hass.data[DATA_TIMER_WHEEL] is wheel
+
+    called = asyncio.Event()
+    interval_calls = []
+
+    @callback
+    def _interval(now):
+        interval_calls.append(now)
+
+    async_call_later(hass, 0.01, callback(lambda _: called.set()))
+    remove_interval = async_track_time_interval(
+        hass, _interval, timedelta(seconds=0.01)
+    )
+    remove_later = async_call_later(hass, 10, callback(lambda _: None))
+    assert len(wheel) == 3
+    remove_later()
+
+    async with asyncio.timeout(1):
+        await called.wait()
+        while len(interval_calls) < 2:
+            await asyncio.sleep(0.01)
+    remove_interval()
+    assert len(wheel) == 0
+    assert wheel.callbacks_fired >= 3
+    wheel.async_shutdown()
+
+
+async def test_timer_wheel_cancel_on_shutdown(hass: HomeAssistant) -> None:
+    """Test timers marked to cancel on shutdown are cancelled at stop."""
+    wheel = async_setup_timer_wheel(hass)
+
+    async_call_later(
+        hass, 10, HassJob(lambda _: None, "cancellable", cancel_on_shutdown=True)
+    )
+    async_call_later(hass, 10, HassJob(lambda _: None, "kept"))
+    assert len(wheel) == 2
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert len(wheel) == 1
+    wheel.async_shutdown()
@@ -15,6 +15,8 @@ from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.polling import async_get_polling_scheduler
+from homeassistant.helpers.timer_wheel import async_get_timer_wheel
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
 
@@ -510,6 +512,32 @@ async def test_setup_hass(
     assert len(mock_process_ha_config_upgrade.mock_calls) == 1
 
     assert hass == async_get_hass()
+    assert async_get_timer_wheel(hass) is None
+    assert async_get_polling_scheduler(hass) is None
+
+
+async def test_setup_hass_schedulers(
+    mock_hass_config: None,
+    mock_enable_logging: Mock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test the timer wheel and the polling scheduler are set up when enabled."""
+    hass = await bootstrap.async_setup_hass(
+        runner.RuntimeConfig(
+            config_dir=get_test_config_dir(),
+            skip_pip=True,
+            timer_wheel=True,
+            polling_scheduler=True,
+        ),
+    )
+    wheel = async_get_timer_wheel(hass)
+    assert wheel is not None
+    wheel.async_shutdown()
+    assert async_get_polling_scheduler(hass) is not None
 
 
 @pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
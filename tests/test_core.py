@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -31,6 +32,7 @@ from homeassistant.const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     MATCH_ALL,
     __version__,
 )
@@ -182,7 +184,7 @@ def test_async_create_task_schedule_coroutine_with_name(event_loop) -> None:
 
 def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(job_profiler=None)
     calls = []
 
     def job():
@@ -195,7 +197,7 @@ def test_async_run_hass_job_calls_callback() -> None:
 
 def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(job_profiler=None)
     calls = []
 
     def job():
@@ -798,6 +800,61 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_indexed_listener(hass: HomeAssistant) -> None:
+    """Test listeners indexed by a match key only see matching events."""
+    calls = []
+    filter_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        filter_calls.append(event)
+        return not event.data.get("filtered")
+
+    unsub = hass.bus.async_listen(
+        "test",
+        listener,
+        event_filter=filter,
+        match_key=("entity_id", "light.kitchen"),
+    )
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 0
+    assert len(filter_calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(filter_calls) == 2
+    assert len(calls) == 1
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+async def test_eventbus_indexed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test a match key cannot be combined with MATCH_ALL."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(
+            MATCH_ALL, lambda event: None, match_key=("entity_id", "light.kitchen")
+        )
+
+
 async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     """Test we can call events immediately."""
     calls = []
@@ -1115,6 +1172,143 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one pass."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.desk", "off")
+    old_bowl = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batch_events = async_capture_events(hass, EVENT_STATE_CHANGED_BATCH)
+    all_events = async_capture_events(hass, MATCH_ALL)
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 200}),
+            ("light.desk", "off", None),
+            ("light.new", "on", None),
+            ("light.new", "off", None),
+        ],
+        fire_batch_event=True,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.new",
+        "light.new",
+    ]
+    bowl = hass.states.get("light.bowl")
+    assert bowl.attributes == {"brightness": 200}
+    assert bowl.last_changed == old_bowl.last_changed
+    assert events[0].data["old_state"] is old_bowl
+    assert events[1].data["old_state"] is None
+    assert events[2].data["old_state"] is events[1].data["new_state"]
+    assert hass.states.get("light.new").state == "off"
+    assert len({event.context.id for event in events}) == 1
+
+    assert len(batch_events) == 1
+    assert [change["new_state"] for change in batch_events[0].data["changes"]] == [
+        event.data["new_state"] for event in events
+    ]
+    assert all(event.event_type != EVENT_STATE_CHANGED_BATCH for event in all_events)
+
+    hass.states.async_set_many([("light.desk", "off", None)], fire_batch_event=True)
+    await hass.async_block_till_done()
+    assert len(events) == 3
+    assert len(batch_events) == 1
+
+
+async def test_statemachine_set_many_invalid_entity_id(hass: HomeAssistant) -> None:
+    """Test no state is stored if any state in the batch is invalid."""
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.valid", "on", None), ("invalid_entity", "on", None)]
+        )
+    assert hass.states.get("light.valid") is None
+
+
+async def test_statemachine_shares_unchanged_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test unchanged attributes are shared between consecutive states."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    old_state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    new_state = hass.states.get("light.bowl")
+    assert new_state.attributes is old_state.attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes is not new_state.attributes
+    assert hass.states.get("light.bowl").attributes == {"brightness": 50}
+
+
+def test_state_uses_slots() -> None:
+    """Test State does not carry an instance dict."""
+    state = ha.State("light.bowl", "on", {"brightness": 100})
+    assert not hasattr(state, "__dict__")
+    assert state.as_dict_json is state.as_dict_json
+    assert state.as_compressed_state is state.as_compressed_state
+    assert state.as_compressed_state_json is state.as_compressed_state_json
+
+
+async def test_job_profiler(hass: HomeAssistant) -> None:
+    """Test the job profiler records listeners, jobs and services."""
+    assert hass.job_profiler is None
+    profiler = hass.job_profiler = ha.JobProfiler(hass)
+
+    @ha.callback
+    def immediate_listener(event):
+        """Handle an event."""
+        hass.async_run_hass_job(HassJob(tracked_job), event)
+
+    @ha.callback
+    def tracked_job(event):
+        """Handle a job from a listener."""
+
+    async def coro_listener(event):
+        """Handle an event."""
+        await asyncio.sleep(0)
+
+    def executor_listener(event):
+        """Handle an event."""
+
+    async def service_handler(call):
+        """Handle a service call."""
+
+    hass.bus.async_listen("test_event", immediate_listener, run_immediately=True)
+    hass.bus.async_listen("test_event", coro_listener)
+    hass.bus.async_listen("test_event", executor_listener)
+    hass.services.async_register("test_domain", "test_service", service_handler)
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event")
+    await hass.services.async_call("test_domain", "test_service", blocking=True)
+    await hass.async_block_till_done()
+
+    stats = profiler.async_as_dict()
+    listener_counts = {
+        name.rsplit(".", 1)[-1]: listener_stats["count"]
+        for name, listener_stats in stats["listener"].items()
+        if name.startswith("test_event ")
+    }
+    assert listener_counts == {
+        "immediate_listener": 2,
+        "coro_listener": 2,
+        "executor_listener": 2,
+    }
+    assert any(name.endswith(".tracked_job") for name in stats["job"])
+    service_stats = stats["service"]["test_domain.test_service"]
+    assert service_stats["count"] == 1
+    assert sum(service_stats["histogram"]) == 1
+    assert service_stats["max"] == service_stats["total"]
+
+    hass.job_profiler = None
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert profiler.async_as_dict() == stats
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1428,6 +1622,92 @@ async def test_serviceregistry_return_response_optional(
     assert response_data == expected_response_data
 
 
+def _async_register_validated_service(
+    hass: HomeAssistant,
+    schema: Callable[[dict[str, Any]], dict[str, Any]],
+    cache_validation: bool,
+) -> list[ServiceCall]:
+    """Register a service with a schema and return the calls log list."""
+    calls: list[ServiceCall] = []
+    hass.services.async_register(
+        "test_domain",
+        "test_service",
+        calls.append,
+        schema,
+        cache_validation=cache_validation,
+    )
+    return calls
+
+
+async def test_serviceregistry_validation_cache(hass: HomeAssistant) -> None:
+    """Test validated service data is reused for the same plain data."""
+    validated = []
+
+    def _validate(data: dict[str, Any]) -> dict[str, Any]:
+        validated.append(data)
+        return {**data, "items": list(data.get("items", []))}
+
+    calls = _async_register_validated_service(hass, _validate, True)
+
+    for _ in range(2):
+        await hass.services.async_call(
+            "test_domain", "test_service", {"items": [1, 2]}, blocking=True
+        )
+    assert len(validated) == 1
+    assert calls[0].data == calls[1].data == {"items": [1, 2]}
+    # Every call gets its own copy of the cached data
+    assert calls[0].data["items"] is not calls[1].data["items"]
+
+    # Equal values of different types are validated separately
+    await hass.services.async_call(
+        "test_domain", "test_service", {"items": [1.0, 2]}, blocking=True
+    )
+    assert len(validated) == 2
+
+    # Data that is not plain data is validated every time
+    for _ in range(2):
+        await hass.services.async_call(
+            "test_domain", "test_service", {"items": [object()]}, blocking=True
+        )
+    assert len(validated) == 4
+
+
+async def test_serviceregistry_validation_not_cached_by_default(
+    hass: HomeAssistant,
+) -> None:
+    """Test schemas of services are run on every call unless cached."""
+    counter = iter(range(10))
+
+    def _validate(data: dict[str, Any]) -> dict[str, Any]:
+        # Like a default computed at call time
+        return {**data, "name": f"backup {next(counter)}"}
+
+    calls = _async_register_validated_service(hass, _validate, False)
+    for _ in range(2):
+        await hass.services.async_call(
+            "test_domain", "test_service", {"items": [1, 2]}, blocking=True
+        )
+    assert [call.data["name"] for call in calls] == ["backup 0", "backup 1"]
+
+
+async def test_serviceregistry_validation_cache_skips_mutable_results(
+    hass: HomeAssistant,
+) -> None:
+    """Test validated data that cannot be copied safely is not cached."""
+    validated = []
+
+    def _validate(data: dict[str, Any]) -> dict[str, Any]:
+        validated.append(data)
+        return {"values": {1, 2}}
+
+    _async_register_validated_service(hass, _validate, True)
+    for _ in range(2):
+        await hass.services.async_call(
+            "test_domain", "test_service", {"values": [1, 2]}, blocking=True
+        )
+    assert len(validated) == 2
+
+
 async def test_config_defaults() -> None:
     """Test config defaults."""
     hass = Mock()